@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark request throughput against a local stand-in API server.
+
+Starts a minimal keep-alive HTTP/1.1 server on localhost that answers every
+request with a small stream URL payload, then measures requests per second
+through ``CameraStreamingClient.get_stream_url`` for an increasing number of
+concurrent callers. Each pool configuration is run against the same server.
+
+HTTP/2 needs TLS or prior-knowledge h2c support on the server, so it is not
+exercised here.
+
+Usage:
+    python benchmarks/connection_pool_throughput.py [--requests 5000]
+"""
+
+import argparse
+import asyncio
+import time
+
+from camera_streaming import CameraStreamingClient
+
+BODY = b'{"success": true, "data": {"streamUrl": "https://cdn.example.com/hls/camera/index.m3u8"}}'
+RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Content-Length: " + str(len(BODY)).encode() + b"\r\n"
+    b"Connection: keep-alive\r\n"
+    b"\r\n" + BODY
+)
+
+CONCURRENCY_LEVELS = (1, 10, 50, 100, 250, 500)
+
+POOL_CONFIGS = {
+    "default": {},
+    "tuned": {"max_connections": 200, "max_keepalive_connections": 200, "keepalive_expiry": 30.0},
+}
+
+
+async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while True:
+            headers = await reader.readuntil(b"\r\n\r\n")
+            for line in headers.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    await reader.readexactly(int(line.split(b":", 1)[1]))
+            writer.write(RESPONSE)
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+async def run(base_url: str, options: dict, concurrency: int, requests: int) -> float:
+    async with CameraStreamingClient(base_url, api_key="bench", **options) as client:
+        per_caller = max(1, requests // concurrency)
+
+        async def caller() -> None:
+            for _ in range(per_caller):
+                await client.get_stream_url("camera")
+
+        await caller()  # warm up one connection
+        started = time.perf_counter()
+        await asyncio.gather(*(caller() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return per_caller * concurrency / elapsed
+
+
+async def main(requests: int) -> None:
+    server = await asyncio.start_server(handle_connection, "127.0.0.1", 0, backlog=1024)
+    port = server.sockets[0].getsockname()[1]
+    base_url = f"http://127.0.0.1:{port}"
+
+    print(f"{'callers':>8} " + " ".join(f"{name + ' (req/s)':>16}" for name in POOL_CONFIGS))
+    async with server:
+        for concurrency in CONCURRENCY_LEVELS:
+            results = [await run(base_url, options, concurrency, requests) for options in POOL_CONFIGS.values()]
+            print(f"{concurrency:>8} " + " ".join(f"{rps:>16.0f}" for rps in results))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
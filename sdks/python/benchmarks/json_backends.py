@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark the JSON backends on SDK-shaped payloads.
+
+Measures encode and decode throughput of every installed backend for a
+camera list response and for a stream of small WebSocket events
+(``cameraStatusUpdate`` messages decoded from text frames).
+
+Usage:
+    python benchmarks/json_backends.py [--cameras 1000] [--events 20000] [--repeat 5]
+"""
+
+import argparse
+import time
+from typing import Any, Callable, List
+
+from camera_streaming.serialization import JSON_BACKENDS, JSONBackend
+
+
+def make_camera_list(count: int) -> dict:
+    items = [
+        {
+            "id": f"cam-{i}",
+            "name": f"Camera {i}",
+            "company": "Acme",
+            "model": "X100",
+            "serialNumber": f"SN-{i:06d}",
+            "location": "HQ",
+            "place": "Entrance",
+            "rtmpUrl": f"rtmp://10.0.{i // 256}.{i % 256}/live/cam-{i}",
+            "isActive": True,
+            "isRecording": i % 2 == 0,
+            "streamStatus": "online",
+            "createdAt": "2024-01-01T00:00:00Z",
+            "updatedAt": "2024-01-01T00:00:00Z",
+        }
+        for i in range(count)
+    ]
+    return {"success": True, "data": {"items": items, "total": count, "limit": count, "offset": 0}}
+
+
+def make_events(count: int) -> List[dict]:
+    return [
+        {
+            "type": "cameraStatusUpdate",
+            "data": {
+                "cameraId": f"cam-{i % 500}",
+                "status": "online" if i % 3 else "offline",
+                "timestamp": "2024-01-01T00:00:00Z",
+            },
+        }
+        for i in range(count)
+    ]
+
+
+def best_of(repeat: int, func: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def bench(backend: JSONBackend, cameras: dict, events: List[dict], repeat: int) -> dict:
+    body = backend.dumps(cameras)
+    frames = [backend.dumps_text(event) for event in events]
+
+    return {
+        "list_encode_ms": best_of(repeat, lambda: backend.dumps(cameras)) * 1000,
+        "list_decode_ms": best_of(repeat, lambda: backend.loads(body)) * 1000,
+        "events_encode_per_s": len(events) / best_of(repeat, lambda: [backend.dumps_text(e) for e in events]),
+        "events_decode_per_s": len(frames) / best_of(repeat, lambda: [backend.loads(f) for f in frames]),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cameras", type=int, default=1000)
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    cameras = make_camera_list(args.cameras)
+    events = make_events(args.events)
+
+    print(
+        f"{'backend':<9} {'list enc (ms)':>14} {'list dec (ms)':>14} "
+        f"{'events enc/s':>13} {'events dec/s':>13}"
+    )
+    for name, backend_class in JSON_BACKENDS.items():
+        try:
+            backend = backend_class()
+        except ImportError:
+            print(f"{name:<9} not installed")
+            continue
+        result = bench(backend, cameras, events, args.repeat)
+        print(
+            f"{name:<9} {result['list_encode_ms']:>14.2f} {result['list_decode_ms']:>14.2f} "
+            f"{result['events_encode_per_s']:>13,.0f} {result['events_decode_per_s']:>13,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark parsing throughput of a large recordings page.
+
+Compares the previous parsing path (``json.loads`` into a dict, an untyped
+``PaginatedResponse`` and one ``Recording(**item)`` call per row) against
+validating the whole response body in one pass with ``RecordingPage``, and
+against the raw and lazy listing modes. Every parser reads two fields per
+row, like a typical analytics export; memory is what the parsed rows retain.
+
+Usage:
+    python benchmarks/model_parsing_throughput.py [--rows 5000] [--repeat 5]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, List, Tuple
+
+from camera_streaming.lazy import RawPage, lazy_page
+from camera_streaming.models import PaginatedResponse, Recording, RecordingPage
+
+
+def make_body(rows: int) -> bytes:
+    camera = {
+        "id": "cam-1",
+        "name": "Lobby",
+        "company": "Acme",
+        "model": "X100",
+        "serialNumber": "SN-1",
+        "location": "HQ",
+        "place": "Entrance",
+        "rtmpUrl": "rtmp://10.0.0.1/live/cam-1",
+        "isActive": True,
+        "isRecording": True,
+        "streamStatus": "online",
+        "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": "2024-01-01T00:00:00Z",
+    }
+    items = [
+        {
+            "id": f"rec-{i}",
+            "camera": camera,
+            "filename": f"rec-{i}.mp4",
+            "filePath": f"/recordings/rec-{i}.mp4",
+            "fileSize": 1048576 + i,
+            "duration": 600,
+            "startTime": "2024-01-01T00:00:00Z",
+            "endTime": "2024-01-01T00:10:00Z",
+            "storageTier": "hot",
+            "isEncrypted": False,
+            "createdAt": "2024-01-01T00:10:00Z",
+            "updatedAt": "2024-01-01T00:10:00Z",
+        }
+        for i in range(rows)
+    ]
+    body = {"success": True, "data": {"items": items, "total": rows, "limit": rows, "offset": 0}}
+    return json.dumps(body).encode()
+
+
+def parse_dicts(body: bytes) -> List[Recording]:
+    page = PaginatedResponse(**json.loads(body))
+    return [Recording(**item) for item in page.data["items"]]
+
+
+def parse_one_pass(body: bytes) -> List[Recording]:
+    return RecordingPage.model_validate_json(body).items
+
+
+def parse_raw(body: bytes) -> List[Any]:
+    return RawPage.model_validate_json(body).items
+
+
+def parse_lazy(body: bytes) -> List[Any]:
+    return lazy_page(Recording).model_validate_json(body).items
+
+
+def read_fields(rows: List[Any]) -> int:
+    if rows and isinstance(rows[0], dict):
+        return sum(row["fileSize"] + row["duration"] for row in rows)
+    return sum(row.file_size + row.duration for row in rows)
+
+
+def measure(parse: Callable[[bytes], List[Any]], body: bytes, repeat: int) -> Tuple[float, int]:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        read_fields(parse(body))
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    rows = parse(body)
+    read_fields(rows)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    body = make_body(args.rows)
+    parsers = {"dicts": parse_dicts, "one-pass": parse_one_pass, "raw": parse_raw, "lazy": parse_lazy}
+    assert len({read_fields(parse(body)) for parse in parsers.values()}) == 1
+
+    print(f"{'parser':<10} {'best (ms)':>10} {'rows/s':>12} {'bytes/row':>10}")
+    for name, parse in parsers.items():
+        elapsed, retained = measure(parse, body, args.repeat)
+        print(f"{name:<10} {elapsed * 1000:>10.1f} {args.rows / elapsed:>12,.0f} {retained // args.rows:>10,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark event-loop lag while many requests are backing off.
+
+Every request first receives a 503 and succeeds on a later attempt. A ticker
+task measures how late the event loop wakes it up while the retries are in
+flight. With the asyncio-based retry policy the lag stays flat regardless of
+how many requests are retrying; the blocking policy reproduces the old
+``time.sleep`` behaviour for comparison.
+
+Usage:
+    python benchmarks/retry_event_loop_lag.py [--requests 200] [--failures 2]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import defaultdict
+
+import httpx
+
+from camera_streaming import CameraStreamingClient
+from camera_streaming.retry import RetryPolicy
+
+
+class BlockingRetryPolicy(RetryPolicy):
+    """Retry policy that blocks the event loop while waiting (old behaviour)."""
+
+    async def sleep(self, delay: float) -> None:
+        time.sleep(delay)
+
+
+def make_transport(failures: int) -> httpx.MockTransport:
+    attempts = defaultdict(int)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        camera_id = request.url.path.rsplit("/", 1)[-1]
+        attempts[camera_id] += 1
+        if attempts[camera_id] <= failures:
+            return httpx.Response(503, json={"message": "Service unavailable"})
+        return httpx.Response(200, json={"success": True, "data": {"streamUrl": f"/hls/{camera_id}.m3u8"}})
+
+    return httpx.MockTransport(handler)
+
+
+async def measure_lag(stop: asyncio.Event, interval: float, samples: list) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        samples.append(max(0.0, loop.time() - expected) * 1000)
+
+
+async def run(policy: RetryPolicy, requests: int, failures: int) -> dict:
+    client = CameraStreamingClient(
+        "http://bench.local",
+        api_key="bench",
+        retry_policy=policy,
+        transport=make_transport(failures),
+    )
+
+    samples: list = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(measure_lag(stop, 0.005, samples))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client.get_stream_url(f"cam-{i}") for i in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await ticker
+    await client.close()
+
+    samples.sort()
+    return {
+        "elapsed_s": elapsed,
+        "lag_p50_ms": statistics.median(samples) if samples else 0.0,
+        "lag_p99_ms": samples[int(len(samples) * 0.99) - 1] if samples else 0.0,
+        "lag_max_ms": samples[-1] if samples else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--failures", type=int, default=2)
+    parser.add_argument("--backoff", type=float, default=0.01)
+    args = parser.parse_args()
+
+    policies = {
+        "asyncio": RetryPolicy(max_retries=args.failures, backoff_base=args.backoff),
+        "blocking": BlockingRetryPolicy(max_retries=args.failures, backoff_base=args.backoff),
+    }
+
+    print(f"{'policy':<10} {'elapsed (s)':>12} {'lag p50 (ms)':>13} {'lag p99 (ms)':>13} {'lag max (ms)':>13}")
+    for name, policy in policies.items():
+        result = asyncio.run(run(policy, args.requests, args.failures))
+        print(
+            f"{name:<10} {result['elapsed_s']:>12.3f} {result['lag_p50_ms']:>13.2f} "
+            f"{result['lag_p99_ms']:>13.2f} {result['lag_max_ms']:>13.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
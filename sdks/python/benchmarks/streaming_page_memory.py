@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark peak memory of reading one large recordings page.
+
+``get_recordings`` buffers the whole body, decodes it and builds every model
+before returning; ``stream_recordings`` decodes ``data.items`` from the body
+stream and yields one recording at a time. The mock server streams the body
+in small chunks without ever materializing it, so the numbers reflect the
+client only.
+
+Usage:
+    python benchmarks/streaming_page_memory.py [--rows 20000]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+from typing import AsyncIterator, Iterator
+
+import httpx
+
+from camera_streaming import CameraStreamingClient
+from camera_streaming.models import RecordingFilters
+
+CAMERA = {
+    "id": "cam-1",
+    "name": "Lobby",
+    "company": "Acme",
+    "model": "X100",
+    "serialNumber": "SN-1",
+    "location": "HQ",
+    "place": "Entrance",
+    "rtmpUrl": "rtmp://10.0.0.1/live/cam-1",
+    "isActive": True,
+    "isRecording": True,
+    "streamStatus": "online",
+    "createdAt": "2024-01-01T00:00:00Z",
+    "updatedAt": "2024-01-01T00:00:00Z",
+}
+
+
+def body_chunks(rows: int) -> Iterator[bytes]:
+    yield b'{"success": true, "data": {"items": ['
+    for i in range(rows):
+        item = {
+            "id": f"rec-{i}",
+            "camera": CAMERA,
+            "filename": f"rec-{i}.mp4",
+            "filePath": f"/recordings/rec-{i}.mp4",
+            "fileSize": 1048576 + i,
+            "duration": 600,
+            "startTime": "2024-01-01T00:00:00Z",
+            "endTime": "2024-01-01T00:10:00Z",
+            "storageTier": "hot",
+            "isEncrypted": False,
+            "createdAt": "2024-01-01T00:10:00Z",
+            "updatedAt": "2024-01-01T00:10:00Z",
+        }
+        yield (b"," if i else b"") + json.dumps(item).encode()
+    yield b'], "total": %d}}' % rows
+
+
+class StreamedBody(httpx.AsyncByteStream):
+    def __init__(self, rows: int):
+        self.rows = rows
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in body_chunks(self.rows):
+            yield chunk
+
+
+async def run(mode: str, rows: int) -> dict:
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, stream=StreamedBody(rows)))
+    client = CameraStreamingClient("http://bench.local", api_key="bench", transport=transport)
+    filters = RecordingFilters(limit=rows)
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    total = 0
+    if mode == "get_recordings":
+        for recording in await client.get_recordings(filters):
+            total += recording.file_size
+    else:
+        async for recording in client.stream_recordings(filters):
+            total += recording.file_size
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    await client.close()
+    return {"elapsed_s": elapsed, "peak_mb": peak / 1e6}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'method':<18} {'elapsed (s)':>12} {'peak (MB)':>10}")
+    for mode in ("get_recordings", "stream_recordings"):
+        result = asyncio.run(run(mode, args.rows))
+        print(f"{mode:<18} {result['elapsed_s']:>12.3f} {result['peak_mb']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Measure bytes per event for WebSocket compression and frame formats.
+
+A local websockets server sends ``--events`` dashboard and camera status
+events. It negotiates permessage-deflate and the MessagePack subprotocol
+when the client offers them. The client reports payload and wire bytes per
+event through ``WebSocketClient.transport_stats()`` for every combination
+of compression and frame format.
+
+Usage:
+    python benchmarks/websocket_bandwidth.py [--events 20000] [--cameras 500]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Dict, List
+
+import websockets
+
+from camera_streaming import WebSocketClient
+from camera_streaming.serialization import MessagePackCodec, StdlibJSONBackend
+
+MSGPACK = "camera-streaming.msgpack"
+
+
+def make_events(count: int, cameras: int) -> List[Dict[str, Any]]:
+    events = []
+    for i in range(count):
+        if i % 10 == 0:
+            events.append({
+                "type": "dashboardUpdate",
+                "data": {
+                    "stats": {
+                        "totalCameras": cameras,
+                        "activeCameras": cameras - i % 7,
+                        "onlineCameras": cameras - i % 11,
+                        "recordingCameras": cameras // 2,
+                        "totalRecordings": 100000 + i,
+                        "totalStorage": 5_000_000_000_000 + i * 1024,
+                    },
+                    "timestamp": "2024-01-01T00:00:00Z",
+                },
+                "timestamp": "2024-01-01T00:00:00Z",
+            })
+        else:
+            events.append({
+                "type": "cameraStatusUpdate",
+                "data": {
+                    "cameraId": f"cam-{i % cameras:05d}",
+                    "status": "online" if i % 3 else "offline",
+                    "timestamp": "2024-01-01T00:00:00Z",
+                },
+                "timestamp": "2024-01-01T00:00:00Z",
+            })
+    return events
+
+
+async def serve_events(events: List[Dict[str, Any]]):
+    text_frames = [StdlibJSONBackend().dumps_text(event) for event in events]
+    try:
+        codec = MessagePackCodec()
+        binary_frames = [codec.dumps(event) for event in events]
+    except ImportError:
+        binary_frames = None
+
+    async def handler(connection):
+        frames = binary_frames if connection.subprotocol == MSGPACK else text_frames
+        async for _ in connection:
+            for frame in frames:
+                await connection.send(frame)
+            await connection.send(text_frames[0].replace("dashboardUpdate", "benchmarkDone", 1))
+
+    def select_subprotocol(connection, subprotocols):
+        # Clients that do not offer MessagePack get JSON text frames
+        if binary_frames is not None and MSGPACK in subprotocols:
+            return MSGPACK
+        return None
+
+    return await websockets.serve(handler, "127.0.0.1", 0, select_subprotocol=select_subprotocol)
+
+
+async def run_case(url: str, **options: Any) -> Dict[str, Any]:
+    client = WebSocketClient(url, "benchmark-token", reconnect=False, **options)
+    done = asyncio.Event()
+
+    async def on_done(data):
+        done.set()
+
+    client.on("benchmarkDone", on_done, raw=True)
+    await client.connect()
+    started = time.perf_counter()
+    await client.subscribe_to_camera_updates()
+    await done.wait()
+    elapsed = time.perf_counter() - started
+
+    stats = client.transport_stats()
+    stats["seconds"] = elapsed
+    await client.disconnect()
+    return stats
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--cameras", type=int, default=500)
+    args = parser.parse_args()
+
+    server = await serve_events(make_events(args.events, args.cameras))
+    url = f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+
+    cases = {
+        "json": {"compression": None},
+        "json+deflate": {},
+        "json+deflate(9, 10 bits)": {"compression_level": 9, "compression_window_bits": 10},
+        "msgpack": {"compression": None, "binary_formats": ["msgpack"]},
+        "msgpack+deflate": {"binary_formats": ["msgpack"]},
+    }
+
+    print(f"{'case':<26} {'format':>8} {'payload B/event':>16} {'wire B/event':>13} {'events/s':>10}")
+    for name, options in cases.items():
+        try:
+            stats = await run_case(url, **options)
+        except ImportError as e:
+            print(f"{name:<26} skipped: {e}")
+            continue
+        print(
+            f"{name:<26} {stats['format']:>8} {stats['payload_bytes_per_event']:>16.1f} "
+            f"{stats['wire_bytes_per_event']:>13.1f} {stats['messages_received'] / stats['seconds']:>10,.0f}"
+        )
+
+    server.close()
+    await server.wait_closed()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
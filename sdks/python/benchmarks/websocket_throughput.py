@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Measure WebSocketClient event throughput against a local websockets server.
+
+The server answers the first subscribe frame by sending ``--events``
+``cameraStatusUpdate`` messages as fast as it can. The client is measured
+with no handlers (messages are decoded but never parsed), a raw-dict
+handler, a typed handler (one pydantic model per message) and an event
+stream filtered to 1% of the cameras.
+
+Usage:
+    python benchmarks/websocket_throughput.py [--events 50000] [--cameras 500] [--repeat 3]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import List
+
+import websockets
+
+from camera_streaming import WebSocketClient
+
+DONE = json.dumps({"type": "benchmarkDone", "data": {}})
+
+
+def make_frames(count: int, cameras: int) -> List[str]:
+    return [
+        json.dumps({
+            "type": "cameraStatusUpdate",
+            "data": {
+                "cameraId": f"cam-{i % cameras}",
+                "status": "online" if i % 3 else "offline",
+                "timestamp": "2024-01-01T00:00:00Z",
+            },
+            "timestamp": "2024-01-01T00:00:00Z",
+        })
+        for i in range(count)
+    ]
+
+
+async def serve_events(frames: List[str]):
+    async def handler(connection):
+        async for _ in connection:
+            for frame in frames:
+                await connection.send(frame)
+            await connection.send(DONE)
+
+    return await websockets.serve(handler, "127.0.0.1", 0)
+
+
+async def run_mode(url: str, mode: str, cameras: int) -> float:
+    client = WebSocketClient(url, "benchmark-token", reconnect=False)
+    done = asyncio.Event()
+
+    async def on_done(data):
+        done.set()
+
+    handled = 0
+
+    async def on_update(update):
+        nonlocal handled
+        handled += 1
+
+    async def consume(stream):
+        async for _ in stream:
+            pass
+
+    client.on("benchmarkDone", on_done, raw=True)
+    consumer = None
+    if mode == "raw handler":
+        client.on("cameraStatusUpdate", on_update, raw=True)
+    elif mode == "typed handler":
+        client.on("cameraStatusUpdate", on_update)
+    elif mode == "filtered stream":
+        watched = [f"cam-{i}" for i in range(0, cameras, 100)]
+        consumer = asyncio.ensure_future(consume(client.events("cameraStatusUpdate", camera_ids=watched)))
+
+    await client.connect()
+    started = time.perf_counter()
+    await client.subscribe_to_camera_updates()
+    await done.wait()
+    await client.drain()
+    elapsed = time.perf_counter() - started
+
+    await client.disconnect()
+    if consumer is not None:
+        await consumer
+    return elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=50000)
+    parser.add_argument("--cameras", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    server = await serve_events(make_frames(args.events, args.cameras))
+    port = server.sockets[0].getsockname()[1]
+    url = f"ws://127.0.0.1:{port}"
+
+    print(f"{'mode':<16} {'events/s':>12} {'us/event':>10}")
+    for mode in ("no handlers", "raw handler", "typed handler", "filtered stream"):
+        best = min([await run_mode(url, mode, args.cameras) for _ in range(args.repeat)])
+        print(f"{mode:<16} {args.events / best:>12,.0f} {best / args.events * 1e6:>10.1f}")
+
+    server.close()
+    await server.wait_closed()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
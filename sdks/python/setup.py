@@ -55,6 +55,24 @@ setup(
         "websocket": [
             "websockets>=11.0.0",
         ],
+        "http2": [
+            "httpx[http2]>=0.24.0",
+        ],
+        "numpy": [
+            "numpy>=1.21.0",
+        ],
+        "orjson": [
+            "orjson>=3.9.0",
+        ],
+        "msgspec": [
+            "msgspec>=0.18.0",
+        ],
+        "msgpack": [
+            "msgpack>=1.0.0",
+        ],
+        "cbor": [
+            "cbor2>=5.4.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -5,7 +5,10 @@ Official Python SDK for the Camera Streaming Platform API.
 """
 
 from .client import CameraStreamingClient
+from .sync_client import SyncCameraStreamingClient
 from .websocket_client import WebSocketClient
+from .pool import WebSocketPool
+from .registry import CameraRegistry
 from .models import (
     Camera,
     Recording,
@@ -34,7 +37,10 @@ __email__ = "support@camera-streaming.example.com"
 
 __all__ = [
     "CameraStreamingClient",
+    "SyncCameraStreamingClient",
     "WebSocketClient",
+    "WebSocketPool",
+    "CameraRegistry",
     "Camera",
     "Recording",
     "User",
@@ -0,0 +1,258 @@
+"""
+Bulk operation helpers for the Camera Streaming Platform SDK.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from .exceptions import RateLimitError
+
+# Set while a bulk runner executes an operation: the runner paces rate-limited
+# requests itself, so the clients raise 429s instead of retrying them
+_bulk_operation: ContextVar[bool] = ContextVar("camera_streaming_bulk_operation", default=False)
+
+
+def in_bulk_operation() -> bool:
+    """Check whether the current request is made by a bulk runner."""
+    return _bulk_operation.get()
+
+
+class BulkResult:
+    """
+    Per-ID outcome of a bulk operation.
+
+    Successful IDs map to the operation's return value in ``results``, failed
+    IDs map to the raised exception in ``errors``.
+    """
+
+    def __init__(self):
+        self.results: Dict[str, Any] = {}
+        self.errors: Dict[str, Exception] = {}
+
+    @property
+    def succeeded(self) -> List[str]:
+        """Get the IDs that succeeded."""
+        return list(self.results)
+
+    @property
+    def failed(self) -> List[str]:
+        """Get the IDs that failed."""
+        return list(self.errors)
+
+    @property
+    def ok(self) -> bool:
+        """Check whether every ID succeeded."""
+        return not self.errors
+
+    def __len__(self) -> int:
+        return len(self.results) + len(self.errors)
+
+    def __repr__(self) -> str:
+        return f"BulkResult(succeeded={len(self.results)}, failed={len(self.errors)})"
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Concurrency limit that backs off when the server rate-limits us.
+
+    The limit is halved and new work is paused on every rate-limit response
+    (for ``Retry-After`` when given), then grows back by one after each run
+    of successes as large as the current limit.
+    """
+
+    def __init__(self, max_concurrency: int, min_concurrency: int = 1, backoff: float = 1.0):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_concurrency: Upper bound for operations in flight
+            min_concurrency: Lower bound the limit is never reduced below
+            backoff: Pause in seconds after a rate limit without Retry-After
+        """
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = max(1, min(min_concurrency, max_concurrency))
+        self.backoff = backoff
+        self.limit = max_concurrency
+
+        self._active = 0
+        self._successes = 0
+        self._resume_at = 0.0
+        self._released: Optional[asyncio.Event] = None
+
+    async def acquire(self) -> None:
+        """Wait until an operation may start."""
+        if self._released is None:
+            self._released = asyncio.Event()
+
+        while True:
+            delay = self._resume_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            if self._active < self.limit:
+                self._active += 1
+                return
+            self._released.clear()
+            await self._released.wait()
+
+    def release(self, error: Optional[Exception] = None) -> None:
+        """
+        Mark an operation as finished and adapt the limit.
+
+        Args:
+            error: Exception raised by the operation, if any
+        """
+        self._active -= 1
+
+        if isinstance(error, RateLimitError):
+            self.limit = max(self.min_concurrency, self.limit // 2)
+            self._successes = 0
+            pause = error.retry_after if error.retry_after is not None else self.backoff
+            self._resume_at = max(self._resume_at, time.monotonic() + pause)
+        elif error is None:
+            self._successes += 1
+            if self._successes >= self.limit and self.limit < self.max_concurrency:
+                self.limit += 1
+                self._successes = 0
+
+        if self._released is not None:
+            self._released.set()
+
+
+async def run_bulk(
+    ids: Iterable[str],
+    operation: Callable[[str], Awaitable[Any]],
+    concurrency: int = 10,
+    max_rate_limit_retries: int = 3,
+) -> BulkResult:
+    """
+    Run an operation for many IDs with bounded, adaptive concurrency.
+
+    Errors are collected per ID instead of aborting the batch. Client
+    requests made by ``operation`` raise on 429 instead of retrying, so the
+    limiter sees every rate limit at once and owns the backoff. IDs that are
+    rate-limited are slowed down and retried up to ``max_rate_limit_retries``
+    times before their RateLimitError is recorded.
+
+    Args:
+        ids: IDs to run the operation for (duplicates are ignored)
+        operation: Coroutine function called with each ID
+        concurrency: Maximum number of operations in flight
+        max_rate_limit_retries: Retries per ID after a RateLimitError
+
+    Returns:
+        BulkResult with the per-ID results and errors
+    """
+    result = BulkResult()
+    queue = deque(dict.fromkeys(ids))
+    if not queue:
+        return result
+
+    limiter = AdaptiveConcurrencyLimiter(concurrency)
+    rate_limited: Dict[str, int] = {}
+
+    async def worker() -> None:
+        # Each worker runs in its own task, so this only affects its operations
+        _bulk_operation.set(True)
+        while queue:
+            item_id = queue.popleft()
+            await limiter.acquire()
+            try:
+                value = await operation(item_id)
+            except Exception as e:
+                limiter.release(e)
+                if isinstance(e, RateLimitError) and rate_limited.get(item_id, 0) < max_rate_limit_retries:
+                    rate_limited[item_id] = rate_limited.get(item_id, 0) + 1
+                    queue.append(item_id)
+                else:
+                    result.errors[item_id] = e
+            else:
+                limiter.release()
+                result.results[item_id] = value
+
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, len(queue)))))
+    return result
+
+
+def run_bulk_sync(
+    ids: Iterable[str],
+    operation: Callable[[str], Any],
+    concurrency: int = 10,
+    max_rate_limit_retries: int = 3,
+    backoff: float = 1.0,
+) -> BulkResult:
+    """
+    Run an operation for many IDs on a bounded pool of worker threads.
+
+    Synchronous counterpart of :func:`run_bulk`. Client requests raise on
+    429 instead of retrying, and a RateLimitError pauses all workers (for
+    ``Retry-After`` when given) before the ID is retried.
+
+    Args:
+        ids: IDs to run the operation for (duplicates are ignored)
+        operation: Function called with each ID
+        concurrency: Maximum number of operations in flight
+        max_rate_limit_retries: Retries per ID after a RateLimitError
+        backoff: Pause in seconds after a rate limit without Retry-After
+
+    Returns:
+        BulkResult with the per-ID results and errors
+    """
+    if concurrency <= 0:
+        raise ValueError("concurrency must be positive")
+
+    result = BulkResult()
+    queue = deque(dict.fromkeys(ids))
+    if not queue:
+        return result
+
+    lock = threading.Lock()
+    rate_limited: Dict[str, int] = {}
+    resume_at = 0.0
+
+    def worker() -> None:
+        token = _bulk_operation.set(True)
+        try:
+            work()
+        finally:
+            _bulk_operation.reset(token)
+
+    def work() -> None:
+        nonlocal resume_at
+        while True:
+            with lock:
+                if not queue:
+                    return
+                item_id = queue.popleft()
+                delay = resume_at - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+            try:
+                value = operation(item_id)
+            except Exception as e:
+                with lock:
+                    if isinstance(e, RateLimitError) and rate_limited.get(item_id, 0) < max_rate_limit_retries:
+                        rate_limited[item_id] = rate_limited.get(item_id, 0) + 1
+                        pause = e.retry_after if e.retry_after is not None else backoff
+                        resume_at = max(resume_at, time.monotonic() + pause)
+                        queue.append(item_id)
+                    else:
+                        result.errors[item_id] = e
+            else:
+                with lock:
+                    result.results[item_id] = value
+
+    workers = min(concurrency, len(queue))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for future in [executor.submit(worker) for _ in range(workers)]:
+            future.result()
+    return result
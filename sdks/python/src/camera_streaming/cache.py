@@ -0,0 +1,177 @@
+"""
+Client-side response cache for the Camera Streaming Platform SDK.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+CacheKey = Tuple[str, Tuple[Tuple[str, Any], ...], str]
+
+
+class CacheEntry:
+    """Cached parsed response together with its validator."""
+
+    __slots__ = ("value", "etag", "expires_at")
+
+    def __init__(self, value: Any, etag: Optional[str], expires_at: float):
+        self.value = value
+        self.etag = etag
+        self.expires_at = expires_at
+
+    def is_fresh(self) -> bool:
+        """Check whether the entry can be served without revalidation."""
+        return time.monotonic() < self.expires_at
+
+
+class ResponseCache:
+    """
+    Bounded LRU cache for parsed responses of read endpoints.
+
+    The cache is safe to share between threads.
+
+    Each cacheable endpoint has its own TTL; endpoints with a TTL of zero or
+    without a configured TTL are never cached. Stale entries that carry an
+    ETag are revalidated with ``If-None-Match`` instead of being refetched.
+
+    Example:
+        >>> cache = ResponseCache(ttls={"camera": 10.0}, max_size=5000)
+        >>> client = CameraStreamingClient("https://api.example.com", cache=cache)
+        >>> cache.stats()
+        {'hits': 0, 'misses': 0, 'revalidations': 0, 'evictions': 0, 'invalidations': 0, 'size': 0}
+    """
+
+    DEFAULT_TTLS: Dict[str, float] = {
+        "camera": 5.0,
+        "recording": 30.0,
+        "stream_url": 60.0,
+        "system_health": 5.0,
+        "dashboard_stats": 2.0,
+    }
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, max_size: int = 1024):
+        """
+        Initialize the response cache.
+
+        Args:
+            ttls: Per-endpoint TTLs in seconds, merged over DEFAULT_TTLS
+            max_size: Maximum number of cached responses
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+
+        self.ttls = {**self.DEFAULT_TTLS, **(ttls or {})}
+        self.max_size = max_size
+
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Get the TTL in seconds for an endpoint (0 disables caching)."""
+        return self.ttls.get(endpoint, 0.0)
+
+    @staticmethod
+    def make_key(path: str, params: Optional[Dict[str, Hashable]] = None, variant: str = "") -> CacheKey:
+        """
+        Build the cache key for a request.
+
+        Args:
+            path: Request path
+            params: Query parameters
+            variant: Distinguishes differently parsed values of the same response
+        """
+        return path, tuple(sorted((params or {}).items())), variant
+
+    def get(self, key: CacheKey) -> Optional[CacheEntry]:
+        """Get an entry, fresh or stale, marking it as recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def peek(self, key: CacheKey) -> Optional[CacheEntry]:
+        """Get an entry without affecting its LRU position."""
+        with self._lock:
+            return self._entries.get(key)
+
+    def set(self, key: CacheKey, value: Any, ttl: float, etag: Optional[str] = None) -> None:
+        """Store an entry, evicting the least recently used ones if needed."""
+        with self._lock:
+            self._entries[key] = CacheEntry(value, etag, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def touch(self, key: CacheKey, ttl: float) -> None:
+        """Extend the freshness of an entry, e.g. after a successful revalidation."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.expires_at = time.monotonic() + ttl
+
+    def invalidate(self, path: str, subpaths: bool = True) -> int:
+        """
+        Drop all entries for a path and the paths below it.
+
+        Args:
+            path: Request path, e.g. "/cameras/<id>"
+            subpaths: Also drop the paths below it (e.g. "/cameras/<id>" for "/cameras")
+
+        Returns:
+            Number of entries removed
+        """
+        prefix = path.rstrip("/") + "/"
+        with self._lock:
+            keys = [key for key in self._entries if key[0] == path or (subpaths and key[0].startswith(prefix))]
+            for key in keys:
+                del self._entries[key]
+
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def record_hit(self) -> None:
+        """Count a request served from a fresh entry."""
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self) -> None:
+        """Count a request that had to be fetched."""
+        with self._lock:
+            self.misses += 1
+
+    def record_revalidation(self) -> None:
+        """Count a stale entry confirmed by a 304 response."""
+        with self._lock:
+            self.revalidations += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Get the cache counters for export to metrics systems."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
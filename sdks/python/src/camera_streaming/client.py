@@ -2,43 +2,47 @@
 Main client for the Camera Streaming Platform SDK.
 """
 
-import time
-from typing import Any, Dict, List, Optional, Union
-from urllib.parse import urlencode
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple, Type, TypeVar, Union
 
 import httpx
-from pydantic import ValidationError as PydanticValidationError
-
-from .exceptions import (
-    AuthenticationError,
-    AuthorizationError,
-    CameraStreamingError,
-    NetworkError,
-    NotFoundError,
-    RateLimitError,
-    ValidationError,
-)
+
+from .bulk import BulkResult, run_bulk
+from .cache import ResponseCache
+from .connection import build_limits, build_timeout, check_http2_support, raise_for_status
+from .core import MISSING, ApiCall, ClientCore
+from .exceptions import AuthenticationError, NetworkError
 from .models import (
     AnalyticsOverview,
-    ApiResponse,
     ApiToken,
     Camera,
     CameraFilters,
+    CameraStatusUpdate,
     CreateApiTokenRequest,
     CreateCameraRequest,
     DashboardStats,
-    LoginRequest,
-    LoginResponse,
-    PaginatedResponse,
+    Page,
     Recording,
     RecordingFilters,
     SystemHealth,
     UpdateCameraRequest,
     User,
 )
+from .pagination import PageFetcher, fetch_all_pages, iterate_pages
+from .retry import RetryPolicy, RetryState
+from .serialization import JSONBackend
+from .streaming import JsonItemStream
+
+if TYPE_CHECKING:
+    from .websocket_client import WebSocketClient
 
+logger = logging.getLogger(__name__)
 
-class CameraStreamingClient:
+T = TypeVar("T")
+
+
+class CameraStreamingClient(ClientCore):
     """
     Main client for interacting with the Camera Streaming Platform API.
     
@@ -55,6 +59,22 @@ class CameraStreamingClient:
         timeout: float = 30.0,
         retries: int = 3,
         retry_delay: float = 1.0,
+        retry_policy: Optional[RetryPolicy] = None,
+        token_refresh_leeway: float = 30.0,
+        cache: Optional[ResponseCache] = None,
+        coalesce_requests: bool = False,
+        raw: bool = False,
+        lazy: bool = False,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        write_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        json_backend: Union[str, JSONBackend, None] = None,
     ):
         """
         Initialize the Camera Streaming client.
@@ -64,21 +84,56 @@ class CameraStreamingClient:
             api_key: API key for authentication (optional)
             timeout: Request timeout in seconds
             retries: Number of retry attempts
-            retry_delay: Delay between retries in seconds
-        """
-        self.base_url = base_url.rstrip("/")
-        self.api_key = api_key
-        self.timeout = timeout
-        self.retries = retries
-        self.retry_delay = retry_delay
+            retry_delay: Base delay for exponential backoff between retries in seconds
+            retry_policy: Custom retry policy (overrides retries and retry_delay)
+            token_refresh_leeway: Seconds before JWT expiry at which the access token is refreshed
+            cache: Response cache for read endpoints (optional)
+            coalesce_requests: Whether identical concurrent GET requests share one network call
+            raw: Return listing items as plain dicts by default
+            lazy: Return listing items as lazily validated proxies by default
+            max_connections: Maximum number of open connections in the pool
+            max_keepalive_connections: Maximum number of idle connections kept alive
+            keepalive_expiry: Seconds an idle connection is kept alive
+            http2: Whether to negotiate HTTP/2 (requires the http2 extra)
+            connect_timeout: Timeout for establishing a connection (defaults to timeout)
+            read_timeout: Timeout for receiving response data (defaults to timeout)
+            write_timeout: Timeout for sending request data (defaults to timeout)
+            pool_timeout: Timeout for acquiring a pooled connection (defaults to timeout)
+            transport: Pre-built transport to use instead of the pooled default
+            json_backend: JSON codec for request and response bodies: "orjson",
+                "msgspec", "stdlib", a JSONBackend instance, or None for the
+                fastest installed one
+        """
+        super().__init__(
+            base_url,
+            api_key,
+            timeout,
+            retries,
+            retry_delay,
+            retry_policy,
+            token_refresh_leeway,
+            cache,
+            raw,
+            lazy,
+            json_backend,
+        )
+        self.coalesce_requests = coalesce_requests
+        self.coalesced_requests = 0
         
-        self._access_token: Optional[str] = None
-        self._refresh_token: Optional[str] = None
+        self._refresh_task: Optional[asyncio.Future] = None
+        self._attached_websocket: Optional["WebSocketClient"] = None
+        self._detached_camera_ttl: Any = MISSING
+        self._websocket_handlers: List[Tuple[str, Callable]] = []
+        self._inflight_requests: Dict[Tuple, asyncio.Future] = {}
         
         # Create HTTP client
+        check_http2_support(http2 and transport is None)
         self._client = httpx.AsyncClient(
             base_url=self.base_url,
-            timeout=self.timeout,
+            timeout=build_timeout(timeout, connect_timeout, read_timeout, write_timeout, pool_timeout),
+            limits=build_limits(max_connections, max_keepalive_connections, keepalive_expiry),
+            http2=http2,
+            transport=transport,
             headers={"Content-Type": "application/json"},
         )
 
@@ -94,16 +149,12 @@ class CameraStreamingClient:
         """Close the HTTP client."""
         await self._client.aclose()
 
-    def _get_headers(self) -> Dict[str, str]:
-        """Get headers for API requests."""
-        headers = {}
-        
-        if self._access_token:
-            headers["Authorization"] = f"Bearer {self._access_token}"
-        elif self.api_key:
-            headers["X-API-Key"] = self.api_key
-            
-        return headers
+    async def _execute(self, call: ApiCall[T]) -> T:
+        """Perform an API call, through the response cache for cacheable GETs."""
+        if call.cache_endpoint is not None:
+            return await self._cached_get(call)
+        response = await self._make_request(call.method, call.path, call.data, call.params)
+        return self._read_response(call, response)
 
     async def _make_request(
         self,
@@ -111,6 +162,8 @@ class CameraStreamingClient:
         endpoint: str,
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
     ) -> httpx.Response:
         """
         Make an HTTP request with retry logic.
@@ -120,6 +173,8 @@ class CameraStreamingClient:
             endpoint: API endpoint
             data: Request body data
             params: Query parameters
+            headers: Extra request headers
+            stream: Return once the headers arrive; the caller reads and closes the body
             
         Returns:
             HTTP response
@@ -128,85 +183,106 @@ class CameraStreamingClient:
             CameraStreamingError: On API errors
         """
         url = f"{self.base_url}{endpoint}"
-        headers = self._get_headers()
+        retry_state = self.retry_policy.start()
         
-        for attempt in range(self.retries + 1):
+        while True:
             try:
-                response = await self._client.request(
-                    method=method,
-                    url=url,
-                    json=data,
-                    params=params,
-                    headers=headers,
-                )
-                
-                # Handle authentication errors with token refresh
-                if response.status_code == 401 and self._refresh_token:
-                    try:
-                        await self._refresh_access_token()
-                        headers = self._get_headers()
-                        response = await self._client.request(
-                            method=method,
-                            url=url,
-                            json=data,
-                            params=params,
-                            headers=headers,
-                        )
-                    except Exception:
-                        raise AuthenticationError("Session expired. Please login again.")
-                
-                # Handle different status codes
-                if response.status_code == 400:
-                    error_data = response.json() if response.content else {}
-                    raise ValidationError(error_data.get("message", "Validation error"))
-                elif response.status_code == 401:
-                    error_data = response.json() if response.content else {}
-                    raise AuthenticationError(error_data.get("message", "Authentication failed"))
-                elif response.status_code == 403:
-                    error_data = response.json() if response.content else {}
-                    raise AuthorizationError(error_data.get("message", "Access denied"))
-                elif response.status_code == 404:
-                    error_data = response.json() if response.content else {}
-                    raise NotFoundError(error_data.get("message", "Resource not found"))
-                elif response.status_code == 429:
-                    error_data = response.json() if response.content else {}
-                    raise RateLimitError(error_data.get("message", "Rate limit exceeded"))
-                elif response.status_code >= 400:
-                    error_data = response.json() if response.content else {}
-                    raise CameraStreamingError(
-                        error_data.get("message", f"HTTP {response.status_code}"),
-                        response.status_code
-                    )
-                
-                return response
-                
-            except httpx.RequestError as e:
-                if attempt == self.retries:
+                response = await self._send_request(method, url, data, params, headers, retry_state, stream)
+            except (httpx.RequestError, asyncio.TimeoutError) as e:
+                delay = self._retry_delay_after_error(method, e, retry_state)
+                if delay is None:
+                    if isinstance(e, asyncio.TimeoutError):
+                        raise NetworkError("Network error: request deadline exceeded")
                     raise NetworkError(f"Network error: {str(e)}")
                 
-                # Wait before retry
-                time.sleep(self.retry_delay * (2 ** attempt))
+                await self.retry_policy.sleep(delay)
+                continue
+            
+            delay = self._retry_delay_after_response(method, response, retry_state)
+            if delay is not None:
+                await response.aclose()
+                await self.retry_policy.sleep(delay)
+                continue
+            
+            if response.status_code >= 400:
+                await response.aread()
+            raise_for_status(response)
+            return response
+
+    async def _send_request(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        retry_state: RetryState,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Send a single attempt, refreshing the access token once on 401."""
+        if self._access_token_expiring():
+            try:
+                await self._refresh_access_token()
+            except Exception as e:
+                # Keep using the current token; if it is rejected, the 401 handling below refreshes again
+                logger.warning(f"Refreshing the access token ahead of expiry failed: {e}")
+        
+        sent_token = self._access_token
+        response = await self._send_within_deadline(method, url, data, params, headers, retry_state, stream)
+        
+        # Handle authentication errors with token refresh, unless another
+        # request already replaced the token this one was sent with
+        if response.status_code == 401 and self._refresh_token:
+            if self._access_token == sent_token:
+                await self._refresh_access_token_or_expire()
+            await response.aclose()
+            response = await self._send_within_deadline(method, url, data, params, headers, retry_state, stream)
         
-        raise NetworkError("Max retries exceeded")
+        return response
 
-    async def _refresh_access_token(self) -> None:
-        """Refresh the access token using the refresh token."""
-        if not self._refresh_token:
-            raise AuthenticationError("No refresh token available")
+    async def _send_within_deadline(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        retry_state: RetryState,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Send a request, bounded by the remaining retry deadline if one is set."""
+        request = self._build_request(method, url, data, params, headers)
+        send = self._client.send(request, stream=stream)
+        
+        remaining = retry_state.remaining()
+        if remaining is None:
+            return await send
+        if remaining <= 0:
+            send.close()
+            raise asyncio.TimeoutError()
+        return await asyncio.wait_for(send, remaining)
+
+    async def _refresh_access_token_or_expire(self) -> None:
+        """Refresh the access token, reporting failures as an expired session."""
+        try:
+            await self._refresh_access_token()
+        except Exception:
+            raise AuthenticationError("Session expired. Please login again.")
 
-        response = await self._client.post(
-            f"{self.base_url}/auth/refresh",
-            json={"refreshToken": self._refresh_token},
-        )
+    async def _refresh_access_token(self) -> None:
+        """
+        Refresh the access token using the refresh token.
+        
+        Concurrent callers share a single in-flight refresh request.
+        """
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.ensure_future(self._request_token_refresh())
+        await asyncio.shield(self._refresh_task)
 
-        if response.status_code == 200:
-            data = response.json()
-            if data.get("success") and data.get("data"):
-                self._access_token = data["data"]["accessToken"]
-            else:
-                raise AuthenticationError("Failed to refresh token")
-        else:
-            raise AuthenticationError("Failed to refresh token")
+    async def _request_token_refresh(self) -> None:
+        """Exchange the refresh token for a new access token."""
+        response = await self._client.send(self._refresh_request())
+        self._apply_refresh_response(response)
 
     # Authentication methods
     async def login(self, username: str, password: str) -> User:
@@ -223,28 +299,17 @@ class CameraStreamingClient:
         Raises:
             AuthenticationError: On login failure
         """
-        request = LoginRequest(username=username, password=password)
-        response = await self._make_request("POST", "/auth/login", request.dict())
-        
-        login_response = LoginResponse(**response.json())
-        
-        if login_response.success and login_response.data:
-            self._access_token = login_response.access_token
-            self._refresh_token = login_response.refresh_token
-            return login_response.user
-        else:
-            raise AuthenticationError(login_response.error or "Login failed")
+        return await self._execute(self._login_call(username, password))
 
     async def logout(self) -> None:
         """Logout and invalidate tokens."""
         if self._refresh_token:
             try:
-                await self._make_request("POST", "/auth/logout", {"refreshToken": self._refresh_token})
+                await self._execute(self._logout_call())
             except Exception:
                 pass  # Ignore errors during logout
         
-        self._access_token = None
-        self._refresh_token = None
+        self._clear_tokens()
 
     async def get_profile(self) -> User:
         """
@@ -256,40 +321,253 @@ class CameraStreamingClient:
         Raises:
             AuthenticationError: If not authenticated
         """
-        response = await self._make_request("GET", "/auth/profile")
-        api_response = ApiResponse(**response.json())
+        return await self._execute(self._profile_call())
+
+    # Caching and coalescing helpers
+    async def _cached_get(self, call: ApiCall[T]) -> T:
+        """
+        Perform a GET request through the response cache and request coalescing.
+        
+        Fresh cached values are returned without a request. When coalescing
+        is enabled, identical concurrent requests share one network call and
+        one parsed result.
         
-        if api_response.success and api_response.data:
-            return User(**api_response.data["user"])
+        Args:
+            call: Cacheable GET call
+            
+        Returns:
+            Parsed response value
+        """
+        ttl = self._cache_ttl(call)
+        if ttl:
+            value = self._cached_value(call)
+            if value is not MISSING:
+                return value
+        
+        if not self.coalesce_requests:
+            return await self._fetch_and_parse(call, ttl)
+        
+        key = (
+            "GET",
+            call.path,
+            tuple(sorted((call.params or {}).items())),
+            tuple(sorted(self._get_headers().items())),
+            call.variant,
+        )
+        task = self._inflight_requests.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_parse(call, ttl))
+            self._inflight_requests[key] = task
+            task.add_done_callback(lambda done: self._forget_inflight_request(key, done))
         else:
-            raise CameraStreamingError(api_response.error or "Failed to get profile")
+            self.coalesced_requests += 1
+        
+        return await asyncio.shield(task)
 
-    def is_authenticated(self) -> bool:
-        """Check if the client is authenticated."""
-        return bool(self._access_token or self.api_key)
+    async def _fetch_and_parse(self, call: ApiCall[T], ttl: float) -> T:
+        """Fetch and parse a GET response, revalidating and storing cache entries."""
+        if not ttl:
+            return call.parse(await self._make_request("GET", call.path, params=call.params))
+        
+        entry, headers = self._revalidation(call)
+        response = await self._make_request("GET", call.path, params=call.params, headers=headers)
+        return self._read_cached_response(call, ttl, entry, response)
+
+    def _forget_inflight_request(self, key: Tuple, task: asyncio.Future) -> None:
+        """Remove a finished request from the in-flight map."""
+        if self._inflight_requests.get(key) is task:
+            del self._inflight_requests[key]
+        if not task.cancelled():
+            task.exception()
+
+    # Real-time cache updates
+    def attach_websocket(self, ws_client: "WebSocketClient", camera_ttl: Optional[float] = None) -> None:
+        """
+        Keep cached cameras current from WebSocket push events.
+        
+        ``cameraStatusUpdate`` events update the stream status of cached
+        Camera objects in place and drop cached camera listings. Cached
+        cameras are dropped whenever the WebSocket disconnects, since
+        updates may have been missed.
+        
+        Args:
+            ws_client: WebSocket client subscribed to camera updates
+            camera_ttl: TTL in seconds for cached cameras while attached (optional);
+                the previous TTL is restored by detach_websocket
+            
+        Raises:
+            ValueError: If the client has no response cache
+        """
+        if self.cache is None:
+            raise ValueError("attach_websocket requires a response cache")
+        
+        self.detach_websocket()
+        if camera_ttl is not None:
+            self._detached_camera_ttl = self.cache.ttls.get("camera")
+            self.cache.ttls["camera"] = camera_ttl
+        
+        self._websocket_handlers = [
+            ("cameraStatusUpdate", self._on_camera_status_update),
+            ("disconnected", self._on_websocket_interrupted),
+            ("reconnecting", self._on_websocket_interrupted),
+        ]
+        for event_type, handler in self._websocket_handlers:
+            ws_client.on(event_type, handler)
+        self._attached_websocket = ws_client
+
+    def detach_websocket(self) -> None:
+        """Stop applying WebSocket push events to the response cache."""
+        if self._attached_websocket is not None:
+            for event_type, handler in self._websocket_handlers:
+                self._attached_websocket.off(event_type, handler)
+        self._attached_websocket = None
+        self._websocket_handlers = []
+        
+        # Cameras are no longer push-updated, so the configured TTL applies again
+        if self._detached_camera_ttl is not MISSING:
+            if self._detached_camera_ttl is None:
+                self.cache.ttls.pop("camera", None)
+            else:
+                self.cache.ttls["camera"] = self._detached_camera_ttl
+            self._detached_camera_ttl = MISSING
+
+    async def _on_camera_status_update(self, update: Union[CameraStatusUpdate, List[CameraStatusUpdate]]) -> None:
+        """Apply camera status push events (single or coalesced) to the cached cameras."""
+        if self.cache is None:
+            return
+        
+        for camera_update in update if isinstance(update, list) else [update]:
+            key = self.cache.make_key(f"/cameras/{camera_update.camera_id}")
+            entry = self.cache.peek(key)
+            if entry is not None:
+                entry.value.stream_status = camera_update.status
+                self.cache.touch(key, self.cache.ttl_for("camera"))
+        # Listing pages embed the old status; single cameras stay cached
+        self.cache.invalidate("/cameras", subpaths=False)
+        self._invalidate_cache("/dashboard/stats")
+
+    async def _on_websocket_interrupted(self, data: Any) -> None:
+        """Drop cached cameras once push events may have been missed."""
+        self._invalidate_cache("/cameras", "/dashboard/stats")
+
+    # Pagination helpers
+    def _page_fetcher(
+        self,
+        endpoint: str,
+        page_type: Type[Page],
+        filters: Optional[Union[CameraFilters, RecordingFilters]],
+        page_size: Optional[int],
+        error_message: str,
+    ) -> Tuple[PageFetcher, int, int]:
+        """
+        Build a page fetcher for a listing.
+        
+        Returns:
+            Tuple of (fetch_page, first offset, page size)
+        """
+        page_call, offset, page_size = self._page_calls(endpoint, page_type, filters, page_size, error_message)
+
+        async def fetch_page(page_offset: int, page_limit: int) -> Page:
+            return await self._execute(page_call(page_offset, page_limit))
+
+        return fetch_page, offset, page_size
+
+    def _iter_pages(
+        self,
+        endpoint: str,
+        page_type: Type[Page],
+        filters: Optional[Union[CameraFilters, RecordingFilters]],
+        page_size: Optional[int],
+        prefetch: int,
+        error_message: str,
+    ) -> AsyncIterator[Page]:
+        """Iterate over the pages of a listing with prefetching."""
+        fetch_page, offset, page_size = self._page_fetcher(endpoint, page_type, filters, page_size, error_message)
+        return iterate_pages(fetch_page, offset=offset, page_size=page_size, prefetch=prefetch)
+
+    async def _stream_items(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        parse_item: Callable[[Dict[str, Any]], T],
+        error_message: str,
+    ) -> AsyncIterator[T]:
+        """
+        Stream the items of a listing response one at a time.
+        
+        ``data.items`` is decoded incrementally from the body stream, so only
+        the item being parsed is held in memory rather than the whole page.
+        Streamed requests bypass the response cache and request coalescing.
+        
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            parse_item: Function turning a decoded item into the yielded value
+            error_message: Error message used if the API reports a failure
+            
+        Yields:
+            Parsed items in response order
+        """
+        response = await self._make_request("GET", endpoint, params=params, stream=True)
+        decoder = JsonItemStream(("data", "items"))
+        try:
+            async for chunk in response.aiter_bytes():
+                for item in decoder.feed(chunk):
+                    yield parse_item(item)
+            envelope = decoder.close()
+        finally:
+            await response.aclose()
+        
+        self._check_stream_envelope(envelope, error_message)
 
     # Camera management methods
-    async def get_cameras(self, filters: Optional[CameraFilters] = None) -> List[Camera]:
+    async def get_cameras(
+        self,
+        filters: Optional[CameraFilters] = None,
+        raw: Optional[bool] = None,
+        lazy: Optional[bool] = None,
+    ) -> List[Camera]:
         """
         Get list of cameras with optional filters.
         
         Args:
             filters: Optional filters to apply
+            raw: Return plain dicts instead of models (defaults to the client setting)
+            lazy: Return proxies validating fields on first access (defaults to the client setting)
             
         Returns:
             List of Camera objects
         """
-        params = {}
-        if filters:
-            params = {k: v for k, v in filters.dict().items() if v is not None}
+        paginated_response = await self._execute(self._cameras_call(filters, raw, lazy))
+        return paginated_response.items
+
+    async def iter_cameras(
+        self,
+        filters: Optional[CameraFilters] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+        raw: Optional[bool] = None,
+        lazy: Optional[bool] = None,
+    ) -> AsyncIterator[Camera]:
+        """
+        Iterate over all cameras matching the filters, page by page.
         
-        response = await self._make_request("GET", "/cameras", params=params)
-        paginated_response = PaginatedResponse(**response.json())
+        The next pages are fetched while the current one is being consumed.
         
-        if paginated_response.success:
-            return [Camera(**item) for item in paginated_response.items]
-        else:
-            raise CameraStreamingError(paginated_response.error or "Failed to get cameras")
+        Args:
+            filters: Optional filters to apply (limit and offset set the first page)
+            page_size: Number of cameras per request (defaults to filters.limit)
+            prefetch: Number of pages to fetch ahead of the consumer
+            raw: Return plain dicts instead of models (defaults to the client setting)
+            lazy: Return proxies validating fields on first access (defaults to the client setting)
+            
+        Yields:
+            Camera objects
+        """
+        page_type = self._listing_page_type(Camera, raw, lazy)
+        async for page in self._iter_pages("/cameras", page_type, filters, page_size, prefetch, "Failed to get cameras"):
+            for camera in page.items:
+                yield camera
 
     async def get_camera(self, camera_id: str) -> Camera:
         """
@@ -304,13 +582,7 @@ class CameraStreamingClient:
         Raises:
             NotFoundError: If camera not found
         """
-        response = await self._make_request("GET", f"/cameras/{camera_id}")
-        api_response = ApiResponse(**response.json())
-        
-        if api_response.success and api_response.data:
-            return Camera(**api_response.data["camera"])
-        else:
-            raise NotFoundError(f"Camera with ID {camera_id} not found")
+        return await self._execute(self._camera_call(camera_id))
 
     async def create_camera(self, camera_data: CreateCameraRequest) -> Camera:
         """
@@ -322,13 +594,7 @@ class CameraStreamingClient:
         Returns:
             Created Camera object
         """
-        response = await self._make_request("POST", "/cameras", camera_data.dict())
-        api_response = ApiResponse(**response.json())
-        
-        if api_response.success and api_response.data:
-            return Camera(**api_response.data["camera"])
-        else:
-            raise CameraStreamingError(api_response.error or "Failed to create camera")
+        return await self._execute(self._create_camera_call(camera_data))
 
     async def update_camera(self, camera_id: str, updates: UpdateCameraRequest) -> Camera:
         """
@@ -341,13 +607,7 @@ class CameraStreamingClient:
         Returns:
             Updated Camera object
         """
-        response = await self._make_request("PUT", f"/cameras/{camera_id}", updates.dict(exclude_unset=True))
-        api_response = ApiResponse(**response.json())
-        
-        if api_response.success and api_response.data:
-            return Camera(**api_response.data["camera"])
-        else:
-            raise CameraStreamingError(api_response.error or "Failed to update camera")
+        return await self._execute(self._update_camera_call(camera_id, updates))
 
     async def delete_camera(self, camera_id: str) -> None:
         """
@@ -356,11 +616,7 @@ class CameraStreamingClient:
         Args:
             camera_id: Camera ID
         """
-        response = await self._make_request("DELETE", f"/cameras/{camera_id}")
-        api_response = ApiResponse(**response.json())
-        
-        if not api_response.success:
-            raise CameraStreamingError(api_response.error or "Failed to delete camera")
+        await self._execute(self._delete_camera_call(camera_id))
 
     async def activate_camera(self, camera_id: str) -> None:
         """
@@ -369,11 +625,7 @@ class CameraStreamingClient:
         Args:
             camera_id: Camera ID
         """
-        response = await self._make_request("POST", f"/cameras/{camera_id}/activate")
-        api_response = ApiResponse(**response.json())
-        
-        if not api_response.success:
-            raise CameraStreamingError(api_response.error or "Failed to activate camera")
+        await self._execute(self._activate_camera_call(camera_id))
 
     async def deactivate_camera(self, camera_id: str) -> None:
         """
@@ -382,11 +634,7 @@ class CameraStreamingClient:
         Args:
             camera_id: Camera ID
         """
-        response = await self._make_request("POST", f"/cameras/{camera_id}/deactivate")
-        api_response = ApiResponse(**response.json())
-        
-        if not api_response.success:
-            raise CameraStreamingError(api_response.error or "Failed to deactivate camera")
+        await self._execute(self._deactivate_camera_call(camera_id))
 
     async def toggle_recording(self, camera_id: str) -> bool:
         """
@@ -398,36 +646,173 @@ class CameraStreamingClient:
         Returns:
             New recording status
         """
-        response = await self._make_request("POST", f"/cameras/{camera_id}/toggle-recording")
-        api_response = ApiResponse(**response.json())
+        return await self._execute(self._toggle_recording_call(camera_id))
+
+    # Bulk camera operations
+    async def bulk_activate(self, camera_ids: Iterable[str], concurrency: int = 10) -> BulkResult:
+        """
+        Activate many cameras.
         
-        if api_response.success and api_response.data:
-            return api_response.data["isRecording"]
-        else:
-            raise CameraStreamingError(api_response.error or "Failed to toggle recording")
+        Args:
+            camera_ids: Camera IDs
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            BulkResult mapping each camera ID to None or its error
+        """
+        return await run_bulk(camera_ids, self.activate_camera, concurrency)
+
+    async def bulk_deactivate(self, camera_ids: Iterable[str], concurrency: int = 10) -> BulkResult:
+        """
+        Deactivate many cameras.
+        
+        Args:
+            camera_ids: Camera IDs
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            BulkResult mapping each camera ID to None or its error
+        """
+        return await run_bulk(camera_ids, self.deactivate_camera, concurrency)
+
+    async def bulk_update(
+        self,
+        camera_ids: Iterable[str],
+        updates: UpdateCameraRequest,
+        concurrency: int = 10,
+    ) -> BulkResult:
+        """
+        Apply the same update to many cameras.
+        
+        Args:
+            camera_ids: Camera IDs
+            updates: Camera update data
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            BulkResult mapping each camera ID to the updated Camera or its error
+        """
+        return await run_bulk(camera_ids, lambda camera_id: self.update_camera(camera_id, updates), concurrency)
+
+    async def bulk_toggle_recording(self, camera_ids: Iterable[str], concurrency: int = 10) -> BulkResult:
+        """
+        Toggle recording for many cameras.
+        
+        Args:
+            camera_ids: Camera IDs
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            BulkResult mapping each camera ID to its new recording status or its error
+        """
+        return await run_bulk(camera_ids, self.toggle_recording, concurrency)
 
     # Recording management methods
-    async def get_recordings(self, filters: Optional[RecordingFilters] = None) -> List[Recording]:
+    async def get_recordings(
+        self,
+        filters: Optional[RecordingFilters] = None,
+        raw: Optional[bool] = None,
+        lazy: Optional[bool] = None,
+    ) -> List[Recording]:
         """
         Get list of recordings with optional filters.
         
         Args:
             filters: Optional filters to apply
+            raw: Return plain dicts instead of models (defaults to the client setting)
+            lazy: Return proxies validating fields on first access (defaults to the client setting)
             
         Returns:
             List of Recording objects
         """
-        params = {}
-        if filters:
-            params = {k: v for k, v in filters.dict().items() if v is not None}
+        paginated_response = await self._execute(self._recordings_call(filters, raw, lazy))
+        return paginated_response.items
+
+    async def iter_recordings(
+        self,
+        filters: Optional[RecordingFilters] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+        raw: Optional[bool] = None,
+        lazy: Optional[bool] = None,
+    ) -> AsyncIterator[Recording]:
+        """
+        Iterate over all recordings matching the filters, page by page.
         
-        response = await self._make_request("GET", "/recordings", params=params)
-        paginated_response = PaginatedResponse(**response.json())
+        The next pages are fetched while the current one is being consumed.
         
-        if paginated_response.success:
-            return [Recording(**item) for item in paginated_response.items]
-        else:
-            raise CameraStreamingError(paginated_response.error or "Failed to get recordings")
+        Args:
+            filters: Optional filters to apply (limit and offset set the first page)
+            page_size: Number of recordings per request (defaults to filters.limit)
+            prefetch: Number of pages to fetch ahead of the consumer
+            raw: Return plain dicts instead of models (defaults to the client setting)
+            lazy: Return proxies validating fields on first access (defaults to the client setting)
+            
+        Yields:
+            Recording objects
+        """
+        async for page in self._iter_pages(
+            "/recordings", self._listing_page_type(Recording, raw, lazy), filters, page_size, prefetch, "Failed to get recordings"
+        ):
+            for recording in page.items:
+                yield recording
+
+    async def fetch_all_recordings(
+        self,
+        filters: Optional[RecordingFilters] = None,
+        concurrency: int = 4,
+        page_size: Optional[int] = None,
+        raw: Optional[bool] = None,
+        lazy: Optional[bool] = None,
+    ) -> List[Recording]:
+        """
+        Fetch all recordings matching the filters, requesting pages in parallel.
+        
+        The first page reports the total number of rows; the remaining pages
+        are then fetched concurrently and reassembled in order.
+        
+        Args:
+            filters: Optional filters to apply (limit and offset set the first page)
+            concurrency: Maximum number of page requests in flight
+            page_size: Number of recordings per request (defaults to filters.limit)
+            raw: Return plain dicts instead of models (defaults to the client setting)
+            lazy: Return proxies validating fields on first access (defaults to the client setting)
+            
+        Returns:
+            List of Recording objects
+        """
+        fetch_page, offset, page_size = self._page_fetcher(
+            "/recordings", self._listing_page_type(Recording, raw, lazy), filters, page_size, "Failed to get recordings"
+        )
+        pages = await fetch_all_pages(fetch_page, offset=offset, page_size=page_size, concurrency=concurrency)
+        return [recording for page in pages for recording in page.items]
+
+    async def stream_recordings(
+        self,
+        filters: Optional[RecordingFilters] = None,
+        raw: Optional[bool] = None,
+        lazy: Optional[bool] = None,
+    ) -> AsyncIterator[Recording]:
+        """
+        Stream one (typically large) page of recordings, one recording at a time.
+        
+        The response body is decoded incrementally, so peak memory is bounded
+        by a single recording instead of the page size. Use filters.limit to
+        request a large page.
+        
+        Args:
+            filters: Optional filters to apply
+            raw: Return plain dicts instead of models (defaults to the client setting)
+            lazy: Return proxies validating fields on first access (defaults to the client setting)
+            
+        Yields:
+            Recording objects
+        """
+        parse_item = self._listing_item_parser(Recording, raw, lazy)
+        async for recording in self._stream_items(
+            "/recordings", self._filter_params(filters), parse_item, "Failed to get recordings"
+        ):
+            yield recording
 
     async def get_recording(self, recording_id: str) -> Recording:
         """
@@ -439,13 +824,7 @@ class CameraStreamingClient:
         Returns:
             Recording object
         """
-        response = await self._make_request("GET", f"/recordings/{recording_id}")
-        api_response = ApiResponse(**response.json())
-        
-        if api_response.success and api_response.data:
-            return Recording(**api_response.data["recording"])
-        else:
-            raise NotFoundError(f"Recording with ID {recording_id} not found")
+        return await self._execute(self._recording_call(recording_id))
 
     async def get_recording_download_url(self, recording_id: str) -> str:
         """
@@ -457,13 +836,7 @@ class CameraStreamingClient:
         Returns:
             Download URL
         """
-        response = await self._make_request("GET", f"/recordings/{recording_id}/download")
-        api_response = ApiResponse(**response.json())
-        
-        if api_response.success and api_response.data:
-            return api_response.data["downloadUrl"]
-        else:
-            raise CameraStreamingError(api_response.error or "Failed to get download URL")
+        return await self._execute(self._recording_download_url_call(recording_id))
 
     async def delete_recording(self, recording_id: str) -> None:
         """
@@ -472,11 +845,7 @@ class CameraStreamingClient:
         Args:
             recording_id: Recording ID
         """
-        response = await self._make_request("DELETE", f"/recordings/{recording_id}")
-        api_response = ApiResponse(**response.json())
-        
-        if not api_response.success:
-            raise CameraStreamingError(api_response.error or "Failed to delete recording")
+        await self._execute(self._delete_recording_call(recording_id))
 
     # API Token management methods
     async def get_api_tokens(self) -> List[ApiToken]:
@@ -486,13 +855,7 @@ class CameraStreamingClient:
         Returns:
             List of ApiToken objects
         """
-        response = await self._make_request("GET", "/auth/api-tokens")
-        api_response = ApiResponse(**response.json())
-        
-        if api_response.success and api_response.data:
-            return [ApiToken(**token) for token in api_response.data["tokens"]]
-        else:
-            raise CameraStreamingError(api_response.error or "Failed to get API tokens")
+        return await self._execute(self._api_tokens_call())
 
     async def create_api_token(self, token_data: CreateApiTokenRequest) -> Dict[str, Any]:
         """
@@ -504,16 +867,7 @@ class CameraStreamingClient:
         Returns:
             Dictionary with token info and API key
         """
-        response = await self._make_request("POST", "/auth/api-tokens", token_data.dict())
-        api_response = ApiResponse(**response.json())
-        
-        if api_response.success and api_response.data:
-            return {
-                "token": ApiToken(**api_response.data["token"]),
-                "api_key": api_response.data["apiKey"]
-            }
-        else:
-            raise CameraStreamingError(api_response.error or "Failed to create API token")
+        return await self._execute(self._create_api_token_call(token_data))
 
     async def delete_api_token(self, token_id: str) -> None:
         """
@@ -522,11 +876,7 @@ class CameraStreamingClient:
         Args:
             token_id: Token ID
         """
-        response = await self._make_request("DELETE", f"/auth/api-tokens/{token_id}")
-        api_response = ApiResponse(**response.json())
-        
-        if not api_response.success:
-            raise CameraStreamingError(api_response.error or "Failed to delete API token")
+        await self._execute(self._delete_api_token_call(token_id))
 
     # Dashboard and analytics methods
     async def get_dashboard_stats(self) -> DashboardStats:
@@ -536,13 +886,7 @@ class CameraStreamingClient:
         Returns:
             DashboardStats object
         """
-        response = await self._make_request("GET", "/dashboard/stats")
-        api_response = ApiResponse(**response.json())
-        
-        if api_response.success and api_response.data:
-            return DashboardStats(**api_response.data)
-        else:
-            raise CameraStreamingError(api_response.error or "Failed to get dashboard stats")
+        return await self._execute(self._dashboard_stats_call())
 
     async def get_system_health(self) -> SystemHealth:
         """
@@ -551,13 +895,7 @@ class CameraStreamingClient:
         Returns:
             SystemHealth object
         """
-        response = await self._make_request("GET", "/dashboard/health")
-        api_response = ApiResponse(**response.json())
-        
-        if api_response.success and api_response.data:
-            return SystemHealth(**api_response.data)
-        else:
-            raise CameraStreamingError(api_response.error or "Failed to get system health")
+        return await self._execute(self._system_health_call())
 
     async def get_analytics_overview(self, time_range: str = "24h") -> AnalyticsOverview:
         """
@@ -569,13 +907,7 @@ class CameraStreamingClient:
         Returns:
             AnalyticsOverview object
         """
-        response = await self._make_request("GET", f"/analytics/overview?timeRange={time_range}")
-        api_response = ApiResponse(**response.json())
-        
-        if api_response.success and api_response.data:
-            return AnalyticsOverview(**api_response.data)
-        else:
-            raise CameraStreamingError(api_response.error or "Failed to get analytics overview")
+        return await self._execute(self._analytics_overview_call(time_range))
 
     # Streaming methods
     async def get_stream_url(self, camera_id: str, quality: Optional[str] = None) -> str:
@@ -589,14 +921,7 @@ class CameraStreamingClient:
         Returns:
             Stream URL
         """
-        params = {"quality": quality} if quality else {}
-        response = await self._make_request("GET", f"/streaming/hls/{camera_id}", params=params)
-        api_response = ApiResponse(**response.json())
-        
-        if api_response.success and api_response.data:
-            return api_response.data["streamUrl"]
-        else:
-            raise CameraStreamingError(api_response.error or "Failed to get stream URL")
+        return await self._execute(self._stream_url_call(camera_id, quality))
 
     async def get_webrtc_offer(self, camera_id: str) -> Dict[str, Any]:
         """
@@ -608,13 +933,7 @@ class CameraStreamingClient:
         Returns:
             WebRTC offer
         """
-        response = await self._make_request("POST", f"/streaming/webrtc/{camera_id}/offer")
-        api_response = ApiResponse(**response.json())
-        
-        if api_response.success and api_response.data:
-            return api_response.data
-        else:
-            raise CameraStreamingError(api_response.error or "Failed to get WebRTC offer")
+        return await self._execute(self._webrtc_offer_call(camera_id))
 
     async def send_webrtc_answer(self, camera_id: str, answer: Dict[str, Any]) -> None:
         """
@@ -624,17 +943,4 @@ class CameraStreamingClient:
             camera_id: Camera ID
             answer: WebRTC answer
         """
-        response = await self._make_request("POST", f"/streaming/webrtc/{camera_id}/answer", answer)
-        api_response = ApiResponse(**response.json())
-        
-        if not api_response.success:
-            raise CameraStreamingError(api_response.error or "Failed to send WebRTC answer")
-
-    # Utility methods
-    def set_access_token(self, token: str) -> None:
-        """Set the access token manually."""
-        self._access_token = token
-
-    def set_api_key(self, api_key: str) -> None:
-        """Set the API key manually."""
-        self.api_key = api_key
\ No newline at end of file
+        await self._execute(self._webrtc_answer_call(camera_id, answer))
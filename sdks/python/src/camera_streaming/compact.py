@@ -0,0 +1,297 @@
+"""
+Compact in-memory records for large camera and recording sets.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .models import Camera, Recording, StorageTier, StreamStatus
+
+STREAM_STATUSES: Tuple[StreamStatus, ...] = tuple(StreamStatus)
+STORAGE_TIERS: Tuple[StorageTier, ...] = tuple(StorageTier)
+
+_STREAM_STATUS_CODES = {status: code for code, status in enumerate(STREAM_STATUSES)}
+_STORAGE_TIER_CODES = {tier: code for code, tier in enumerate(STORAGE_TIERS)}
+
+
+class _CompactRecord:
+    """Shared equality and repr for slotted records."""
+
+    __slots__ = ()
+
+    def _values(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is type(self):
+            return self._values() == other._values()
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={self.id!r})"
+
+
+class CompactCamera(_CompactRecord):
+    """
+    Slotted camera record with the stream status stored as a small int.
+
+    Use a :class:`CameraInterner` to share one record per camera ID.
+    """
+
+    __slots__ = (
+        "id",
+        "name",
+        "company",
+        "model",
+        "serial_number",
+        "location",
+        "place",
+        "rtmp_url",
+        "is_active",
+        "is_recording",
+        "stream_status_code",
+        "created_at",
+        "updated_at",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        name: str,
+        company: str,
+        model: str,
+        serial_number: str,
+        location: str,
+        place: str,
+        rtmp_url: str,
+        is_active: bool,
+        is_recording: bool,
+        stream_status_code: int,
+        created_at: datetime,
+        updated_at: datetime,
+    ):
+        self.id = id
+        self.name = name
+        self.company = company
+        self.model = model
+        self.serial_number = serial_number
+        self.location = location
+        self.place = place
+        self.rtmp_url = rtmp_url
+        self.is_active = is_active
+        self.is_recording = is_recording
+        self.stream_status_code = stream_status_code
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+    @property
+    def stream_status(self) -> StreamStatus:
+        """Get the stream status as an enum member."""
+        return STREAM_STATUSES[self.stream_status_code]
+
+    @classmethod
+    def from_model(cls, camera: Camera) -> "CompactCamera":
+        """Build a compact record from a Camera model."""
+        return cls(
+            camera.id,
+            camera.name,
+            camera.company,
+            camera.model,
+            camera.serial_number,
+            camera.location,
+            camera.place,
+            camera.rtmp_url,
+            camera.is_active,
+            camera.is_recording,
+            _STREAM_STATUS_CODES[camera.stream_status],
+            camera.created_at,
+            camera.updated_at,
+        )
+
+    def to_model(self) -> Camera:
+        """Convert back to a Camera model."""
+        return Camera.model_construct(
+            id=self.id,
+            name=self.name,
+            company=self.company,
+            model=self.model,
+            serial_number=self.serial_number,
+            location=self.location,
+            place=self.place,
+            rtmp_url=self.rtmp_url,
+            is_active=self.is_active,
+            is_recording=self.is_recording,
+            stream_status=self.stream_status,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+        )
+
+
+class CompactRecording(_CompactRecord):
+    """
+    Slotted recording record referencing a shared CompactCamera.
+
+    The storage tier is stored as a small int.
+    """
+
+    __slots__ = (
+        "id",
+        "camera",
+        "filename",
+        "file_path",
+        "file_size",
+        "duration",
+        "start_time",
+        "end_time",
+        "storage_tier_code",
+        "is_encrypted",
+        "created_at",
+        "updated_at",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        camera: CompactCamera,
+        filename: str,
+        file_path: str,
+        file_size: int,
+        duration: int,
+        start_time: datetime,
+        end_time: datetime,
+        storage_tier_code: int,
+        is_encrypted: bool,
+        created_at: datetime,
+        updated_at: datetime,
+    ):
+        self.id = id
+        self.camera = camera
+        self.filename = filename
+        self.file_path = file_path
+        self.file_size = file_size
+        self.duration = duration
+        self.start_time = start_time
+        self.end_time = end_time
+        self.storage_tier_code = storage_tier_code
+        self.is_encrypted = is_encrypted
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+    @property
+    def storage_tier(self) -> StorageTier:
+        """Get the storage tier as an enum member."""
+        return STORAGE_TIERS[self.storage_tier_code]
+
+    @classmethod
+    def from_model(cls, recording: Recording, cameras: Optional["CameraInterner"] = None) -> "CompactRecording":
+        """
+        Build a compact record from a Recording model.
+
+        Args:
+            recording: Recording model
+            cameras: Interner sharing camera records by ID (a private one is used if omitted)
+
+        Returns:
+            CompactRecording object
+        """
+        if cameras is None:
+            cameras = CameraInterner()
+        camera = cameras.intern(recording.camera)
+        return cls(
+            recording.id,
+            camera,
+            recording.filename,
+            recording.file_path,
+            recording.file_size,
+            recording.duration,
+            recording.start_time,
+            recording.end_time,
+            _STORAGE_TIER_CODES[recording.storage_tier],
+            recording.is_encrypted,
+            recording.created_at,
+            recording.updated_at,
+        )
+
+    def to_model(self) -> Recording:
+        """Convert back to a Recording model."""
+        return Recording.model_construct(
+            id=self.id,
+            camera=self.camera.to_model(),
+            filename=self.filename,
+            file_path=self.file_path,
+            file_size=self.file_size,
+            duration=self.duration,
+            start_time=self.start_time,
+            end_time=self.end_time,
+            storage_tier=self.storage_tier,
+            is_encrypted=self.is_encrypted,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+        )
+
+
+class CameraInterner:
+    """
+    Shares one CompactCamera per camera ID.
+
+    Recordings of the same camera reference the same record instead of
+    each carrying a full copy. A camera whose data changed replaces the
+    interned record; recordings converted earlier keep the old one.
+
+    Example:
+        >>> cameras = CameraInterner()
+        >>> compact = compact_recordings(await client.fetch_all_recordings(), cameras)
+        >>> compact[0].camera is compact[1].camera
+        True
+    """
+
+    def __init__(self):
+        self._cameras: Dict[str, CompactCamera] = {}
+
+    def intern(self, camera: Camera) -> CompactCamera:
+        """
+        Get the shared record for a camera, creating it if needed.
+
+        Args:
+            camera: Camera model
+
+        Returns:
+            Shared CompactCamera object
+        """
+        compact = CompactCamera.from_model(camera)
+        existing = self._cameras.get(camera.id)
+        if existing is not None and existing == compact:
+            return existing
+        self._cameras[camera.id] = compact
+        return compact
+
+    def get(self, camera_id: str) -> Optional[CompactCamera]:
+        """Get the interned record for a camera ID."""
+        return self._cameras.get(camera_id)
+
+    def __len__(self) -> int:
+        return len(self._cameras)
+
+    def __contains__(self, camera_id: str) -> bool:
+        return camera_id in self._cameras
+
+
+def compact_recordings(
+    recordings: Iterable[Recording],
+    cameras: Optional[CameraInterner] = None,
+) -> List[CompactRecording]:
+    """
+    Convert recordings to compact records sharing camera records by ID.
+
+    Args:
+        recordings: Recording models
+        cameras: Interner to share cameras with (a new one is used if omitted)
+
+    Returns:
+        List of CompactRecording objects
+    """
+    if cameras is None:
+        cameras = CameraInterner()
+    return [CompactRecording.from_model(recording, cameras) for recording in recordings]
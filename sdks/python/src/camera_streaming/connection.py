@@ -0,0 +1,143 @@
+"""
+HTTP connection settings and response handling shared by the SDK clients.
+"""
+
+import base64
+import json
+from typing import Optional
+
+import httpx
+
+from .exceptions import (
+    AuthenticationError,
+    AuthorizationError,
+    CameraStreamingError,
+    NotFoundError,
+    RateLimitError,
+    ValidationError,
+)
+from .retry import parse_retry_after
+
+
+def build_limits(
+    max_connections: Optional[int] = 100,
+    max_keepalive_connections: Optional[int] = 20,
+    keepalive_expiry: Optional[float] = 5.0,
+) -> httpx.Limits:
+    """
+    Build connection pool limits.
+
+    Args:
+        max_connections: Maximum number of open connections (None for no limit)
+        max_keepalive_connections: Maximum number of idle connections kept alive
+        keepalive_expiry: Seconds an idle connection is kept alive
+
+    Returns:
+        httpx.Limits object
+    """
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+def build_timeout(
+    timeout: Optional[float],
+    connect_timeout: Optional[float] = None,
+    read_timeout: Optional[float] = None,
+    write_timeout: Optional[float] = None,
+    pool_timeout: Optional[float] = None,
+) -> httpx.Timeout:
+    """
+    Build per-phase timeouts, falling back to the overall timeout.
+
+    Args:
+        timeout: Default timeout in seconds for every phase
+        connect_timeout: Timeout for establishing a connection
+        read_timeout: Timeout for receiving a chunk of the response
+        write_timeout: Timeout for sending a chunk of the request
+        pool_timeout: Timeout for acquiring a connection from the pool
+
+    Returns:
+        httpx.Timeout object
+    """
+    return httpx.Timeout(
+        timeout,
+        connect=connect_timeout if connect_timeout is not None else timeout,
+        read=read_timeout if read_timeout is not None else timeout,
+        write=write_timeout if write_timeout is not None else timeout,
+        pool=pool_timeout if pool_timeout is not None else timeout,
+    )
+
+
+def check_http2_support(http2: bool) -> None:
+    """
+    Make sure HTTP/2 can be used when it is requested.
+
+    Raises:
+        ImportError: If http2 is enabled but the h2 package is not installed
+    """
+    if not http2:
+        return
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "HTTP/2 support requires the h2 package. "
+            "Install it with: pip install camera-streaming-sdk[http2]"
+        )
+
+
+def raise_for_status(response: httpx.Response) -> None:
+    """
+    Map an error response to the matching SDK exception.
+
+    Args:
+        response: HTTP response
+
+    Raises:
+        CameraStreamingError: If the response has an error status code
+    """
+    if response.status_code < 400:
+        return
+
+    error_data = response.json() if response.content else {}
+
+    if response.status_code == 400:
+        raise ValidationError(error_data.get("message", "Validation error"))
+    elif response.status_code == 401:
+        raise AuthenticationError(error_data.get("message", "Authentication failed"))
+    elif response.status_code == 403:
+        raise AuthorizationError(error_data.get("message", "Access denied"))
+    elif response.status_code == 404:
+        raise NotFoundError(error_data.get("message", "Resource not found"))
+    elif response.status_code == 429:
+        raise RateLimitError(
+            error_data.get("message", "Rate limit exceeded"),
+            retry_after=parse_retry_after(response.headers.get("Retry-After")),
+        )
+    else:
+        raise CameraStreamingError(
+            error_data.get("message", f"HTTP {response.status_code}"),
+            response.status_code
+        )
+
+
+def jwt_expiry(token: str) -> Optional[float]:
+    """
+    Read the ``exp`` claim of a JWT without verifying it.
+
+    Args:
+        token: Encoded JWT
+
+    Returns:
+        Expiry as a Unix timestamp, or None if the token carries none
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+    except (IndexError, ValueError, AttributeError):
+        return None
+    return float(exp) if isinstance(exp, (int, float)) else None
@@ -0,0 +1,547 @@
+"""
+Transport-independent core shared by the async and sync clients.
+"""
+
+import time
+from typing import Any, Callable, Dict, Generic, Optional, Tuple, Type, TypeVar, Union
+
+import httpx
+from pydantic import BaseModel
+
+from .bulk import in_bulk_operation
+from .cache import CacheEntry, CacheKey, ResponseCache
+from .connection import jwt_expiry
+from .exceptions import AuthenticationError, CameraStreamingError, NotFoundError
+from .lazy import listing_item_parser, listing_page_type
+from .models import (
+    AnalyticsOverview,
+    ApiResponse,
+    ApiToken,
+    Camera,
+    CameraFilters,
+    CreateApiTokenRequest,
+    CreateCameraRequest,
+    DashboardStats,
+    LoginRequest,
+    LoginResponse,
+    Page,
+    Recording,
+    RecordingFilters,
+    SystemHealth,
+    UpdateCameraRequest,
+    User,
+)
+from .retry import RetryPolicy, RetryState
+from .serialization import JSONBackend, get_json_backend
+
+T = TypeVar("T")
+
+MISSING = object()
+
+
+class ApiCall(Generic[T]):
+    """
+    One API call: the request to send and how to turn the response into a value.
+
+    ``cache_endpoint`` names the cache TTL of cacheable GET requests, and
+    ``invalidates`` lists the cached paths a successful call makes stale.
+    """
+
+    __slots__ = ("method", "path", "parse", "data", "params", "cache_endpoint", "variant", "invalidates")
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        parse: Callable[[httpx.Response], T],
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        cache_endpoint: Optional[str] = None,
+        variant: str = "",
+        invalidates: Tuple[str, ...] = (),
+    ):
+        self.method = method
+        self.path = path
+        self.parse = parse
+        self.data = data
+        self.params = params
+        self.cache_endpoint = cache_endpoint
+        self.variant = variant
+        self.invalidates = invalidates
+
+
+class ClientCore:
+    """
+    State and logic shared by CameraStreamingClient and SyncCameraStreamingClient.
+
+    Endpoints are described as :class:`ApiCall` objects, and tokens, the
+    response cache, retry decisions and response parsing are handled here.
+    The clients only add the I/O: sending requests, sleeping between
+    retries and coordinating token refreshes.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str],
+        timeout: float,
+        retries: int,
+        retry_delay: float,
+        retry_policy: Optional[RetryPolicy],
+        token_refresh_leeway: float,
+        cache: Optional[ResponseCache],
+        raw: bool,
+        lazy: bool,
+        json_backend: Union[str, JSONBackend, None],
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.timeout = timeout
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_retries=retries,
+            backoff_base=retry_delay,
+        )
+
+        self.token_refresh_leeway = token_refresh_leeway
+        self.json_backend = get_json_backend(json_backend)
+        self.cache = cache
+        if raw and lazy:
+            raise ValueError("raw and lazy cannot both be enabled")
+        self.raw = raw
+        self.lazy = lazy
+
+        self._access_token: Optional[str] = None
+        self._access_token_expires_at: Optional[float] = None
+        self._refresh_token: Optional[str] = None
+
+    # Requests
+    def _get_headers(self) -> Dict[str, str]:
+        """Get headers for API requests."""
+        headers = {}
+
+        if self._access_token:
+            headers["Authorization"] = f"Bearer {self._access_token}"
+        elif self.api_key:
+            headers["X-API-Key"] = self.api_key
+
+        return headers
+
+    def _build_request(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        **kwargs: Any,
+    ) -> httpx.Request:
+        """Build an authenticated request with a JSON body."""
+        request_headers = self._get_headers()
+        if headers:
+            request_headers.update(headers)
+
+        return self._client.build_request(
+            method=method,
+            url=url,
+            content=self.json_backend.dumps(data) if data is not None else None,
+            params=params,
+            headers=request_headers,
+            **kwargs,
+        )
+
+    def _retry_delay_after_error(self, method: str, error: Exception, retry_state: RetryState) -> Optional[float]:
+        """Get the delay before retrying a failed attempt, or None to give up."""
+        if not self.retry_policy.should_retry_exception(method, error):
+            return None
+        return retry_state.next_delay()
+
+    def _retry_delay_after_response(self, method: str, response: httpx.Response, retry_state: RetryState) -> Optional[float]:
+        """Get the delay before retrying a response, or None to return it."""
+        if not self.retry_policy.should_retry_response(method, response):
+            return None
+        if response.status_code == 429 and in_bulk_operation():
+            # The bulk runner's limiter backs off for the whole batch
+            return None
+        return retry_state.next_delay(self.retry_policy.get_retry_after(response))
+
+    def _read_response(self, call: ApiCall[T], response: httpx.Response) -> T:
+        """Invalidate the cache entries a call affects and parse its response."""
+        self._invalidate_cache(*call.invalidates)
+        return call.parse(response)
+
+    # Tokens
+    def _set_tokens(self, access_token: Optional[str], refresh_token: Optional[str] = None) -> None:
+        """Store new tokens and the expiry of the access token."""
+        self._access_token = access_token
+        self._access_token_expires_at = jwt_expiry(access_token) if access_token else None
+        if refresh_token:
+            self._refresh_token = refresh_token
+
+    def _clear_tokens(self) -> None:
+        """Forget all tokens and the responses cached for them."""
+        self._set_tokens(None)
+        self._refresh_token = None
+        self._clear_cache()
+
+    def _access_token_expiring(self) -> bool:
+        """Check whether the access token expires within the refresh leeway."""
+        if not self._refresh_token or self._access_token_expires_at is None:
+            return False
+        return time.time() >= self._access_token_expires_at - self.token_refresh_leeway
+
+    def _refresh_request(self) -> httpx.Request:
+        """Build the request exchanging the refresh token for a new access token."""
+        if not self._refresh_token:
+            raise AuthenticationError("No refresh token available")
+
+        return self._client.build_request(
+            "POST",
+            f"{self.base_url}/auth/refresh",
+            content=self.json_backend.dumps({"refreshToken": self._refresh_token}),
+        )
+
+    def _apply_refresh_response(self, response: httpx.Response) -> None:
+        """Store the tokens of a refresh response."""
+        if response.status_code == 200:
+            data = self.json_backend.loads(response.content)
+            if data.get("success") and data.get("data"):
+                self._set_tokens(data["data"]["accessToken"], data["data"].get("refreshToken"))
+            else:
+                raise AuthenticationError("Failed to refresh token")
+        else:
+            raise AuthenticationError("Failed to refresh token")
+
+    def is_authenticated(self) -> bool:
+        """Check if the client is authenticated."""
+        return bool(self._access_token or self.api_key)
+
+    def set_access_token(self, token: str) -> None:
+        """Set the access token manually."""
+        self._set_tokens(token)
+        self._clear_cache()
+
+    def set_api_key(self, api_key: str) -> None:
+        """Set the API key manually."""
+        self.api_key = api_key
+        self._clear_cache()
+
+    # Response cache
+    def _cache_ttl(self, call: ApiCall) -> float:
+        """Get the cache TTL of a call (0 if it is not cached)."""
+        if self.cache is None or call.cache_endpoint is None:
+            return 0.0
+        return self.cache.ttl_for(call.cache_endpoint)
+
+    def _cache_key(self, call: ApiCall) -> CacheKey:
+        return self.cache.make_key(call.path, call.params, call.variant)
+
+    def _cached_value(self, call: ApiCall) -> Any:
+        """Get the fresh cached value of a call, or MISSING."""
+        entry = self.cache.get(self._cache_key(call))
+        if entry is not None and entry.is_fresh():
+            self.cache.record_hit()
+            return entry.value
+        return MISSING
+
+    def _revalidation(self, call: ApiCall) -> Tuple[Optional[CacheEntry], Optional[Dict[str, str]]]:
+        """Get the stale entry of a call and the headers revalidating it."""
+        entry = self.cache.get(self._cache_key(call))
+        headers = {"If-None-Match": entry.etag} if entry is not None and entry.etag else None
+        return entry, headers
+
+    def _read_cached_response(
+        self,
+        call: ApiCall[T],
+        ttl: float,
+        entry: Optional[CacheEntry],
+        response: httpx.Response,
+    ) -> T:
+        """Turn a (possibly 304) response into a value and store it in the cache."""
+        key = self._cache_key(call)
+        if response.status_code == 304 and entry is not None:
+            self.cache.record_revalidation()
+            self.cache.touch(key, ttl)
+            return entry.value
+
+        self.cache.record_miss()
+        value = call.parse(response)
+        self.cache.set(key, value, ttl, response.headers.get("ETag"))
+        return value
+
+    def _invalidate_cache(self, *paths: str) -> None:
+        """Drop cached responses for the given paths."""
+        if self.cache is not None:
+            for path in paths:
+                self.cache.invalidate(path)
+
+    def _clear_cache(self) -> None:
+        """Drop all cached responses, e.g. when the credentials change."""
+        if self.cache is not None:
+            self.cache.clear()
+
+    # Response parsing
+    def _response_data(self, response: httpx.Response, error_message: str, not_found: bool = False) -> Dict[str, Any]:
+        """
+        Get the data of a successful API response.
+
+        Args:
+            response: HTTP response
+            error_message: Error message used if the API reports a failure
+            not_found: Report failures as NotFoundError with error_message
+
+        Raises:
+            CameraStreamingError: If the API reports a failure
+        """
+        api_response = ApiResponse(**self.json_backend.loads(response.content))
+
+        if api_response.success and api_response.data:
+            return api_response.data
+        if not_found:
+            raise NotFoundError(error_message)
+        raise CameraStreamingError(api_response.error or error_message)
+
+    def _check_success(self, response: httpx.Response, error_message: str) -> None:
+        """Raise if an API response reports a failure."""
+        api_response = ApiResponse(**self.json_backend.loads(response.content))
+
+        if not api_response.success:
+            raise CameraStreamingError(api_response.error or error_message)
+
+    def _success_call(self, method: str, path: str, error_message: str, *invalidates: str) -> ApiCall[None]:
+        return ApiCall(method, path, lambda response: self._check_success(response, error_message), invalidates=invalidates)
+
+    # Pagination
+    def _filter_params(self, filters: Optional[Union[CameraFilters, RecordingFilters]]) -> Dict[str, Any]:
+        """Convert filters into query parameters, dropping unset values."""
+        if not filters:
+            return {}
+        return {k: v for k, v in filters.model_dump().items() if v is not None}
+
+    def _listing_page_type(self, model: Type[BaseModel], raw: Optional[bool], lazy: Optional[bool]) -> Type[Page]:
+        """Get the page model for a listing, falling back to the client's raw/lazy defaults."""
+        if raw is None and lazy is None:
+            raw, lazy = self.raw, self.lazy
+        return listing_page_type(model, raw=bool(raw), lazy=bool(lazy), json_backend=self.json_backend)
+
+    def _listing_item_parser(
+        self,
+        model: Type[BaseModel],
+        raw: Optional[bool],
+        lazy: Optional[bool],
+    ) -> Callable[[Dict[str, Any]], Any]:
+        """Get the item parser for a listing, falling back to the client's raw/lazy defaults."""
+        if raw is None and lazy is None:
+            raw, lazy = self.raw, self.lazy
+        return listing_item_parser(model, raw=bool(raw), lazy=bool(lazy))
+
+    def _page_call(self, endpoint: str, page_type: Type[Page], params: Dict[str, Any], error_message: str) -> ApiCall[Page]:
+        """
+        Describe the request for a single page of a paginated listing.
+
+        The envelope and all items are validated in one pass from the raw
+        response body.
+
+        Args:
+            endpoint: API endpoint
+            page_type: Parametrized page model, e.g. Page[Camera]
+            params: Query parameters, including limit and offset
+            error_message: Error message used if the API reports a failure
+        """
+        def parse(response: httpx.Response) -> Page:
+            paginated_response = page_type.model_validate_json(response.content)
+
+            if not paginated_response.success:
+                raise CameraStreamingError(paginated_response.error or error_message)
+            return paginated_response
+
+        return ApiCall("GET", endpoint, parse, params=params, cache_endpoint=endpoint.strip("/"), variant=page_type.__name__)
+
+    def _page_calls(
+        self,
+        endpoint: str,
+        page_type: Type[Page],
+        filters: Optional[Union[CameraFilters, RecordingFilters]],
+        page_size: Optional[int],
+        error_message: str,
+    ) -> Tuple[Callable[[int, int], ApiCall[Page]], int, int]:
+        """
+        Describe the page requests of a listing.
+
+        Returns:
+            Tuple of (page call for an offset and limit, first offset, page size)
+        """
+        params = self._filter_params(filters)
+        offset = params.pop("offset", 0) or 0
+        limit = params.pop("limit", None)
+        page_size = page_size or limit or 50
+
+        def page_call(page_offset: int, page_limit: int) -> ApiCall[Page]:
+            page_params = {**params, "limit": page_limit, "offset": page_offset}
+            return self._page_call(endpoint, page_type, page_params, error_message)
+
+        return page_call, offset, page_size
+
+    def _check_stream_envelope(self, envelope: Dict[str, Any], error_message: str) -> None:
+        """Raise if a streamed listing reports a failure."""
+        if not envelope.get("success"):
+            raise CameraStreamingError(envelope.get("error") or error_message)
+
+    # Endpoints
+    def _login_call(self, username: str, password: str) -> ApiCall[User]:
+        def parse(response: httpx.Response) -> User:
+            login_response = LoginResponse(**self.json_backend.loads(response.content))
+
+            if login_response.success and login_response.data:
+                self._refresh_token = None
+                self._set_tokens(login_response.access_token, login_response.refresh_token)
+                self._clear_cache()
+                return login_response.user
+            else:
+                raise AuthenticationError(login_response.error or "Login failed")
+
+        request = LoginRequest(username=username, password=password)
+        return ApiCall("POST", "/auth/login", parse, data=request.model_dump())
+
+    def _logout_call(self) -> ApiCall[None]:
+        return ApiCall("POST", "/auth/logout", lambda response: None, data={"refreshToken": self._refresh_token})
+
+    def _profile_call(self) -> ApiCall[User]:
+        def parse(response: httpx.Response) -> User:
+            return User(**self._response_data(response, "Failed to get profile")["user"])
+
+        return ApiCall("GET", "/auth/profile", parse, cache_endpoint="profile")
+
+    def _cameras_call(self, filters: Optional[CameraFilters], raw: Optional[bool], lazy: Optional[bool]) -> ApiCall[Page]:
+        page_type = self._listing_page_type(Camera, raw, lazy)
+        return self._page_call("/cameras", page_type, self._filter_params(filters), "Failed to get cameras")
+
+    def _camera_call(self, camera_id: str) -> ApiCall[Camera]:
+        def parse(response: httpx.Response) -> Camera:
+            return Camera(**self._response_data(response, f"Camera with ID {camera_id} not found", not_found=True)["camera"])
+
+        return ApiCall("GET", f"/cameras/{camera_id}", parse, cache_endpoint="camera")
+
+    def _create_camera_call(self, camera_data: CreateCameraRequest) -> ApiCall[Camera]:
+        def parse(response: httpx.Response) -> Camera:
+            return Camera(**self._response_data(response, "Failed to create camera")["camera"])
+
+        return ApiCall("POST", "/cameras", parse, data=camera_data.model_dump(), invalidates=("/dashboard/stats",))
+
+    def _update_camera_call(self, camera_id: str, updates: UpdateCameraRequest) -> ApiCall[Camera]:
+        def parse(response: httpx.Response) -> Camera:
+            return Camera(**self._response_data(response, "Failed to update camera")["camera"])
+
+        return ApiCall(
+            "PUT",
+            f"/cameras/{camera_id}",
+            parse,
+            data=updates.model_dump(exclude_unset=True),
+            invalidates=self._camera_paths(camera_id),
+        )
+
+    def _delete_camera_call(self, camera_id: str) -> ApiCall[None]:
+        return self._success_call("DELETE", f"/cameras/{camera_id}", "Failed to delete camera", *self._camera_paths(camera_id))
+
+    def _activate_camera_call(self, camera_id: str) -> ApiCall[None]:
+        return self._success_call(
+            "POST", f"/cameras/{camera_id}/activate", "Failed to activate camera", *self._camera_paths(camera_id)
+        )
+
+    def _deactivate_camera_call(self, camera_id: str) -> ApiCall[None]:
+        return self._success_call(
+            "POST", f"/cameras/{camera_id}/deactivate", "Failed to deactivate camera", *self._camera_paths(camera_id)
+        )
+
+    def _toggle_recording_call(self, camera_id: str) -> ApiCall[bool]:
+        def parse(response: httpx.Response) -> bool:
+            return self._response_data(response, "Failed to toggle recording")["isRecording"]
+
+        return ApiCall("POST", f"/cameras/{camera_id}/toggle-recording", parse, invalidates=self._camera_paths(camera_id))
+
+    def _camera_paths(self, camera_id: str) -> Tuple[str, ...]:
+        """Get the cached paths affected by a change to a camera."""
+        return f"/cameras/{camera_id}", f"/streaming/hls/{camera_id}", "/dashboard/stats"
+
+    def _recordings_call(self, filters: Optional[RecordingFilters], raw: Optional[bool], lazy: Optional[bool]) -> ApiCall[Page]:
+        page_type = self._listing_page_type(Recording, raw, lazy)
+        return self._page_call("/recordings", page_type, self._filter_params(filters), "Failed to get recordings")
+
+    def _recording_call(self, recording_id: str) -> ApiCall[Recording]:
+        def parse(response: httpx.Response) -> Recording:
+            data = self._response_data(response, f"Recording with ID {recording_id} not found", not_found=True)
+            return Recording(**data["recording"])
+
+        return ApiCall("GET", f"/recordings/{recording_id}", parse, cache_endpoint="recording")
+
+    def _recording_download_url_call(self, recording_id: str) -> ApiCall[str]:
+        def parse(response: httpx.Response) -> str:
+            return self._response_data(response, "Failed to get download URL")["downloadUrl"]
+
+        return ApiCall("GET", f"/recordings/{recording_id}/download", parse, cache_endpoint="recording_download_url")
+
+    def _delete_recording_call(self, recording_id: str) -> ApiCall[None]:
+        return self._success_call(
+            "DELETE", f"/recordings/{recording_id}", "Failed to delete recording", f"/recordings/{recording_id}", "/dashboard/stats"
+        )
+
+    def _api_tokens_call(self) -> ApiCall[list]:
+        def parse(response: httpx.Response) -> list:
+            return [ApiToken(**token) for token in self._response_data(response, "Failed to get API tokens")["tokens"]]
+
+        return ApiCall("GET", "/auth/api-tokens", parse, cache_endpoint="api_tokens")
+
+    def _create_api_token_call(self, token_data: CreateApiTokenRequest) -> ApiCall[Dict[str, Any]]:
+        def parse(response: httpx.Response) -> Dict[str, Any]:
+            data = self._response_data(response, "Failed to create API token")
+            return {
+                "token": ApiToken(**data["token"]),
+                "api_key": data["apiKey"]
+            }
+
+        return ApiCall("POST", "/auth/api-tokens", parse, data=token_data.model_dump())
+
+    def _delete_api_token_call(self, token_id: str) -> ApiCall[None]:
+        return self._success_call("DELETE", f"/auth/api-tokens/{token_id}", "Failed to delete API token")
+
+    def _dashboard_stats_call(self) -> ApiCall[DashboardStats]:
+        def parse(response: httpx.Response) -> DashboardStats:
+            return DashboardStats(**self._response_data(response, "Failed to get dashboard stats"))
+
+        return ApiCall("GET", "/dashboard/stats", parse, cache_endpoint="dashboard_stats")
+
+    def _system_health_call(self) -> ApiCall[SystemHealth]:
+        def parse(response: httpx.Response) -> SystemHealth:
+            return SystemHealth(**self._response_data(response, "Failed to get system health"))
+
+        return ApiCall("GET", "/dashboard/health", parse, cache_endpoint="system_health")
+
+    def _analytics_overview_call(self, time_range: str) -> ApiCall[AnalyticsOverview]:
+        def parse(response: httpx.Response) -> AnalyticsOverview:
+            return AnalyticsOverview(**self._response_data(response, "Failed to get analytics overview"))
+
+        return ApiCall("GET", f"/analytics/overview?timeRange={time_range}", parse, cache_endpoint="analytics_overview")
+
+    def _stream_url_call(self, camera_id: str, quality: Optional[str]) -> ApiCall[str]:
+        def parse(response: httpx.Response) -> str:
+            return self._response_data(response, "Failed to get stream URL")["streamUrl"]
+
+        params = {"quality": quality} if quality else {}
+        return ApiCall("GET", f"/streaming/hls/{camera_id}", parse, params=params, cache_endpoint="stream_url")
+
+    def _webrtc_offer_call(self, camera_id: str) -> ApiCall[Dict[str, Any]]:
+        return ApiCall(
+            "POST",
+            f"/streaming/webrtc/{camera_id}/offer",
+            lambda response: self._response_data(response, "Failed to get WebRTC offer"),
+        )
+
+    def _webrtc_answer_call(self, camera_id: str, answer: Dict[str, Any]) -> ApiCall[None]:
+        return ApiCall(
+            "POST",
+            f"/streaming/webrtc/{camera_id}/answer",
+            lambda response: self._check_success(response, "Failed to send WebRTC answer"),
+            data=answer,
+        )
+
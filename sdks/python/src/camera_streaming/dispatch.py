@@ -0,0 +1,502 @@
+"""
+Concurrent, bounded dispatch of WebSocket events to handlers.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from concurrent.futures import Executor
+from enum import Enum
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+EventKey = Callable[[Any], Optional[Hashable]]
+
+_UNPARSED = object()
+
+
+class QueueClosed(Exception):
+    """Raised by :meth:`EventQueue.get` once the queue is closed and empty."""
+
+
+class OverflowPolicy(str, Enum):
+    """What to do with a new event when an event queue is full."""
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
+
+
+def default_event_key(data: Any) -> Optional[Hashable]:
+    """Key events by camera ID, for models and raw message data alike."""
+    camera_id = getattr(data, "camera_id", None)
+    if camera_id is None and isinstance(data, dict):
+        camera_id = data.get("cameraId")
+    return camera_id
+
+
+async def call_handler(
+    handler: Callable,
+    data: Any,
+    executor: Optional[Executor] = None,
+    run_sync_in_thread: bool = True,
+) -> None:
+    """
+    Call an event handler, awaiting coroutine functions.
+
+    Args:
+        handler: Sync or async handler
+        data: Event payload
+        executor: Thread pool for sync handlers (the loop's default if None)
+        run_sync_in_thread: Whether sync handlers run off the event loop
+    """
+    if asyncio.iscoroutinefunction(handler):
+        await handler(data)
+    elif run_sync_in_thread:
+        await asyncio.get_running_loop().run_in_executor(executor, handler, data)
+    else:
+        handler(data)
+
+
+class EventQueue:
+    """
+    Bounded FIFO of pending events with an overflow policy.
+
+    With ``block`` a full queue makes :meth:`put` wait for space, with
+    ``drop_oldest`` the oldest pending event is discarded, and with
+    ``coalesce`` a pending event with the same key is replaced in place by
+    the newer one (a full queue of distinct keys blocks).
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1000,
+        overflow: Union[OverflowPolicy, str] = OverflowPolicy.BLOCK,
+        key: Optional[EventKey] = None,
+    ):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+
+        self.maxsize = maxsize
+        self.overflow = OverflowPolicy(overflow)
+        self.key = key or default_event_key
+
+        self.dropped = 0
+        self.coalesced = 0
+        self.closed = False
+
+        self._items: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._not_empty: Optional[asyncio.Event] = None
+        self._not_full: Optional[asyncio.Event] = None
+
+    async def put(self, item: Any) -> None:
+        """Queue an event, applying the overflow policy when full (ignored once closed)."""
+        if self._not_empty is None:
+            self._not_empty = asyncio.Event()
+            self._not_full = asyncio.Event()
+        if self.closed:
+            return
+
+        key = None
+        if self.overflow == OverflowPolicy.COALESCE:
+            key = self.key(item)
+            if key is not None and key in self._items:
+                self._items[key] = item
+                self.coalesced += 1
+                return
+
+        while len(self._items) >= self.maxsize:
+            if self.overflow == OverflowPolicy.DROP_OLDEST:
+                self._items.popitem(last=False)
+                self.dropped += 1
+            else:
+                self._not_full.clear()
+                await self._not_full.wait()
+                if self.closed:
+                    return
+
+        self._items[key if key is not None else object()] = item
+        self._not_empty.set()
+
+    async def get(self) -> Any:
+        """
+        Wait for and remove the oldest pending event.
+
+        Raises:
+            QueueClosed: If the queue is closed and no events are left
+        """
+        if self._not_empty is None:
+            self._not_empty = asyncio.Event()
+            self._not_full = asyncio.Event()
+
+        while not self._items:
+            if self.closed:
+                raise QueueClosed()
+            self._not_empty.clear()
+            await self._not_empty.wait()
+
+        _, item = self._items.popitem(last=False)
+        self._not_full.set()
+        return item
+
+    def close(self) -> None:
+        """Stop accepting events and wake up waiting producers and consumers."""
+        self.closed = True
+        if self._not_empty is not None:
+            self._not_empty.set()
+            self._not_full.set()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class EventStream:
+    """
+    Async iterator over the events of one type.
+
+    Created by :meth:`WebSocketClient.events`. Events are buffered in a
+    bounded queue; with the ``block`` policy a full buffer pauses reading
+    the socket until the consumer catches up. Leaving the ``async for``
+    loop, closing the stream or disconnecting the client ends it.
+    """
+
+    def __init__(
+        self,
+        event_type: str,
+        camera_ids: Optional[Iterable[str]] = None,
+        maxsize: int = 1000,
+        overflow: Union[OverflowPolicy, str] = OverflowPolicy.BLOCK,
+        raw: bool = False,
+        on_close: Optional[Callable[["EventStream"], None]] = None,
+    ):
+        """
+        Initialize the stream.
+
+        Args:
+            event_type: Event type, e.g. "cameraStatusUpdate"
+            camera_ids: Only deliver events of these cameras (all events if None)
+            maxsize: Maximum number of buffered events
+            overflow: Overflow policy ("block", "drop_oldest" or "coalesce")
+            raw: Deliver raw message data instead of models
+            on_close: Called once when the stream is closed
+        """
+        self.event_type = event_type
+        self.camera_ids = frozenset(camera_ids) if camera_ids is not None else None
+        self.queue = EventQueue(maxsize=maxsize, overflow=overflow)
+        self.raw = raw
+        self._on_close = on_close
+
+    def accepts(self, data: Any) -> bool:
+        """Check an event's raw data against the camera filter, before it is parsed."""
+        return self.camera_ids is None or default_event_key(data) in self.camera_ids
+
+    async def put(self, event: Any) -> None:
+        """Buffer an event for the consumer."""
+        await self.queue.put(event)
+
+    def close(self) -> None:
+        """Stop the stream; buffered events are still delivered."""
+        if self.queue.closed:
+            return
+        self.queue.close()
+        if self._on_close is not None:
+            self._on_close(self)
+
+    @property
+    def closed(self) -> bool:
+        return self.queue.closed
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[Any]:
+        try:
+            while True:
+                try:
+                    event = await self.queue.get()
+                except QueueClosed:
+                    return
+                yield event
+        finally:
+            self.close()
+
+    async def __aenter__(self) -> "EventStream":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class EventCoalescer:
+    """
+    Keeps only the latest event per key and flushes them as one batch.
+
+    A batch is flushed ``interval`` seconds after its first event arrived,
+    or as soon as it holds ``max_batch`` distinct keys, whichever comes
+    first. Events without a key are passed through in the batch unchanged.
+    """
+
+    def __init__(
+        self,
+        event_types: Iterable[str],
+        flush: Callable[[str, List[Any]], Awaitable[None]],
+        interval: float = 0.1,
+        max_batch: int = 1000,
+        key: Optional[EventKey] = None,
+    ):
+        """
+        Initialize the coalescer.
+
+        Args:
+            event_types: Event types to coalesce
+            flush: Coroutine function receiving each event type's batch
+            interval: Maximum seconds an event waits before its batch is flushed
+            max_batch: Number of distinct keys that triggers an immediate flush
+            key: Coalescing key of an event (camera ID by default)
+        """
+        if max_batch <= 0:
+            raise ValueError("max_batch must be positive")
+
+        self.event_types = frozenset(event_types)
+        self.interval = interval
+        self.max_batch = max_batch
+        self.key = key or default_event_key
+        self.coalesced = 0
+
+        self._flush = flush
+        self._pending: Dict[str, Dict[Hashable, Any]] = {}
+        self._timers: Dict[str, asyncio.Task] = {}
+
+    async def add(self, event_type: str, data: Any) -> None:
+        """Record an event, replacing a pending one with the same key."""
+        pending = self._pending.setdefault(event_type, {})
+        key = self.key(data)
+        if key is None:
+            key = object()
+        elif key in pending:
+            self.coalesced += 1
+        pending[key] = data
+
+        if len(pending) >= self.max_batch:
+            await self.flush(event_type)
+        elif event_type not in self._timers:
+            self._timers[event_type] = asyncio.ensure_future(self._flush_later(event_type))
+
+    async def flush(self, event_type: Optional[str] = None) -> None:
+        """Flush the pending batch of one event type, or of all of them."""
+        for name in [event_type] if event_type is not None else list(self._pending):
+            timer = self._timers.pop(name, None)
+            if timer is not None and timer is not asyncio.current_task():
+                timer.cancel()
+
+            batch = self._pending.pop(name, None)
+            if batch:
+                await self._flush(name, list(batch.values()))
+
+    async def close(self) -> None:
+        """Cancel pending flushes and discard unflushed events."""
+        timers = list(self._timers.values())
+        self._timers.clear()
+        self._pending.clear()
+        for timer in timers:
+            timer.cancel()
+        await asyncio.gather(*timers, return_exceptions=True)
+
+    def stats(self) -> Dict[str, int]:
+        """Get the number of pending events and of events superseded so far."""
+        return {
+            "pending": sum(len(batch) for batch in self._pending.values()),
+            "coalesced": self.coalesced,
+        }
+
+    async def _flush_later(self, event_type: str) -> None:
+        await asyncio.sleep(self.interval)
+        try:
+            await self.flush(event_type)
+        except Exception as e:
+            logger.error(f"Failed to flush coalesced {event_type} events: {e}")
+
+
+class _EventChannel:
+    """Queue and worker tasks of one event type."""
+
+    def __init__(self, queue: EventQueue, workers: int):
+        self.queue = queue
+        self.workers = workers
+        self.tasks: List[asyncio.Task] = []
+        self.busy = 0
+
+
+class EventDispatcher:
+    """
+    Runs event handlers on per-event worker pools fed by bounded queues.
+
+    :meth:`dispatch` only queues the event, so the caller (the WebSocket
+    read loop) keeps going while handlers run. Each event type gets its own
+    queue and workers; with one worker, events of a type are handled in
+    arrival order. Sync handlers run on a thread pool so they never block
+    the event loop, unless ``run_sync_in_thread`` is False.
+
+    With a ``parse`` function, events are queued as raw data and parsed by
+    the worker, once, only if a handler that is not raw needs the model.
+    """
+
+    def __init__(
+        self,
+        get_handlers: Callable[[str], List[Callable]],
+        workers: int = 1,
+        queue_size: int = 1000,
+        overflow: Union[OverflowPolicy, str] = OverflowPolicy.BLOCK,
+        executor: Optional[Executor] = None,
+        run_sync_in_thread: bool = True,
+        parse: Optional[Callable[[str, Any], Any]] = None,
+        is_raw: Optional[Callable[[str, Callable], bool]] = None,
+    ):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            get_handlers: Returns the current handlers of an event type
+            workers: Default number of concurrent workers per event type
+            queue_size: Default maximum number of pending events per event type
+            overflow: Default overflow policy ("block", "drop_oldest" or "coalesce")
+            executor: Thread pool for sync handlers (the loop's default if None)
+            run_sync_in_thread: Whether sync handlers run off the event loop
+            parse: Builds the model of an event type from its raw data
+            is_raw: Tells whether a handler wants the raw data instead of the model
+        """
+        if workers <= 0:
+            raise ValueError("workers must be positive")
+
+        self.get_handlers = get_handlers
+        self.workers = workers
+        self.queue_size = queue_size
+        self.overflow = OverflowPolicy(overflow)
+        self.executor = executor
+        self.run_sync_in_thread = run_sync_in_thread
+        self.parse = parse
+        self.is_raw = is_raw
+
+        self._settings: Dict[str, Dict[str, Any]] = {}
+        self._channels: Dict[str, _EventChannel] = {}
+        self._idle: Optional[asyncio.Event] = None
+
+    def configure(
+        self,
+        event_type: str,
+        workers: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        overflow: Optional[Union[OverflowPolicy, str]] = None,
+        key: Optional[EventKey] = None,
+    ) -> None:
+        """
+        Override the dispatch settings of one event type.
+
+        Must be called before the first event of that type is dispatched.
+
+        Args:
+            event_type: Event type, e.g. "cameraStatusUpdate"
+            workers: Number of concurrent workers
+            queue_size: Maximum number of pending events
+            overflow: Overflow policy ("block", "drop_oldest" or "coalesce")
+            key: Coalescing key of an event (camera ID by default)
+        """
+        if event_type in self._channels:
+            raise ValueError(f"Dispatch for {event_type!r} is already running")
+        if workers is not None and workers <= 0:
+            raise ValueError("workers must be positive")
+
+        settings = self._settings.setdefault(event_type, {})
+        for name, value in (("workers", workers), ("queue_size", queue_size), ("overflow", overflow), ("key", key)):
+            if value is not None:
+                settings[name] = OverflowPolicy(value) if name == "overflow" else value
+
+    async def dispatch(self, event_type: str, data: Any) -> None:
+        """
+        Queue an event for its handlers.
+
+        Returns immediately unless the event's queue is full with the
+        ``block`` policy. Events without handlers are skipped.
+        """
+        if not self.get_handlers(event_type):
+            return
+
+        channel = self._channels.get(event_type)
+        if channel is None:
+            channel = self._start_channel(event_type)
+        await channel.queue.put(data)
+
+    async def drain(self) -> None:
+        """Wait until every queued event has been handled."""
+        if self._idle is None:
+            self._idle = asyncio.Event()
+        while not self._is_idle():
+            self._idle.clear()
+            await self._idle.wait()
+
+    async def close(self) -> None:
+        """Stop all workers, discarding events that are still queued."""
+        tasks = [task for channel in self._channels.values() for task in channel.tasks]
+        self._channels.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._idle is not None:
+            self._idle.set()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Get queue depth, busy workers and overflow counters per event type."""
+        return {
+            event_type: {
+                "queued": len(channel.queue),
+                "busy": channel.busy,
+                "dropped": channel.queue.dropped,
+                "coalesced": channel.queue.coalesced,
+            }
+            for event_type, channel in self._channels.items()
+        }
+
+    def _start_channel(self, event_type: str) -> _EventChannel:
+        settings = self._settings.get(event_type, {})
+        queue = EventQueue(
+            maxsize=settings.get("queue_size", self.queue_size),
+            overflow=settings.get("overflow", self.overflow),
+            key=settings.get("key"),
+        )
+        channel = _EventChannel(queue, settings.get("workers", self.workers))
+        channel.tasks = [
+            asyncio.ensure_future(self._worker(event_type, channel))
+            for _ in range(channel.workers)
+        ]
+        self._channels[event_type] = channel
+        return channel
+
+    async def _worker(self, event_type: str, channel: _EventChannel) -> None:
+        while True:
+            data = await channel.queue.get()
+            channel.busy += 1
+            try:
+                event = _UNPARSED
+                for handler in self.get_handlers(event_type):
+                    payload = data
+                    if self.parse is not None and not (self.is_raw is not None and self.is_raw(event_type, handler)):
+                        if event is _UNPARSED:
+                            try:
+                                event = self.parse(event_type, data)
+                            except Exception as e:
+                                logger.error(f"Failed to parse {event_type} event: {e}")
+                                event = None
+                        if event is None:
+                            continue
+                        payload = event
+                    try:
+                        await call_handler(handler, payload, self.executor, self.run_sync_in_thread)
+                    except Exception as e:
+                        logger.error(f"Error in event handler for {event_type}: {e}")
+            finally:
+                channel.busy -= 1
+                if self._idle is not None and self._is_idle():
+                    self._idle.set()
+
+    def _is_idle(self) -> bool:
+        return all(not channel.queue and not channel.busy for channel in self._channels.values())
@@ -2,11 +2,13 @@
 Exception classes for the Camera Streaming Platform SDK.
 """
 
+from typing import Optional
+
 
 class CameraStreamingError(Exception):
     """Base exception for Camera Streaming SDK."""
     
-    def __init__(self, message: str, status_code: int = None):
+    def __init__(self, message: str, status_code: Optional[int] = None):
         super().__init__(message)
         self.message = message
         self.status_code = status_code
@@ -34,7 +36,10 @@ class ValidationError(CameraStreamingError):
 
 class RateLimitError(CameraStreamingError):
     """Raised when rate limit is exceeded."""
-    pass
+
+    def __init__(self, message: str, status_code: int = 429, retry_after: Optional[float] = None):
+        super().__init__(message, status_code)
+        self.retry_after = retry_after
 
 
 class NetworkError(CameraStreamingError):
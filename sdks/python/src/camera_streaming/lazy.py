@@ -0,0 +1,233 @@
+"""
+Lazily validated response models for high-volume reads.
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, ClassVar, Dict, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import PydanticUndefined
+
+from .models import Page
+from .serialization import JSONBackend, get_json_backend
+
+_MISSING = object()
+_SCALAR_TYPES = (str, int, float, bool)
+
+
+class RawPage(Page[Dict[str, Any]]):
+    """
+    Page whose items are kept as decoded JSON objects.
+
+    Only the envelope (success flag, totals, errors) is validated; the
+    items are used exactly as the JSON decoder produced them. The body is
+    decoded with ``json_backend``, or the default backend when unset.
+    """
+
+    item_factory: ClassVar[Optional[Callable[[Dict[str, Any]], Any]]] = None
+    json_backend: ClassVar[Optional[JSONBackend]] = None
+
+    @classmethod
+    def model_validate_json(cls, json_data: Union[str, bytes, bytearray], **kwargs: Any) -> "RawPage":
+        body = (cls.json_backend or get_json_backend()).loads(json_data)
+        data = body.get("data") if isinstance(body, dict) else None
+        items = data.get("items") if isinstance(data, dict) else None
+        if not isinstance(items, list):
+            return cls.model_validate(body, **kwargs)
+
+        page = cls.model_validate({**body, "data": {**data, "items": []}}, **kwargs)
+        page.data.items = items if cls.item_factory is None else [cls.item_factory(item) for item in items]
+        return page
+
+
+class LazyModel:
+    """
+    Read-only proxy over the raw JSON object of a model.
+
+    Fields are validated with the model's field types the first time they
+    are read and the result is kept on the proxy; fields that are never read
+    are never parsed. Nested models are returned as lazy proxies as well.
+
+    Use :func:`lazy_model` to get the proxy class for a model.
+
+    Example:
+        >>> recordings = await client.get_recordings(lazy=True)
+        >>> recordings[0].file_size        # only fileSize is validated
+        1048576
+        >>> recordings[0].to_model()       # full Recording when needed
+    """
+
+    __slots__ = ("_raw", "_values")
+
+    model: ClassVar[Type[BaseModel]]
+    _fields: ClassVar[Dict[str, Tuple[str, Any, Optional[type]]]]
+    _validators: ClassVar[Dict[str, Any]]
+
+    def __init__(self, raw: Dict[str, Any]):
+        self._raw = raw
+        self._values: Optional[Dict[str, Any]] = None
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """Get the underlying JSON object."""
+        return self._raw
+
+    def to_model(self) -> BaseModel:
+        """Validate every field and return the full model."""
+        return self.model.model_validate(self._raw)
+
+    def __getattr__(self, name: str) -> Any:
+        field = self._fields.get(name)
+        if field is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+        if self._values is None:
+            self._values = {}
+        elif name in self._values:
+            return self._values[name]
+
+        key, info, scalar_type = field
+        value = self._raw.get(key, _MISSING)
+        if value is _MISSING:
+            value = self._raw.get(name, _MISSING)
+
+        if value is _MISSING:
+            if info.default is PydanticUndefined and info.default_factory is None:
+                raise AttributeError(f"{self.model.__name__} response has no field {key!r}")
+            value = info.get_default(call_default_factory=True)
+        elif type(value) is not scalar_type:
+            value = self._validator(name, info)(value)
+
+        self._values[name] = value
+        return value
+
+    @classmethod
+    def _validator(cls, name: str, info: Any) -> Any:
+        validator = cls._validators.get(name)
+        if validator is None:
+            annotation = info.annotation
+            if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+                validator = lazy_model(annotation)
+            else:
+                validator = TypeAdapter(annotation).validate_python
+            cls._validators[name] = validator
+        return validator
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self._fields))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyModel):
+            return self.model is other.model and self._raw == other._raw
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._raw!r})"
+
+
+@lru_cache(maxsize=None)
+def lazy_model(model: Type[BaseModel]) -> Type[LazyModel]:
+    """
+    Get the lazy proxy class for a model.
+
+    Args:
+        model: Pydantic model class, e.g. Recording
+
+    Returns:
+        LazyModel subclass whose instances behave like read-only models
+    """
+    # Plain scalars that already have the declared type need no validation
+    fields = {
+        name: (info.alias or name, info, info.annotation if info.annotation in _SCALAR_TYPES else None)
+        for name, info in model.model_fields.items()
+    }
+    return type(
+        f"Lazy{model.__name__}",
+        (LazyModel,),
+        {"__slots__": (), "model": model, "_fields": fields, "_validators": {}},
+    )
+
+
+@lru_cache(maxsize=None)
+def lazy_page(model: Type[BaseModel]) -> Type[RawPage]:
+    """
+    Get the page model whose items are lazy proxies of a model.
+
+    Args:
+        model: Item model, e.g. Recording
+
+    Returns:
+        RawPage subclass wrapping each item in ``lazy_model(model)``
+    """
+    namespace = {"__module__": __name__, "item_factory": lazy_model(model)}
+    return type(f"Lazy{model.__name__}Page", (RawPage,), namespace)
+
+
+def listing_item_parser(
+    model: Type[BaseModel],
+    raw: bool = False,
+    lazy: bool = False,
+) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Get the function turning one decoded listing item into the requested form.
+
+    Args:
+        model: Item model of the listing
+        raw: Keep items as plain dicts
+        lazy: Wrap items in lazily validated proxies
+
+    Returns:
+        Function called with each decoded JSON object
+    """
+    if raw and lazy:
+        raise ValueError("raw and lazy cannot both be enabled")
+    if raw:
+        return _identity
+    if lazy:
+        return lazy_model(model)
+    return model.model_validate
+
+
+def _identity(item: Dict[str, Any]) -> Dict[str, Any]:
+    return item
+
+
+def listing_page_type(
+    model: Type[BaseModel],
+    raw: bool = False,
+    lazy: bool = False,
+    json_backend: Optional[JSONBackend] = None,
+) -> Type[Page]:
+    """
+    Get the page model used to parse a listing in the requested mode.
+
+    Args:
+        model: Item model of the listing
+        raw: Return items as plain dicts
+        lazy: Return items as lazily validated proxies
+        json_backend: Backend decoding raw and lazy pages, e.g. the
+            client's; the default backend is used if None
+
+    Returns:
+        Parametrized page model
+    """
+    if raw and lazy:
+        raise ValueError("raw and lazy cannot both be enabled")
+    if raw:
+        page_type = RawPage
+    elif lazy:
+        page_type = lazy_page(model)
+    else:
+        return Page[model]
+    if json_backend is None:
+        return page_type
+    return _bind_json_backend(page_type, json_backend)
+
+
+@lru_cache(maxsize=128)
+def _bind_json_backend(page_type: Type[RawPage], json_backend: JSONBackend) -> Type[RawPage]:
+    """Get a subclass of a raw page model that decodes with the given backend."""
+    namespace = {"__module__": __name__, "json_backend": json_backend}
+    return type(page_type.__name__, (page_type,), namespace)
@@ -4,9 +4,11 @@ Data models for the Camera Streaming Platform SDK.
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+T = TypeVar("T")
 
 
 class UserRole(str, Enum):
@@ -42,8 +44,7 @@ class User(BaseModel):
     created_at: datetime = Field(alias="createdAt")
     updated_at: datetime = Field(alias="updatedAt")
 
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class Camera(BaseModel):
@@ -62,8 +63,7 @@ class Camera(BaseModel):
     created_at: datetime = Field(alias="createdAt")
     updated_at: datetime = Field(alias="updatedAt")
 
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class Recording(BaseModel):
@@ -81,8 +81,7 @@ class Recording(BaseModel):
     created_at: datetime = Field(alias="createdAt")
     updated_at: datetime = Field(alias="updatedAt")
 
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class ApiToken(BaseModel):
@@ -98,8 +97,7 @@ class ApiToken(BaseModel):
     created_at: datetime = Field(alias="createdAt")
     updated_at: datetime = Field(alias="updatedAt")
 
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class ServiceStatus(BaseModel):
@@ -109,8 +107,7 @@ class ServiceStatus(BaseModel):
     last_check: datetime = Field(alias="lastCheck")
     details: Optional[Dict[str, Any]] = None
 
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class SystemHealth(BaseModel):
@@ -132,8 +129,7 @@ class DashboardStats(BaseModel):
     active_streams: int = Field(alias="activeStreams")
     system_health: str = Field(alias="systemHealth")
 
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class DataPoint(BaseModel):
@@ -151,8 +147,7 @@ class AnalyticsMetrics(BaseModel):
     stream_quality: float = Field(alias="streamQuality")
     storage_usage: int = Field(alias="storageUsage")
 
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class AnalyticsTrends(BaseModel):
@@ -162,8 +157,7 @@ class AnalyticsTrends(BaseModel):
     errors: List[DataPoint]
     camera_status: List[DataPoint] = Field(alias="cameraStatus")
 
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class AnalyticsOverview(BaseModel):
@@ -172,8 +166,7 @@ class AnalyticsOverview(BaseModel):
     metrics: AnalyticsMetrics
     trends: AnalyticsTrends
 
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 # Request models
@@ -193,8 +186,7 @@ class CreateCameraRequest(BaseModel):
     place: str
     is_recording: bool = Field(default=True, alias="isRecording")
 
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class UpdateCameraRequest(BaseModel):
@@ -206,8 +198,7 @@ class UpdateCameraRequest(BaseModel):
     place: Optional[str] = None
     is_recording: Optional[bool] = Field(default=None, alias="isRecording")
 
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class CreateApiTokenRequest(BaseModel):
@@ -218,8 +209,7 @@ class CreateApiTokenRequest(BaseModel):
     ip_whitelist: Optional[List[str]] = Field(default=None, alias="ipWhitelist")
     rate_limit: Optional[int] = Field(default=1000, alias="rateLimit")
 
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 # Filter models
@@ -235,8 +225,7 @@ class CameraFilters(BaseModel):
     limit: Optional[int] = 50
     offset: Optional[int] = 0
 
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class RecordingFilters(BaseModel):
@@ -248,8 +237,7 @@ class RecordingFilters(BaseModel):
     limit: Optional[int] = 50
     offset: Optional[int] = 0
 
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 # Response models
@@ -294,6 +282,45 @@ class PaginatedResponse(BaseModel):
         return self.data.get("hasMore", False)
 
 
+class PageData(BaseModel, Generic[T]):
+    """Typed data of a paginated response."""
+    items: List[T] = Field(default_factory=list)
+    total: Optional[int] = None
+    limit: Optional[int] = None
+    offset: Optional[int] = None
+    has_more: Optional[bool] = Field(default=None, alias="hasMore")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class Page(BaseModel, Generic[T]):
+    """
+    Paginated response with typed items.
+
+    Validating ``Page[Camera]`` or ``Page[Recording]`` straight from the raw
+    response body parses the envelope and every item in a single pass.
+    """
+    success: bool
+    data: Optional[PageData[T]] = None
+    message: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def items(self) -> List[T]:
+        """Get items from paginated response."""
+        return self.data.items if self.data else []
+
+    @property
+    def total(self) -> Optional[int]:
+        """Get total count from paginated response, if reported."""
+        return self.data.total if self.data else None
+
+    @property
+    def has_more(self) -> Optional[bool]:
+        """Check if there are more items, if reported."""
+        return self.data.has_more if self.data else None
+
+
 class LoginResponse(BaseModel):
     """Login response model."""
     success: bool
@@ -318,6 +345,10 @@ class LoginResponse(BaseModel):
         return User(**user_data) if user_data else None
 
 
+CameraPage = Page[Camera]
+RecordingPage = Page[Recording]
+
+
 # WebSocket models
 class WebSocketMessage(BaseModel):
     """WebSocket message model."""
@@ -332,8 +363,7 @@ class CameraStatusUpdate(BaseModel):
     status: StreamStatus
     timestamp: datetime
 
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class DashboardUpdate(BaseModel):
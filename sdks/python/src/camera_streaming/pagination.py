@@ -0,0 +1,343 @@
+"""
+Pagination helpers for the Camera Streaming Platform SDK.
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import AsyncIterator, Awaitable, Callable, Deque, Iterable, Iterator, List, Optional, Tuple
+
+from .models import Page
+
+PageFetcher = Callable[[int, int], Awaitable[Page]]
+SyncPageFetcher = Callable[[int, int], Page]
+
+
+def is_last_page(page: Page, offset: int, page_size: int) -> bool:
+    """
+    Check whether a page is the last one of a listing.
+
+    ``hasMore`` is trusted when the server sends it, then ``total``, and
+    finally a short page is taken as the end of the listing.
+
+    Args:
+        page: Page returned by the server
+        offset: Offset the page was requested at
+        page_size: Number of items requested
+
+    Returns:
+        True if no further pages should be requested
+    """
+    items = page.items
+    if not items:
+        return True
+    if page.has_more is not None:
+        return not page.has_more
+    if page.total is not None:
+        return offset + len(items) >= page.total
+    return len(items) < page_size
+
+
+def _cancel_tasks(tasks: Iterable["asyncio.Future[Page]"]) -> None:
+    """Cancel prefetch tasks, retrieving the errors of those already done."""
+    for task in tasks:
+        if task.done():
+            if not task.cancelled():
+                task.exception()
+        else:
+            task.cancel()
+
+
+def _aligned_pages(pages: List[Page], offset: int, step: int, page_size: int) -> Tuple[List[Page], Optional[int]]:
+    """
+    Check pages fetched in parallel at ``offset``, ``offset + step``, ...
+
+    A page holding fewer rows than ``step`` before the end of the listing
+    (e.g. rows were deleted meanwhile) leaves the following windows
+    misaligned, so only the pages up to it are kept.
+
+    Args:
+        pages: Pages in offset order
+        offset: Offset of the first page
+        step: Number of rows each non-final page was expected to hold
+        page_size: Number of items requested per page
+
+    Returns:
+        Non-empty pages to keep, and the offset to continue from
+        sequentially (None if the listing is complete)
+    """
+    kept = []
+    for page in pages:
+        if page.items:
+            kept.append(page)
+        if is_last_page(page, offset, page_size):
+            return kept, None
+        if len(page.items) != step:
+            return kept, offset + len(page.items)
+        offset += step
+    return kept, offset
+
+
+async def iterate_pages(
+    fetch_page: PageFetcher,
+    offset: int = 0,
+    page_size: int = 50,
+    prefetch: int = 1,
+) -> AsyncIterator[Page]:
+    """
+    Iterate over the pages of a listing, prefetching ahead of the consumer.
+
+    While page N is being consumed, up to ``prefetch`` following pages are
+    already in flight. Only those pages are held in memory, so memory use is
+    independent of the size of the listing. Offsets advance by the number of
+    rows each page actually holds: if the server returns fewer rows than
+    requested (e.g. it caps the page size), the prefetched pages are
+    dropped and requested again at the right offsets.
+
+    Args:
+        fetch_page: Coroutine function fetching a page at (offset, limit)
+        offset: Offset of the first page
+        page_size: Number of items per page
+        prefetch: Number of pages to fetch ahead of the consumer
+
+    Yields:
+        Pages in offset order
+    """
+    if page_size <= 0:
+        raise ValueError("page_size must be positive")
+
+    pending: Deque["asyncio.Future[Page]"] = deque()
+    offsets: Deque[int] = deque()
+    next_offset = offset
+    step = page_size
+    total: Optional[int] = None
+
+    def schedule() -> None:
+        nonlocal next_offset
+        pending.append(asyncio.ensure_future(fetch_page(next_offset, page_size)))
+        offsets.append(next_offset)
+        next_offset += step
+
+    schedule()
+    try:
+        while pending:
+            page = await pending.popleft()
+            page_offset = offsets.popleft()
+
+            if is_last_page(page, page_offset, page_size):
+                if page.items:
+                    yield page
+                return
+
+            if total is None:
+                total = page.total
+
+            if len(page.items) != step:
+                # The pages in flight were requested at offsets assuming a full page
+                step = len(page.items)
+                next_offset = page_offset + step
+                _cancel_tasks(pending)
+                pending.clear()
+                offsets.clear()
+
+            while len(pending) < prefetch and (total is None or next_offset < total):
+                schedule()
+
+            yield page
+
+            if not pending:
+                schedule()
+    finally:
+        _cancel_tasks(pending)
+
+
+async def fetch_all_pages(
+    fetch_page: PageFetcher,
+    offset: int = 0,
+    page_size: int = 50,
+    concurrency: int = 4,
+) -> List[Page]:
+    """
+    Fetch every page of a listing, requesting pages in parallel.
+
+    The first page is fetched on its own to learn ``total`` and how many
+    rows the server returns per page; the remaining offset windows are then
+    requested concurrently, at most ``concurrency`` at a time, and returned
+    in offset order. Listings without ``total`` fall back to sequential
+    iteration with ``concurrency`` pages of prefetch, as does the rest of
+    the listing after a page that comes back short.
+
+    Args:
+        fetch_page: Coroutine function fetching a page at (offset, limit)
+        offset: Offset of the first page
+        page_size: Number of items per page
+        concurrency: Maximum number of requests in flight
+
+    Returns:
+        Pages in offset order
+    """
+    if page_size <= 0:
+        raise ValueError("page_size must be positive")
+    if concurrency <= 0:
+        raise ValueError("concurrency must be positive")
+
+    first_page = await fetch_page(offset, page_size)
+    if is_last_page(first_page, offset, page_size):
+        return [first_page] if first_page.items else []
+
+    step = len(first_page.items)
+    if first_page.total is None:
+        pages = [first_page]
+        async for page in iterate_pages(fetch_page, offset + step, page_size, prefetch=concurrency):
+            pages.append(page)
+        return pages
+
+    semaphore = asyncio.Semaphore(concurrency)
+    offsets = list(range(offset + step, first_page.total, step))
+
+    async def fetch_bounded(page_offset: int) -> Page:
+        async with semaphore:
+            return await fetch_page(page_offset, page_size)
+
+    tasks = [asyncio.ensure_future(fetch_bounded(page_offset)) for page_offset in offsets]
+    try:
+        remaining_pages = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+    pages, next_offset = _aligned_pages([first_page, *remaining_pages], offset, step, page_size)
+
+    # Rows added after the first page was fetched, or after a short page, are picked up sequentially
+    if next_offset is not None:
+        async for page in iterate_pages(fetch_page, next_offset, page_size, prefetch=concurrency):
+            pages.append(page)
+
+    return pages
+
+
+def iterate_pages_sync(
+    fetch_page: SyncPageFetcher,
+    offset: int = 0,
+    page_size: int = 50,
+    prefetch: int = 1,
+) -> Iterator[Page]:
+    """
+    Iterate over the pages of a listing, prefetching on worker threads.
+
+    Synchronous counterpart of :func:`iterate_pages`.
+
+    Args:
+        fetch_page: Function fetching a page at (offset, limit)
+        offset: Offset of the first page
+        page_size: Number of items per page
+        prefetch: Number of pages to fetch ahead of the consumer
+
+    Yields:
+        Pages in offset order
+    """
+    if page_size <= 0:
+        raise ValueError("page_size must be positive")
+
+    executor = ThreadPoolExecutor(max_workers=max(1, prefetch))
+    pending: "Deque[Future[Page]]" = deque()
+    offsets: Deque[int] = deque()
+    next_offset = offset
+    step = page_size
+    total: Optional[int] = None
+
+    def schedule() -> None:
+        nonlocal next_offset
+        pending.append(executor.submit(fetch_page, next_offset, page_size))
+        offsets.append(next_offset)
+        next_offset += step
+
+    schedule()
+    try:
+        while pending:
+            page = pending.popleft().result()
+            page_offset = offsets.popleft()
+
+            if is_last_page(page, page_offset, page_size):
+                if page.items:
+                    yield page
+                return
+
+            if total is None:
+                total = page.total
+
+            if len(page.items) != step:
+                # The pages in flight were requested at offsets assuming a full page
+                step = len(page.items)
+                next_offset = page_offset + step
+                for future in pending:
+                    future.cancel()
+                pending.clear()
+                offsets.clear()
+
+            while len(pending) < prefetch and (total is None or next_offset < total):
+                schedule()
+
+            yield page
+
+            if not pending:
+                schedule()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def fetch_all_pages_sync(
+    fetch_page: SyncPageFetcher,
+    offset: int = 0,
+    page_size: int = 50,
+    concurrency: int = 4,
+) -> List[Page]:
+    """
+    Fetch every page of a listing, requesting pages on parallel threads.
+
+    Synchronous counterpart of :func:`fetch_all_pages`.
+
+    Args:
+        fetch_page: Function fetching a page at (offset, limit)
+        offset: Offset of the first page
+        page_size: Number of items per page
+        concurrency: Maximum number of requests in flight
+
+    Returns:
+        Pages in offset order
+    """
+    if page_size <= 0:
+        raise ValueError("page_size must be positive")
+    if concurrency <= 0:
+        raise ValueError("concurrency must be positive")
+
+    first_page = fetch_page(offset, page_size)
+    if is_last_page(first_page, offset, page_size):
+        return [first_page] if first_page.items else []
+
+    step = len(first_page.items)
+    if first_page.total is None:
+        pages = [first_page]
+        pages.extend(iterate_pages_sync(fetch_page, offset + step, page_size, prefetch=concurrency))
+        return pages
+
+    offsets = list(range(offset + step, first_page.total, step))
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [executor.submit(fetch_page, page_offset, page_size) for page_offset in offsets]
+        try:
+            remaining_pages = [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    pages, next_offset = _aligned_pages([first_page, *remaining_pages], offset, step, page_size)
+
+    # Rows added after the first page was fetched, or after a short page, are picked up sequentially
+    if next_offset is not None:
+        pages.extend(iterate_pages_sync(fetch_page, next_offset, page_size, prefetch=concurrency))
+
+    return pages
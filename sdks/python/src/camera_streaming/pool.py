@@ -0,0 +1,439 @@
+"""
+Pool of WebSocket connections sharing one camera fleet.
+"""
+
+import asyncio
+import hashlib
+import logging
+from bisect import bisect
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+from .exceptions import WebSocketError
+from .websocket_client import WebSocketClient
+
+logger = logging.getLogger(__name__)
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """
+    Consistent hash ring mapping keys to shard indexes.
+
+    Every shard owns ``replicas`` points on the ring, so removing a shard
+    only moves the keys it owned; all other keys keep their shard.
+    """
+
+    def __init__(self, shards: int, replicas: int = 100):
+        """
+        Initialize the ring.
+
+        Args:
+            shards: Number of shards
+            replicas: Virtual nodes per shard
+        """
+        if shards <= 0:
+            raise ValueError("shards must be positive")
+
+        points = sorted((_hash(f"shard-{shard}-{replica}"), shard) for shard in range(shards) for replica in range(replicas))
+        self.shards = shards
+        self._hashes = [point for point, _ in points]
+        self._owners = [shard for _, shard in points]
+
+    def lookup(self, key: str, exclude: Iterable[int] = ()) -> int:
+        """
+        Get the shard owning a key.
+
+        Args:
+            key: Key to place, e.g. a topic
+            exclude: Shards to skip; their keys go to the next shard on the ring
+
+        Returns:
+            Shard index
+
+        Raises:
+            ValueError: If every shard is excluded
+        """
+        excluded = set(exclude)
+        if len(excluded) >= self.shards:
+            raise ValueError("No shard available")
+
+        position = bisect(self._hashes, _hash(key))
+        for offset in range(len(self._owners)):
+            shard = self._owners[(position + offset) % len(self._owners)]
+            if shard not in excluded:
+                return shard
+        raise ValueError("No shard available")
+
+
+class WebSocketPool:
+    """
+    Shards camera subscriptions across several WebSocket connections.
+
+    Each ``camera_{id}`` topic is placed on one connection by consistent
+    hash, so events of a camera keep arriving in order on one socket while
+    the fleet's traffic is spread over ``size`` sockets. Handlers registered
+    with :meth:`on` receive the events of all connections. When a connection
+    runs out of reconnect attempts, its topics are moved to the healthy
+    connections; other subscriptions are left untouched. Dead connections
+    are retried every ``revive_interval`` seconds and get their topics back
+    once they are up again.
+
+    Example:
+        >>> pool = WebSocketPool("wss://api.camera-streaming.example.com/ws", "your-jwt-token", size=4)
+        >>> await pool.connect()
+        >>> pool.on("cameraStatusUpdate", lambda update: print(f"Camera {update.camera_id}: {update.status}"))
+        >>> await pool.subscribe_to_cameras(camera_ids)
+    """
+
+    def __init__(
+        self,
+        url: str,
+        token: str,
+        size: int = 4,
+        replicas: int = 100,
+        revive_interval: Optional[float] = 30.0,
+        **client_options: Any,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            url: WebSocket URL
+            token: JWT token for authentication
+            size: Number of connections
+            replicas: Virtual nodes per connection on the hash ring
+            revive_interval: Seconds between attempts to reconnect dead
+                connections (None to leave them down)
+            **client_options: Options passed to every WebSocketClient
+                (reconnect, dispatch_workers, subscribe_batch_size, ...)
+        """
+        self.ring = HashRing(size, replicas)
+        self.revive_interval = revive_interval
+        self.clients: List[WebSocketClient] = [WebSocketClient(url, token, **client_options) for _ in range(size)]
+
+        self._handlers: Dict[str, List[Callable]] = {}
+        self._assignments: Dict[str, int] = {}
+        self._dead: Set[int] = set()
+        # Topics of dead shards that could not be placed on another shard yet
+        self._unassigned: Set[str] = set()
+        self._revive_task: Optional[asyncio.Task] = None
+
+        for shard, client in enumerate(self.clients):
+            client.on("reconnectFailed", self._shard_failed_handler(shard))
+            client.on("connected", self._shard_reconnected_handler(shard))
+
+    async def connect(self) -> None:
+        """
+        Connect every connection of the pool.
+
+        Connections that fail are marked dead and skipped.
+
+        Raises:
+            WebSocketError: If no connection could be established
+        """
+        results = await asyncio.gather(*(client.connect() for client in self.clients), return_exceptions=True)
+        for shard, result in enumerate(results):
+            if isinstance(result, Exception):
+                logger.error(f"WebSocket pool shard {shard} failed to connect: {result}")
+                self._dead.add(shard)
+            else:
+                self._dead.discard(shard)
+
+        if len(self._dead) == len(self.clients):
+            raise WebSocketError("No WebSocket pool connection could be established")
+        self._start_reviving()
+
+    async def disconnect(self) -> None:
+        """Disconnect every connection of the pool."""
+        if self._revive_task is not None:
+            self._revive_task.cancel()
+            try:
+                await self._revive_task
+            except asyncio.CancelledError:
+                pass
+            self._revive_task = None
+        await asyncio.gather(*(client.disconnect() for client in self.clients))
+
+    # Event handlers
+    def on(self, event_type: str, handler: Callable, raw: bool = False) -> None:
+        """
+        Register an event handler on every connection.
+
+        Args:
+            event_type: Type of event to listen for
+            handler: Function to call when event occurs
+            raw: Pass the message's raw "data" dict instead of a model
+        """
+        self._handlers.setdefault(event_type, []).append(handler)
+        for client in self.clients:
+            client.on(event_type, handler, raw=raw)
+
+    def off(self, event_type: str, handler: Optional[Callable] = None) -> None:
+        """
+        Remove event handler(s) from every connection.
+
+        Args:
+            event_type: Type of event
+            handler: Specific handler to remove (if None, removes all handlers)
+        """
+        # Only the pool's own handlers are removed, never its shard monitoring
+        if handler is None:
+            handlers = self._handlers.pop(event_type, [])
+        else:
+            handlers = [handler]
+            if handler in self._handlers.get(event_type, []):
+                self._handlers[event_type].remove(handler)
+
+        for client in self.clients:
+            for registered in handlers:
+                client.off(event_type, registered)
+
+    # Subscription methods
+    async def subscribe_to_camera(self, camera_id: str) -> None:
+        """Subscribe to updates for a specific camera on its shard."""
+        await self._subscribe_many([f"camera_{camera_id}"])
+
+    async def subscribe_to_cameras(self, camera_ids: Iterable[str]) -> None:
+        """
+        Subscribe to updates for many cameras, spread across the connections.
+
+        Args:
+            camera_ids: Camera IDs to subscribe to
+        """
+        await self._subscribe_many(f"camera_{camera_id}" for camera_id in camera_ids)
+
+    async def unsubscribe_from_camera(self, camera_id: str) -> None:
+        """Unsubscribe from updates for a specific camera."""
+        await self._unsubscribe_many([f"camera_{camera_id}"])
+
+    async def unsubscribe_from_cameras(self, camera_ids: Iterable[str]) -> None:
+        """
+        Unsubscribe from updates for many cameras.
+
+        Args:
+            camera_ids: Camera IDs to unsubscribe from
+        """
+        await self._unsubscribe_many(f"camera_{camera_id}" for camera_id in camera_ids)
+
+    async def subscribe_to_camera_updates(self) -> None:
+        """Subscribe to all camera status updates on one connection."""
+        await self._subscribe_many(["camera_updates"])
+
+    async def subscribe_to_dashboard(self) -> None:
+        """Subscribe to dashboard updates on one connection."""
+        await self._subscribe_many(["dashboard"])
+
+    async def subscribe_to_alerts(self) -> None:
+        """Subscribe to alert notifications on one connection."""
+        await self._subscribe_many(["alerts"])
+
+    async def unsubscribe_from_all(self) -> None:
+        """Unsubscribe from all topics on every connection."""
+        self._unassigned.clear()
+        await self._unsubscribe_many(list(self._assignments))
+
+    # Utility methods
+    def shard_for(self, topic: str) -> int:
+        """
+        Get the connection index a topic is, or would be, subscribed on.
+
+        Raises:
+            WebSocketError: If every connection is dead
+        """
+        shard = self._assignments.get(topic)
+        return shard if shard is not None else self._lookup(topic)
+
+    def get_subscriptions(self) -> Set[str]:
+        """Get current subscriptions across all connections, including topics waiting for one."""
+        return set(self._assignments) | self._unassigned
+
+    def is_connected(self) -> bool:
+        """Check if at least one connection is up."""
+        return any(client.is_connected() for client in self.clients)
+
+    def shard_stats(self) -> List[Dict[str, Any]]:
+        """Get the state and number of topics of each connection."""
+        counts = [0] * len(self.clients)
+        for shard in self._assignments.values():
+            counts[shard] += 1
+        return [
+            {"connected": client.is_connected(), "dead": shard in self._dead, "topics": counts[shard]}
+            for shard, client in enumerate(self.clients)
+        ]
+
+    def _lookup(self, topic: str) -> int:
+        try:
+            return self.ring.lookup(topic, self._dead)
+        except ValueError:
+            raise WebSocketError("All WebSocket pool connections are down")
+
+    async def _subscribe_many(self, topics: Iterable[str]) -> None:
+        """
+        Subscribe to topics, each on the shard the ring assigns it.
+
+        Shards subscribe independently: topics of healthy shards are
+        subscribed even if another shard fails. Topics of a shard that is
+        reconnecting are kept as unassigned and subscribed once it is back,
+        or on another shard if it dies.
+
+        Raises:
+            WebSocketError: If a connected shard failed to subscribe its topics
+        """
+        by_shard: Dict[int, List[str]] = {}
+        for topic in topics:
+            if topic not in self._assignments:
+                by_shard.setdefault(self._lookup(topic), []).append(topic)
+
+        failed = []
+        for shard, error in (await self._run_per_shard(self._subscribe_on, by_shard)).items():
+            if self.clients[shard].is_connected():
+                logger.error(f"WebSocket pool shard {shard} failed to subscribe {len(by_shard[shard])} topics: {error}")
+                failed.append(shard)
+            else:
+                logger.debug(f"WebSocket pool shard {shard} is reconnecting, {len(by_shard[shard])} topics wait for it")
+                self._unassigned.update(topic for topic in by_shard[shard] if topic not in self._assignments)
+        self._start_reviving()
+        if failed:
+            raise WebSocketError(f"Failed to subscribe on WebSocket pool shards {failed}")
+
+    async def _unsubscribe_many(self, topics: Iterable[str]) -> None:
+        """
+        Unsubscribe from topics on the shards holding them.
+
+        Raises:
+            WebSocketError: If any connected shard failed to unsubscribe its topics
+        """
+        by_shard: Dict[int, List[str]] = {}
+        for topic in topics:
+            self._unassigned.discard(topic)
+            shard = self._assignments.get(topic)
+            if shard is not None:
+                by_shard.setdefault(shard, []).append(topic)
+
+        failed = await self._run_per_shard(self._unsubscribe_on, by_shard)
+        for shard, error in failed.items():
+            logger.error(f"WebSocket pool shard {shard} failed to unsubscribe {len(by_shard[shard])} topics: {error}")
+        if failed:
+            raise WebSocketError(f"Failed to unsubscribe on WebSocket pool shards {sorted(failed)}")
+
+    async def _run_per_shard(
+        self,
+        method: Callable[[int, List[str]], Awaitable[None]],
+        by_shard: Dict[int, List[str]],
+    ) -> Dict[int, Exception]:
+        """Run a subscription method on every shard concurrently and return the errors of those that failed."""
+        shards = list(by_shard)
+        results = await asyncio.gather(*(method(shard, by_shard[shard]) for shard in shards), return_exceptions=True)
+        return {shard: result for shard, result in zip(shards, results) if isinstance(result, Exception)}
+
+    async def _subscribe_on(self, shard: int, topics: List[str]) -> None:
+        await self.clients[shard]._subscribe_many(topics)
+        for topic in topics:
+            self._assignments[topic] = shard
+
+    async def _unsubscribe_on(self, shard: int, topics: List[str]) -> None:
+        client = self.clients[shard]
+        if client.is_connected():
+            await client._unsubscribe_many(topics)
+        else:
+            # Nothing to tell a disconnected server; just keep a reconnect from restoring the topics
+            client._subscriptions.difference_update(topics)
+        for topic in topics:
+            self._assignments.pop(topic, None)
+
+    def _shard_failed_handler(self, shard: int) -> Callable:
+        async def on_reconnect_failed(data: Dict[str, Any]) -> None:
+            await self._rebalance(shard)
+        return on_reconnect_failed
+
+    def _shard_reconnected_handler(self, shard: int) -> Callable:
+        async def on_connected(data: Dict[str, Any]) -> None:
+            if self._unassigned and shard not in self._dead:
+                topics = sorted(self._unassigned)
+                self._unassigned.clear()
+                await self._place(topics)
+        return on_connected
+
+    async def _rebalance(self, shard: int) -> None:
+        """Move the topics of a dead shard onto the healthy ones."""
+        self._dead.add(shard)
+        self._start_reviving()
+        topics = [topic for topic, owner in self._assignments.items() if owner == shard]
+        for topic in topics:
+            del self._assignments[topic]
+        # The dead client must not restore these topics if it is reconnected later
+        self.clients[shard]._subscriptions.difference_update(topics)
+
+        if len(self._dead) == len(self.clients):
+            logger.error(f"All WebSocket pool shards are down, {len(topics)} topics unassigned")
+            self._unassigned.update(topics)
+            return
+
+        logger.warning(f"WebSocket pool shard {shard} is down, moving {len(topics)} topics")
+        await self._place(topics)
+
+    async def _place(self, topics: List[str]) -> None:
+        """Subscribe topics on their shards, keeping those that fail for the next revive round."""
+        try:
+            await self._subscribe_many(topics)
+        except WebSocketError as e:
+            logger.error(f"Failed to place WebSocket pool topics: {e}")
+        self._unassigned.update(topic for topic in topics if topic not in self._assignments)
+
+    def _start_reviving(self) -> None:
+        if self.revive_interval is None or (self._revive_task is not None and not self._revive_task.done()):
+            return
+        if self._dead or self._unassigned:
+            self._revive_task = asyncio.create_task(self._revive_loop())
+
+    async def _revive_loop(self) -> None:
+        """Reconnect dead shards and place unassigned topics until the pool is whole again."""
+        while self._dead or self._unassigned:
+            await asyncio.sleep(self.revive_interval)
+
+            for shard in sorted(self._dead):
+                try:
+                    await self.clients[shard].connect()
+                except WebSocketError as e:
+                    logger.debug(f"WebSocket pool shard {shard} is still down: {e}")
+                    continue
+                await self._revive(shard)
+
+            if self._unassigned and len(self._dead) < len(self.clients):
+                topics = sorted(self._unassigned)
+                self._unassigned.clear()
+                await self._place(topics)
+
+    async def _revive(self, shard: int) -> None:
+        """Move the topics the ring assigns to a reconnected shard back onto it."""
+        self._dead.discard(shard)
+        previous = {
+            topic: owner
+            for topic, owner in self._assignments.items()
+            if owner != shard and self.ring.lookup(topic, self._dead) == shard
+        }
+        logger.info(f"WebSocket pool shard {shard} is back, moving {len(previous)} topics to it")
+        if not previous:
+            return
+
+        # Subscribe on the revived shard first so no events are missed during the move
+        try:
+            await self._subscribe_on(shard, list(previous))
+        except WebSocketError as e:
+            logger.error(f"Failed to move topics back to WebSocket pool shard {shard}: {e}")
+            return
+
+        by_owner: Dict[int, List[str]] = {}
+        for topic, owner in previous.items():
+            by_owner.setdefault(owner, []).append(topic)
+        for owner, topics in by_owner.items():
+            client = self.clients[owner]
+            try:
+                if client.is_connected():
+                    await client._unsubscribe_many(topics)
+            except WebSocketError as e:
+                logger.warning(f"Failed to unsubscribe moved topics from WebSocket pool shard {owner}: {e}")
+            client._subscriptions.difference_update(topics)
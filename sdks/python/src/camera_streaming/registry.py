@@ -0,0 +1,378 @@
+"""
+In-process mirror of the camera list with secondary indexes.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Iterator, List, Optional, Set, Tuple, Union
+
+from .lazy import listing_page_type
+from .models import Camera, CameraStatusUpdate, StreamStatus
+
+if TYPE_CHECKING:
+    from .client import CameraStreamingClient
+    from .websocket_client import WebSocketClient
+
+logger = logging.getLogger(__name__)
+
+INDEXED_FIELDS = ("location", "company", "stream_status", "is_recording")
+
+
+def _utc(value: datetime) -> datetime:
+    """Make a timestamp comparable, taking naive ones as UTC."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+class CameraRegistry:
+    """
+    Local mirror of all cameras, kept current by push events and delta syncs.
+
+    The full camera list is loaded once page by page. After that,
+    ``cameraStatusUpdate`` events from an attached WebSocket client update
+    stream statuses as they happen, and a periodic sync walks the listing
+    again in raw mode. Only cameras whose ``updatedAt`` changed are
+    validated and re-indexed, and a pushed status newer than that
+    ``updatedAt`` is kept. Cameras missing from the listing are removed,
+    provided the walk saw as many cameras as the listing's ``total``.
+    Lookups by location, company, stream status and recording state are
+    answered from hash indexes without a network round trip.
+
+    Example:
+        >>> registry = CameraRegistry(client, sync_interval=300)
+        >>> await registry.start(ws_client)
+        >>> registry.find(location="HQ", stream_status=StreamStatus.ONLINE)
+        [Camera(id='cam-1', ...), ...]
+        >>> registry.count(is_recording=True)
+        42
+    """
+
+    def __init__(
+        self,
+        client: "CameraStreamingClient",
+        sync_interval: Optional[float] = 300.0,
+        page_size: int = 500,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            client: API client used to load and sync cameras
+            sync_interval: Seconds between delta syncs (None to disable periodic syncs)
+            page_size: Number of cameras per listing request
+        """
+        self.client = client
+        self.sync_interval = sync_interval
+        self.page_size = page_size
+
+        self._cameras: Dict[str, Camera] = {}
+        self._versions: Dict[str, Any] = {}
+        # Latest pushed status of each camera, with the time it was pushed
+        self._pushed: Dict[str, Tuple[datetime, StreamStatus]] = {}
+        self._indexes: Dict[str, Dict[Hashable, Set[str]]] = {name: {} for name in INDEXED_FIELDS}
+
+        self._ws_client: Optional["WebSocketClient"] = None
+        self._ws_handlers: List[Tuple[str, Callable]] = []
+        self._sync_task: Optional[asyncio.Task] = None
+        self._sync_now: Optional[asyncio.Event] = None
+        self._sync_lock: Optional[asyncio.Lock] = None
+
+    async def load(self) -> Dict[str, int]:
+        """
+        Load the full camera list.
+
+        Returns:
+            Number of cameras added, updated and removed
+        """
+        return await self.sync()
+
+    async def sync(self) -> Dict[str, int]:
+        """
+        Bring the registry up to date with the API.
+
+        The listing is read as raw dicts; cameras whose ``updatedAt`` is
+        unchanged are skipped without validation. Rows can shift between
+        pages while the listing is walked, so cameras are only removed when
+        every page reported the same ``total`` and that many distinct
+        cameras were walked.
+
+        Returns:
+            Number of cameras added, updated and removed
+        """
+        if self._sync_lock is None:
+            self._sync_lock = asyncio.Lock()
+
+        async with self._sync_lock:
+            changes = {"added": 0, "updated": 0, "removed": 0}
+            seen: Set[str] = set()
+            walked = 0
+            totals: Set[Optional[int]] = set()
+
+            page_type = listing_page_type(Camera, raw=True, json_backend=self.client.json_backend)
+            pages = self.client._iter_pages("/cameras", page_type, None, self.page_size, 1, "Failed to get cameras")
+            async for page in pages:
+                totals.add(page.total)
+                for item in page.items:
+                    walked += 1
+                    seen.add(item["id"])
+                    change = self._apply_listed(item)
+                    if change is not None:
+                        changes[change] += 1
+
+            if len(totals) == 1 and walked == len(seen) == next(iter(totals)):
+                changes["removed"] = self._remove_unlisted(seen)
+            else:
+                logger.warning(
+                    f"Camera listing changed during the sync ({walked} cameras walked, totals {sorted(totals, key=str)}), "
+                    "keeping cameras missing from it"
+                )
+
+        logger.debug(f"Camera registry synced: {changes}")
+        return changes
+
+    async def start(self, ws_client: Optional["WebSocketClient"] = None) -> None:
+        """
+        Load the cameras and keep them current.
+
+        Args:
+            ws_client: WebSocket client subscribed to camera updates (optional)
+        """
+        await self.load()
+        if ws_client is not None:
+            self.attach_websocket(ws_client)
+        if self.sync_interval is not None and self._sync_task is None:
+            self._sync_now = asyncio.Event()
+            self._sync_task = asyncio.create_task(self._sync_loop())
+
+    async def stop(self) -> None:
+        """Stop periodic syncs and detach from the WebSocket client."""
+        self.detach_websocket()
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            try:
+                await self._sync_task
+            except asyncio.CancelledError:
+                pass
+            self._sync_task = None
+
+    def attach_websocket(self, ws_client: "WebSocketClient") -> None:
+        """
+        Apply ``cameraStatusUpdate`` push events to the registry.
+
+        A sync is also requested after every reconnect, since events may
+        have been missed while the connection was down.
+
+        Args:
+            ws_client: WebSocket client subscribed to camera updates
+        """
+        self.detach_websocket()
+        self._ws_handlers = [
+            ("cameraStatusUpdate", self._on_camera_status_update),
+            ("connected", self._on_websocket_connected),
+        ]
+        ws_client.on("cameraStatusUpdate", self._on_camera_status_update, raw=True)
+        ws_client.on("connected", self._on_websocket_connected)
+        self._ws_client = ws_client
+
+    def detach_websocket(self) -> None:
+        """Stop applying WebSocket push events."""
+        if self._ws_client is not None:
+            for event_type, handler in self._ws_handlers:
+                self._ws_client.off(event_type, handler)
+        self._ws_client = None
+        self._ws_handlers = []
+
+    # Lookups
+    def get(self, camera_id: str) -> Optional[Camera]:
+        """Get a camera by ID."""
+        return self._cameras.get(camera_id)
+
+    def find(
+        self,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        stream_status: Optional[Union[StreamStatus, str]] = None,
+        is_recording: Optional[bool] = None,
+    ) -> List[Camera]:
+        """
+        Get the cameras matching all given criteria.
+
+        Args:
+            location: Camera location
+            company: Camera company
+            stream_status: Stream status
+            is_recording: Recording state
+
+        Returns:
+            List of Camera objects (all cameras if no criteria are given)
+        """
+        return [self._cameras[camera_id] for camera_id in self.ids_where(location, company, stream_status, is_recording)]
+
+    def ids_where(
+        self,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        stream_status: Optional[Union[StreamStatus, str]] = None,
+        is_recording: Optional[bool] = None,
+    ) -> Set[str]:
+        """Get the IDs of the cameras matching all given criteria."""
+        matches = self._index_sets(location, company, stream_status, is_recording)
+        if not matches:
+            return set(self._cameras)
+        return matches[0].intersection(*matches[1:])
+
+    def count(
+        self,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        stream_status: Optional[Union[StreamStatus, str]] = None,
+        is_recording: Optional[bool] = None,
+    ) -> int:
+        """Count the cameras matching all given criteria."""
+        matches = self._index_sets(location, company, stream_status, is_recording)
+        if not matches:
+            return len(self._cameras)
+        if len(matches) == 1:
+            return len(matches[0])
+        return len(matches[0].intersection(*matches[1:]))
+
+    def values(self, field: str) -> List[Hashable]:
+        """Get the distinct values of an indexed field, e.g. all locations."""
+        return [value for value, ids in self._indexes[field].items() if ids]
+
+    def __len__(self) -> int:
+        return len(self._cameras)
+
+    def __contains__(self, camera_id: str) -> bool:
+        return camera_id in self._cameras
+
+    def __iter__(self) -> Iterator[Camera]:
+        return iter(list(self._cameras.values()))
+
+    async def __aenter__(self) -> "CameraRegistry":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop()
+
+    # Internals
+    def _index_sets(
+        self,
+        location: Optional[str],
+        company: Optional[str],
+        stream_status: Optional[Union[StreamStatus, str]],
+        is_recording: Optional[bool],
+    ) -> List[Set[str]]:
+        """Get the index entries of the given criteria, smallest first."""
+        criteria = {
+            "location": location,
+            "company": company,
+            "stream_status": StreamStatus(stream_status) if stream_status is not None else None,
+            "is_recording": is_recording,
+        }
+        matches = [self._indexes[name].get(value, set()) for name, value in criteria.items() if value is not None]
+        return sorted(matches, key=len)
+
+    def _apply_listed(self, item: Dict[str, Any]) -> Optional[str]:
+        """
+        Apply a raw camera of the listing to the mirror.
+
+        Returns:
+            "added" or "updated", or None if the camera is unchanged
+        """
+        camera_id = item["id"]
+        version = item.get("updatedAt")
+        if camera_id in self._cameras and self._versions.get(camera_id) == version:
+            return None
+
+        change = "updated" if camera_id in self._cameras else "added"
+        camera = Camera.model_validate(item)
+        pushed = self._pushed.get(camera_id)
+        if pushed is not None:
+            if _utc(pushed[0]) > _utc(camera.updated_at):
+                # The listing row predates the last pushed status
+                camera.stream_status = pushed[1]
+            else:
+                del self._pushed[camera_id]
+        self._put(camera, version)
+        return change
+
+    def _remove_unlisted(self, listed: Set[str]) -> int:
+        """Remove the cameras missing from a complete listing and return how many there were."""
+        missing = [camera_id for camera_id in self._cameras if camera_id not in listed]
+        for camera_id in missing:
+            self._remove(camera_id)
+        return len(missing)
+
+    def _put(self, camera: Camera, version: Any) -> None:
+        """Insert or replace a camera and update the indexes."""
+        if camera.id in self._cameras:
+            self._unindex(self._cameras[camera.id])
+        self._cameras[camera.id] = camera
+        self._versions[camera.id] = version
+        for name in INDEXED_FIELDS:
+            self._indexes[name].setdefault(getattr(camera, name), set()).add(camera.id)
+
+    def _remove(self, camera_id: str) -> None:
+        camera = self._cameras.pop(camera_id)
+        self._versions.pop(camera_id, None)
+        self._pushed.pop(camera_id, None)
+        self._unindex(camera)
+
+    def _unindex(self, camera: Camera) -> None:
+        for name in INDEXED_FIELDS:
+            ids = self._indexes[name].get(getattr(camera, name))
+            if ids is not None:
+                ids.discard(camera.id)
+                if not ids:
+                    del self._indexes[name][getattr(camera, name)]
+
+    def _set_stream_status(self, camera_id: str, status: StreamStatus) -> None:
+        camera = self._cameras.get(camera_id)
+        if camera is None or camera.stream_status == status:
+            return
+
+        index = self._indexes["stream_status"]
+        ids = index.get(camera.stream_status)
+        if ids is not None:
+            ids.discard(camera_id)
+            if not ids:
+                del index[camera.stream_status]
+        camera.stream_status = status
+        index.setdefault(status, set()).add(camera_id)
+
+    async def _on_camera_status_update(self, data: Union[Dict[str, Any], List[Dict[str, Any]]]) -> None:
+        """Apply raw status events (single or coalesced) to the mirror."""
+        for update in data if isinstance(data, list) else [data]:
+            try:
+                status_update = CameraStatusUpdate.model_validate(update)
+            except ValueError as e:
+                logger.error(f"Invalid camera status update {update}: {e}")
+                continue
+
+            camera_id = status_update.camera_id
+            if camera_id not in self._cameras:
+                continue
+            pushed = self._pushed.get(camera_id)
+            if pushed is not None and _utc(pushed[0]) > _utc(status_update.timestamp):
+                continue
+            self._pushed[camera_id] = (status_update.timestamp, status_update.status)
+            self._set_stream_status(camera_id, status_update.status)
+
+    async def _on_websocket_connected(self, data: Any) -> None:
+        if isinstance(data, dict) and data.get("reconnected") and self._sync_now is not None:
+            self._sync_now.set()
+
+    async def _sync_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._sync_now.wait(), self.sync_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._sync_now.clear()
+
+            try:
+                await self.sync()
+            except Exception as e:
+                logger.error(f"Camera registry sync failed: {e}")
@@ -0,0 +1,171 @@
+"""
+Retry policies for the Camera Streaming Platform SDK.
+"""
+
+import asyncio
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+import httpx
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is retried.
+
+    Backoff is exponential with full jitter, capped by ``max_delay``. A
+    ``Retry-After`` header on 429/503 responses takes precedence over the
+    computed backoff. Server errors are only retried for idempotent methods,
+    while rate-limited requests were never processed and are safe to retry
+    for any method. Subclass and override ``should_retry_response`` or
+    ``compute_delay`` to customise the behaviour.
+
+    Example:
+        >>> policy = RetryPolicy(max_retries=5, backoff_base=0.5, deadline=10.0)
+        >>> client = CameraStreamingClient("https://api.example.com", retry_policy=policy)
+    """
+
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    RETRY_AFTER_STATUSES = frozenset({429, 503})
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        max_delay: float = 30.0,
+        jitter: bool = True,
+        deadline: Optional[float] = None,
+        retry_statuses: Iterable[int] = (429, 500, 502, 503, 504),
+        respect_retry_after: bool = True,
+    ):
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_retries: Maximum number of retries after the first attempt
+            backoff_base: Base delay in seconds for exponential backoff
+            max_delay: Upper bound for a single backoff delay in seconds
+            jitter: Whether to apply full jitter to the backoff delay
+            deadline: Overall time budget in seconds for a call, including retries
+            retry_statuses: HTTP status codes that may be retried
+            respect_retry_after: Whether to honour the Retry-After header
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.deadline = deadline
+        self.retry_statuses = frozenset(retry_statuses)
+        self.respect_retry_after = respect_retry_after
+
+    def should_retry_response(self, method: str, response: httpx.Response) -> bool:
+        """Check whether a response status warrants another attempt."""
+        status = response.status_code
+        if status not in self.retry_statuses:
+            return False
+        if status == 429:
+            return True
+        return method.upper() in self.IDEMPOTENT_METHODS
+
+    def should_retry_exception(self, method: str, error: Exception) -> bool:
+        """Check whether a transport error warrants another attempt."""
+        return isinstance(error, httpx.RequestError)
+
+    def compute_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Compute the delay before the next attempt.
+
+        Args:
+            attempt: Zero-based index of the attempt that just failed
+            retry_after: Server-provided delay in seconds, if any
+
+        Returns:
+            Delay in seconds
+        """
+        if retry_after is not None and self.respect_retry_after:
+            return max(0.0, retry_after)
+
+        delay = min(self.max_delay, self.backoff_base * (2 ** attempt))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def get_retry_after(self, response: httpx.Response) -> Optional[float]:
+        """Extract the Retry-After delay in seconds from a response."""
+        if response.status_code not in self.RETRY_AFTER_STATUSES:
+            return None
+        return parse_retry_after(response.headers.get("Retry-After"))
+
+    def start(self) -> "RetryState":
+        """Create the per-call state used to track attempts and the deadline."""
+        return RetryState(self)
+
+    async def sleep(self, delay: float) -> None:
+        """Wait before the next attempt without blocking the event loop."""
+        await asyncio.sleep(delay)
+
+
+class RetryState:
+    """Attempt counter and deadline tracking for a single call."""
+
+    def __init__(self, policy: RetryPolicy):
+        self.policy = policy
+        self.attempt = 0
+        self.started_at = time.monotonic()
+
+    def remaining(self) -> Optional[float]:
+        """Get the remaining time budget in seconds, or None if unbounded."""
+        if self.policy.deadline is None:
+            return None
+        return self.policy.deadline - (time.monotonic() - self.started_at)
+
+    def next_delay(self, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Get the delay before the next attempt.
+
+        Returns:
+            Delay in seconds, or None if the retry budget or deadline is exhausted
+        """
+        if self.attempt >= self.policy.max_retries:
+            return None
+
+        delay = self.policy.compute_delay(self.attempt, retry_after)
+        remaining = self.remaining()
+        if remaining is not None and delay >= remaining:
+            return None
+
+        self.attempt += 1
+        return delay
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP date
+
+    Returns:
+        Delay in seconds, or None if the value is missing or invalid
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
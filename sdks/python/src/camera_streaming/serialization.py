@@ -0,0 +1,248 @@
+"""
+Pluggable JSON codecs for HTTP bodies and WebSocket messages, and binary
+codecs for WebSocket frames.
+"""
+
+import functools
+import json
+from typing import Any, Dict, Optional, Type, Union
+
+
+class JSONBackend:
+    """
+    JSON codec used by the SDK clients.
+
+    Subclasses implement :meth:`loads` and :meth:`dumps`. Decoding errors
+    must be raised as ValueError (or a subclass such as JSONDecodeError).
+    """
+
+    name = "base"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode a JSON document."""
+        raise NotImplementedError
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as UTF-8 JSON."""
+        raise NotImplementedError
+
+    def dumps_text(self, obj: Any) -> str:
+        """Encode an object as a JSON string, e.g. for WebSocket text frames."""
+        return self.dumps(obj).decode("utf-8")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class StdlibJSONBackend(JSONBackend):
+    """Codec based on the standard library ``json`` module."""
+
+    name = "stdlib"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def dumps_text(self, obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+
+class OrjsonBackend(JSONBackend):
+    """Codec based on orjson (``pip install camera-streaming-sdk[orjson]``)."""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._loads = orjson.loads
+        self._dumps = orjson.dumps
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj)
+
+
+class MsgspecBackend(JSONBackend):
+    """Codec based on msgspec (``pip install camera-streaming-sdk[msgspec]``)."""
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._decoder.decode(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+
+# Backends in order of preference for automatic detection
+JSON_BACKENDS: Dict[str, Type[JSONBackend]] = {
+    "orjson": OrjsonBackend,
+    "msgspec": MsgspecBackend,
+    "stdlib": StdlibJSONBackend,
+}
+
+_default_backend: Optional[JSONBackend] = None
+
+
+def get_json_backend(backend: Union[str, JSONBackend, None] = None) -> JSONBackend:
+    """
+    Resolve a JSON backend.
+
+    Args:
+        backend: Backend instance, backend name ("orjson", "msgspec",
+            "stdlib") or None/"auto" for the fastest installed backend
+
+    Returns:
+        JSONBackend object
+
+    Raises:
+        ImportError: If the named backend's package is not installed
+        ValueError: If the backend name is unknown
+    """
+    global _default_backend
+
+    if isinstance(backend, JSONBackend):
+        return backend
+
+    if backend is None or backend == "auto":
+        if _default_backend is None:
+            for backend_class in JSON_BACKENDS.values():
+                try:
+                    _default_backend = backend_class()
+                    break
+                except ImportError:
+                    continue
+        return _default_backend
+
+    try:
+        backend_class = JSON_BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Unknown JSON backend {backend!r}, expected one of {sorted(JSON_BACKENDS)}")
+
+    try:
+        return backend_class()
+    except ImportError:
+        raise ImportError(
+            f"The {backend} JSON backend requires the {backend} package. "
+            f"Install it with: pip install camera-streaming-sdk[{backend}]"
+        )
+
+
+class BinaryCodec:
+    """
+    Binary WebSocket frame codec, negotiated as a WebSocket subprotocol.
+
+    Subclasses implement :meth:`loads` and :meth:`dumps` and name the
+    subprotocol the server must select for the codec to be used. Decoding
+    errors must be raised as ValueError.
+    """
+
+    name = "base"
+    subprotocol = ""
+
+    def loads(self, data: bytes) -> Any:
+        """Decode a binary frame."""
+        raise NotImplementedError
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as a binary frame."""
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class MessagePackCodec(BinaryCodec):
+    """
+    MessagePack frames (``pip install camera-streaming-sdk[msgpack]``).
+
+    Uses msgspec when it is installed and the msgpack package otherwise.
+    """
+
+    name = "msgpack"
+    subprotocol = "camera-streaming.msgpack"
+
+    def __init__(self):
+        try:
+            import msgspec
+
+            self._loads = msgspec.msgpack.Decoder().decode
+            self._dumps = msgspec.msgpack.Encoder().encode
+        except ImportError:
+            import msgpack
+
+            self._loads = functools.partial(msgpack.unpackb, raw=False)
+            self._dumps = msgpack.packb
+
+    def loads(self, data: bytes) -> Any:
+        return self._loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj)
+
+
+class CBORCodec(BinaryCodec):
+    """CBOR frames (``pip install camera-streaming-sdk[cbor]``)."""
+
+    name = "cbor"
+    subprotocol = "camera-streaming.cbor"
+
+    def __init__(self):
+        import cbor2
+
+        self._loads = cbor2.loads
+        self._dumps = cbor2.dumps
+
+    def loads(self, data: bytes) -> Any:
+        return self._loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj)
+
+
+BINARY_CODECS: Dict[str, Type[BinaryCodec]] = {
+    "msgpack": MessagePackCodec,
+    "cbor": CBORCodec,
+}
+
+
+def get_binary_codec(codec: Union[str, BinaryCodec]) -> BinaryCodec:
+    """
+    Resolve a binary frame codec.
+
+    Args:
+        codec: Codec instance or name ("msgpack", "cbor")
+
+    Returns:
+        BinaryCodec object
+
+    Raises:
+        ImportError: If the codec's package is not installed
+        ValueError: If the codec name is unknown
+    """
+    if isinstance(codec, BinaryCodec):
+        return codec
+
+    try:
+        codec_class = BINARY_CODECS[codec]
+    except KeyError:
+        raise ValueError(f"Unknown binary codec {codec!r}, expected one of {sorted(BINARY_CODECS)}")
+
+    try:
+        return codec_class()
+    except ImportError:
+        raise ImportError(
+            f"The {codec} frame format requires an extra package. "
+            f"Install it with: pip install camera-streaming-sdk[{codec}]"
+        )
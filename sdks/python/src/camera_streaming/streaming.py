@@ -0,0 +1,205 @@
+"""
+Incremental JSON decoding of large list responses.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+_OUTSIDE_STRING = re.compile(r'["{}\[\]:,]')
+_INSIDE_STRING = re.compile(r'["\\]')
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]"
+
+_SEEKING = 0
+_ITEMS = 1
+_DONE = 2
+
+
+class JsonItemStream:
+    """
+    Push decoder yielding the elements of one array inside a JSON document.
+
+    Feed it the response body chunk by chunk; every call returns the array
+    elements completed so far. Only the current element and the text around
+    the array are buffered, so memory stays bounded by the largest element
+    rather than the size of the document.
+
+    Example:
+        >>> stream = JsonItemStream(("data", "items"))
+        >>> stream.feed(b'{"success": true, "data": {"items": [{"id": 1}, {"id"')
+        [{'id': 1}]
+        >>> stream.feed(b': 2}], "total": 2}}')
+        [{'id': 2}]
+        >>> stream.close()
+        {'success': True, 'data': {'items': [], 'total': 2}}
+    """
+
+    def __init__(self, path: Sequence[str] = ("data", "items")):
+        """
+        Initialize the decoder.
+
+        Args:
+            path: Object keys leading from the document root to the array
+        """
+        self.path = tuple(path)
+
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._state = _SEEKING
+        self._buffer = ""
+        self._pos = 0
+
+        # Scanner state while looking for the array
+        self._containers: List[Tuple[str, Optional[str]]] = []
+        self._in_string = False
+        self._string_start = 0
+        self._last_string: Optional[str] = None
+        self._key: Optional[str] = None
+
+        self._prefix = ""
+        self._suffix: List[str] = []
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Decode the next chunk of the body.
+
+        Args:
+            chunk: Raw bytes of the body
+
+        Returns:
+            Array elements completed by this chunk
+        """
+        return self._process(self._text.decode(chunk), final=False)
+
+    def close(self) -> Dict[str, Any]:
+        """
+        Finish decoding.
+
+        Returns:
+            The document with the array replaced by an empty list
+
+        Raises:
+            ValueError: If the document is malformed or was cut off
+        """
+        items = self._process(self._text.decode(b"", final=True), final=True)
+        if items:
+            raise ValueError("close() called before all array elements were consumed")
+
+        if self._state == _SEEKING:
+            return json.loads(self._buffer)
+        if self._state == _ITEMS:
+            raise ValueError("JSON document ended inside the streamed array")
+        return json.loads(self._prefix + "".join(self._suffix))
+
+    def _process(self, text: str, final: bool) -> List[Any]:
+        if self._state == _DONE:
+            if text:
+                self._suffix.append(text)
+            return []
+
+        self._buffer += text
+        if self._state == _SEEKING and not self._seek():
+            return []
+        return self._read_items(final)
+
+    def _seek(self) -> bool:
+        """Scan for the opening bracket of the array; True once it is found."""
+        buffer = self._buffer
+        pos = self._pos
+
+        while True:
+            if self._in_string:
+                match = _INSIDE_STRING.search(buffer, pos)
+                if match is None:
+                    break
+                pos = match.end()
+                if match.group() == "\\":
+                    if pos >= len(buffer):
+                        pos -= 1
+                        break
+                    pos += 1
+                    continue
+                self._in_string = False
+                self._last_string = json.loads(buffer[self._string_start - 1:pos])
+                continue
+
+            match = _OUTSIDE_STRING.search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+            char = match.group()
+            pos = match.end()
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = pos
+            elif char == ":":
+                self._key = self._last_string
+            elif char == ",":
+                self._key = None
+            elif char in "{[":
+                in_object = bool(self._containers) and self._containers[-1][0] == "{"
+                key = self._key if in_object else None
+                if char == "[" and key is not None and self._is_target(key):
+                    self._prefix = buffer[:pos]
+                    self._buffer = buffer[pos:]
+                    self._pos = 0
+                    self._state = _ITEMS
+                    return True
+                self._containers.append((char, key))
+                self._key = None
+            else:
+                if self._containers:
+                    self._containers.pop()
+                self._key = None
+
+        self._pos = pos
+        return False
+
+    def _is_target(self, key: str) -> bool:
+        """Check whether an array opened under ``key`` is the one to stream."""
+        if len(self._containers) != len(self.path):
+            return False
+        keys = [name for _, name in self._containers[1:]] + [key]
+        return all(kind == "{" for kind, _ in self._containers) and tuple(keys) == self.path
+
+    def _read_items(self, final: bool) -> List[Any]:
+        """Decode every complete element currently buffered."""
+        buffer = self._buffer
+        pos = self._pos
+        items = []
+
+        while True:
+            while pos < len(buffer) and (buffer[pos] in _WHITESPACE or buffer[pos] == ","):
+                pos += 1
+            if pos >= len(buffer):
+                break
+
+            if buffer[pos] == "]":
+                self._state = _DONE
+                self._suffix.append(buffer[pos:])
+                self._buffer = ""
+                self._pos = 0
+                return items
+
+            try:
+                item, end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                break
+            # A number cut at a chunk boundary ("4" of "4.5") only ends at a delimiter
+            if end >= len(buffer) and not final:
+                break
+            if end < len(buffer) and buffer[end] not in _DELIMITERS:
+                if final:
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buffer, end)
+                break
+            items.append(item)
+            pos = end
+
+        self._buffer = buffer[pos:]
+        self._pos = 0
+        return items
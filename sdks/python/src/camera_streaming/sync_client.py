@@ -0,0 +1,832 @@
+"""
+Synchronous client for the Camera Streaming Platform SDK.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar, Union
+
+import httpx
+
+from .bulk import BulkResult, run_bulk_sync
+from .cache import ResponseCache
+from .connection import build_limits, build_timeout, check_http2_support, raise_for_status
+from .core import MISSING, ApiCall, ClientCore
+from .exceptions import AuthenticationError, NetworkError
+from .models import (
+    AnalyticsOverview,
+    ApiToken,
+    Camera,
+    CameraFilters,
+    CreateApiTokenRequest,
+    CreateCameraRequest,
+    DashboardStats,
+    Page,
+    Recording,
+    RecordingFilters,
+    SystemHealth,
+    UpdateCameraRequest,
+    User,
+)
+from .pagination import SyncPageFetcher, fetch_all_pages_sync, iterate_pages_sync
+from .retry import RetryPolicy, RetryState
+from .serialization import JSONBackend
+from .streaming import JsonItemStream
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SyncCameraStreamingClient(ClientCore):
+    """
+    Synchronous client for the Camera Streaming Platform API.
+    
+    Mirrors CameraStreamingClient on a persistent ``httpx.Client`` connection
+    pool, so repeated calls reuse connections instead of paying for event
+    loop and connection setup each time. A single instance is safe to share
+    between threads.
+    
+    Example:
+        >>> client = SyncCameraStreamingClient("https://api.camera-streaming.example.com")
+        >>> client.login("username", "password")
+        >>> cameras = client.get_cameras()
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        timeout: float = 30.0,
+        retries: int = 3,
+        retry_delay: float = 1.0,
+        retry_policy: Optional[RetryPolicy] = None,
+        token_refresh_leeway: float = 30.0,
+        cache: Optional[ResponseCache] = None,
+        raw: bool = False,
+        lazy: bool = False,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        write_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        json_backend: Union[str, JSONBackend, None] = None,
+    ):
+        """
+        Initialize the synchronous Camera Streaming client.
+        
+        Args:
+            base_url: Base URL of the API
+            api_key: API key for authentication (optional)
+            timeout: Request timeout in seconds
+            retries: Number of retry attempts
+            retry_delay: Base delay for exponential backoff between retries in seconds
+            retry_policy: Custom retry policy (overrides retries and retry_delay)
+            token_refresh_leeway: Seconds before JWT expiry at which the access token is refreshed
+            cache: Response cache for read endpoints (optional)
+            raw: Return listing items as plain dicts by default
+            lazy: Return listing items as lazily validated proxies by default
+            max_connections: Maximum number of open connections in the pool
+            max_keepalive_connections: Maximum number of idle connections kept alive
+            keepalive_expiry: Seconds an idle connection is kept alive
+            http2: Whether to negotiate HTTP/2 (requires the http2 extra)
+            connect_timeout: Timeout for establishing a connection (defaults to timeout)
+            read_timeout: Timeout for receiving response data (defaults to timeout)
+            write_timeout: Timeout for sending request data (defaults to timeout)
+            pool_timeout: Timeout for acquiring a pooled connection (defaults to timeout)
+            transport: Pre-built transport to use instead of the pooled default
+            json_backend: JSON codec for request and response bodies: "orjson",
+                "msgspec", "stdlib", a JSONBackend instance, or None for the
+                fastest installed one
+        """
+        super().__init__(
+            base_url,
+            api_key,
+            timeout,
+            retries,
+            retry_delay,
+            retry_policy,
+            token_refresh_leeway,
+            cache,
+            raw,
+            lazy,
+            json_backend,
+        )
+        
+        self._refresh_lock = threading.Lock()
+        
+        # Create HTTP client
+        check_http2_support(http2 and transport is None)
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            timeout=build_timeout(timeout, connect_timeout, read_timeout, write_timeout, pool_timeout),
+            limits=build_limits(max_connections, max_keepalive_connections, keepalive_expiry),
+            http2=http2,
+            transport=transport,
+            headers={"Content-Type": "application/json"},
+        )
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+    def close(self):
+        """Close the HTTP client."""
+        self._client.close()
+
+    def _execute(self, call: ApiCall[T]) -> T:
+        """
+        Perform an API call, serving cacheable GETs from the response cache when enabled.
+        
+        Args:
+            call: API call to perform
+            
+        Returns:
+            Parsed response value
+        """
+        ttl = self._cache_ttl(call)
+        if not ttl:
+            response = self._make_request(call.method, call.path, call.data, call.params)
+            return self._read_response(call, response)
+        
+        value = self._cached_value(call)
+        if value is not MISSING:
+            return value
+        
+        entry, headers = self._revalidation(call)
+        response = self._make_request("GET", call.path, params=call.params, headers=headers)
+        return self._read_cached_response(call, ttl, entry, response)
+
+    def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """
+        Make an HTTP request with retry logic.
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            data: Request body data
+            params: Query parameters
+            headers: Extra request headers
+            stream: Return once the headers arrive; the caller reads and closes the body
+            
+        Returns:
+            HTTP response
+            
+        Raises:
+            CameraStreamingError: On API errors
+        """
+        url = f"{self.base_url}{endpoint}"
+        retry_state = self.retry_policy.start()
+        
+        while True:
+            try:
+                response = self._send_request(method, url, data, params, headers, retry_state, stream)
+            except httpx.RequestError as e:
+                delay = self._retry_delay_after_error(method, e, retry_state)
+                if delay is None:
+                    raise NetworkError(f"Network error: {str(e)}")
+                
+                time.sleep(delay)
+                continue
+            
+            delay = self._retry_delay_after_response(method, response, retry_state)
+            if delay is not None:
+                response.close()
+                time.sleep(delay)
+                continue
+            
+            if response.status_code >= 400:
+                response.read()
+            raise_for_status(response)
+            return response
+
+    def _send_request(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        retry_state: RetryState,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Send a single attempt, refreshing the access token once on 401."""
+        if self._access_token_expiring():
+            try:
+                self._refresh_access_token(self._access_token)
+            except Exception as e:
+                # Keep using the current token; if it is rejected, the 401 handling below refreshes again
+                logger.warning(f"Refreshing the access token ahead of expiry failed: {e}")
+        
+        sent_token = self._access_token
+        response = self._send_within_deadline(method, url, data, params, headers, retry_state, stream)
+        
+        # Handle authentication errors with token refresh, unless another
+        # thread already replaced the token this request was sent with
+        if response.status_code == 401 and self._refresh_token:
+            self._refresh_access_token_or_expire(sent_token)
+            response.close()
+            response = self._send_within_deadline(method, url, data, params, headers, retry_state, stream)
+        
+        return response
+
+    def _send_within_deadline(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        retry_state: RetryState,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Send a request, with timeouts capped by the remaining retry deadline."""
+        timeout = self._client.timeout
+        remaining = retry_state.remaining()
+        if remaining is not None:
+            if remaining <= 0:
+                raise NetworkError("Network error: request deadline exceeded")
+            timeout = httpx.Timeout(
+                connect=min(timeout.connect or remaining, remaining),
+                read=min(timeout.read or remaining, remaining),
+                write=min(timeout.write or remaining, remaining),
+                pool=min(timeout.pool or remaining, remaining),
+            )
+        
+        request = self._build_request(method, url, data, params, headers, timeout=timeout)
+        return self._client.send(request, stream=stream)
+
+    def _refresh_access_token_or_expire(self, stale_token: Optional[str] = None) -> None:
+        """Refresh the access token, reporting failures as an expired session."""
+        try:
+            self._refresh_access_token(stale_token)
+        except Exception:
+            raise AuthenticationError("Session expired. Please login again.")
+
+    def _refresh_access_token(self, stale_token: Optional[str] = None) -> None:
+        """
+        Refresh the access token using the refresh token.
+        
+        Threads that need a refresh at the same time wait for a single
+        refresh request.
+        
+        Args:
+            stale_token: Token the caller found expired; no refresh is made if
+                another thread has already replaced it
+        """
+        with self._refresh_lock:
+            if stale_token is not None and self._access_token != stale_token:
+                return
+            
+            self._apply_refresh_response(self._client.send(self._refresh_request()))
+
+    # Authentication methods
+    def login(self, username: str, password: str) -> User:
+        """
+        Login with username and password.
+        
+        Args:
+            username: Username
+            password: Password
+            
+        Returns:
+            User object
+            
+        Raises:
+            AuthenticationError: On login failure
+        """
+        return self._execute(self._login_call(username, password))
+
+    def logout(self) -> None:
+        """Logout and invalidate tokens."""
+        if self._refresh_token:
+            try:
+                self._execute(self._logout_call())
+            except Exception:
+                pass  # Ignore errors during logout
+        
+        self._clear_tokens()
+
+    def get_profile(self) -> User:
+        """
+        Get current user profile.
+        
+        Returns:
+            User object
+            
+        Raises:
+            AuthenticationError: If not authenticated
+        """
+        return self._execute(self._profile_call())
+
+    # Pagination helpers
+    def _page_fetcher(
+        self,
+        endpoint: str,
+        page_type: Type[Page],
+        filters: Optional[Union[CameraFilters, RecordingFilters]],
+        page_size: Optional[int],
+        error_message: str,
+    ) -> Tuple[SyncPageFetcher, int, int]:
+        """
+        Build a page fetcher for a listing.
+        
+        Returns:
+            Tuple of (fetch_page, first offset, page size)
+        """
+        page_call, offset, page_size = self._page_calls(endpoint, page_type, filters, page_size, error_message)
+
+        def fetch_page(page_offset: int, page_limit: int) -> Page:
+            return self._execute(page_call(page_offset, page_limit))
+
+        return fetch_page, offset, page_size
+
+    def _iter_pages(
+        self,
+        endpoint: str,
+        page_type: Type[Page],
+        filters: Optional[Union[CameraFilters, RecordingFilters]],
+        page_size: Optional[int],
+        prefetch: int,
+        error_message: str,
+    ) -> Iterator[Page]:
+        """Iterate over the pages of a listing with prefetching."""
+        fetch_page, offset, page_size = self._page_fetcher(endpoint, page_type, filters, page_size, error_message)
+        return iterate_pages_sync(fetch_page, offset=offset, page_size=page_size, prefetch=prefetch)
+
+    def _stream_items(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        parse_item: Callable[[Dict[str, Any]], T],
+        error_message: str,
+    ) -> Iterator[T]:
+        """
+        Stream the items of a listing response one at a time.
+        
+        ``data.items`` is decoded incrementally from the body stream, so only
+        the item being parsed is held in memory rather than the whole page.
+        Streamed requests bypass the response cache.
+        
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            parse_item: Function turning a decoded item into the yielded value
+            error_message: Error message used if the API reports a failure
+            
+        Yields:
+            Parsed items in response order
+        """
+        response = self._make_request("GET", endpoint, params=params, stream=True)
+        decoder = JsonItemStream(("data", "items"))
+        try:
+            for chunk in response.iter_bytes():
+                for item in decoder.feed(chunk):
+                    yield parse_item(item)
+            envelope = decoder.close()
+        finally:
+            response.close()
+        
+        self._check_stream_envelope(envelope, error_message)
+
+    # Camera management methods
+    def get_cameras(
+        self,
+        filters: Optional[CameraFilters] = None,
+        raw: Optional[bool] = None,
+        lazy: Optional[bool] = None,
+    ) -> List[Camera]:
+        """
+        Get list of cameras with optional filters.
+        
+        Args:
+            filters: Optional filters to apply
+            raw: Return plain dicts instead of models (defaults to the client setting)
+            lazy: Return proxies validating fields on first access (defaults to the client setting)
+            
+        Returns:
+            List of Camera objects
+        """
+        paginated_response = self._execute(self._cameras_call(filters, raw, lazy))
+        return paginated_response.items
+
+    def iter_cameras(
+        self,
+        filters: Optional[CameraFilters] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+        raw: Optional[bool] = None,
+        lazy: Optional[bool] = None,
+    ) -> Iterator[Camera]:
+        """
+        Iterate over all cameras matching the filters, page by page.
+        
+        The next pages are fetched while the current one is being consumed.
+        
+        Args:
+            filters: Optional filters to apply (limit and offset set the first page)
+            page_size: Number of cameras per request (defaults to filters.limit)
+            prefetch: Number of pages to fetch ahead of the consumer
+            raw: Return plain dicts instead of models (defaults to the client setting)
+            lazy: Return proxies validating fields on first access (defaults to the client setting)
+            
+        Yields:
+            Camera objects
+        """
+        page_type = self._listing_page_type(Camera, raw, lazy)
+        for page in self._iter_pages("/cameras", page_type, filters, page_size, prefetch, "Failed to get cameras"):
+            for camera in page.items:
+                yield camera
+
+    def get_camera(self, camera_id: str) -> Camera:
+        """
+        Get a specific camera by ID.
+        
+        Args:
+            camera_id: Camera ID
+            
+        Returns:
+            Camera object
+            
+        Raises:
+            NotFoundError: If camera not found
+        """
+        return self._execute(self._camera_call(camera_id))
+
+    def create_camera(self, camera_data: CreateCameraRequest) -> Camera:
+        """
+        Create a new camera.
+        
+        Args:
+            camera_data: Camera creation data
+            
+        Returns:
+            Created Camera object
+        """
+        return self._execute(self._create_camera_call(camera_data))
+
+    def update_camera(self, camera_id: str, updates: UpdateCameraRequest) -> Camera:
+        """
+        Update an existing camera.
+        
+        Args:
+            camera_id: Camera ID
+            updates: Camera update data
+            
+        Returns:
+            Updated Camera object
+        """
+        return self._execute(self._update_camera_call(camera_id, updates))
+
+    def delete_camera(self, camera_id: str) -> None:
+        """
+        Delete a camera.
+        
+        Args:
+            camera_id: Camera ID
+        """
+        self._execute(self._delete_camera_call(camera_id))
+
+    def activate_camera(self, camera_id: str) -> None:
+        """
+        Activate a camera.
+        
+        Args:
+            camera_id: Camera ID
+        """
+        self._execute(self._activate_camera_call(camera_id))
+
+    def deactivate_camera(self, camera_id: str) -> None:
+        """
+        Deactivate a camera.
+        
+        Args:
+            camera_id: Camera ID
+        """
+        self._execute(self._deactivate_camera_call(camera_id))
+
+    def toggle_recording(self, camera_id: str) -> bool:
+        """
+        Toggle recording for a camera.
+        
+        Args:
+            camera_id: Camera ID
+            
+        Returns:
+            New recording status
+        """
+        return self._execute(self._toggle_recording_call(camera_id))
+
+    # Bulk camera operations
+    def bulk_activate(self, camera_ids: Iterable[str], concurrency: int = 10) -> BulkResult:
+        """
+        Activate many cameras.
+        
+        Args:
+            camera_ids: Camera IDs
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            BulkResult mapping each camera ID to None or its error
+        """
+        return run_bulk_sync(camera_ids, self.activate_camera, concurrency)
+
+    def bulk_deactivate(self, camera_ids: Iterable[str], concurrency: int = 10) -> BulkResult:
+        """
+        Deactivate many cameras.
+        
+        Args:
+            camera_ids: Camera IDs
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            BulkResult mapping each camera ID to None or its error
+        """
+        return run_bulk_sync(camera_ids, self.deactivate_camera, concurrency)
+
+    def bulk_update(
+        self,
+        camera_ids: Iterable[str],
+        updates: UpdateCameraRequest,
+        concurrency: int = 10,
+    ) -> BulkResult:
+        """
+        Apply the same update to many cameras.
+        
+        Args:
+            camera_ids: Camera IDs
+            updates: Camera update data
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            BulkResult mapping each camera ID to the updated Camera or its error
+        """
+        return run_bulk_sync(camera_ids, lambda camera_id: self.update_camera(camera_id, updates), concurrency)
+
+    def bulk_toggle_recording(self, camera_ids: Iterable[str], concurrency: int = 10) -> BulkResult:
+        """
+        Toggle recording for many cameras.
+        
+        Args:
+            camera_ids: Camera IDs
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            BulkResult mapping each camera ID to its new recording status or its error
+        """
+        return run_bulk_sync(camera_ids, self.toggle_recording, concurrency)
+
+    # Recording management methods
+    def get_recordings(
+        self,
+        filters: Optional[RecordingFilters] = None,
+        raw: Optional[bool] = None,
+        lazy: Optional[bool] = None,
+    ) -> List[Recording]:
+        """
+        Get list of recordings with optional filters.
+        
+        Args:
+            filters: Optional filters to apply
+            raw: Return plain dicts instead of models (defaults to the client setting)
+            lazy: Return proxies validating fields on first access (defaults to the client setting)
+            
+        Returns:
+            List of Recording objects
+        """
+        paginated_response = self._execute(self._recordings_call(filters, raw, lazy))
+        return paginated_response.items
+
+    def iter_recordings(
+        self,
+        filters: Optional[RecordingFilters] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+        raw: Optional[bool] = None,
+        lazy: Optional[bool] = None,
+    ) -> Iterator[Recording]:
+        """
+        Iterate over all recordings matching the filters, page by page.
+        
+        The next pages are fetched while the current one is being consumed.
+        
+        Args:
+            filters: Optional filters to apply (limit and offset set the first page)
+            page_size: Number of recordings per request (defaults to filters.limit)
+            prefetch: Number of pages to fetch ahead of the consumer
+            raw: Return plain dicts instead of models (defaults to the client setting)
+            lazy: Return proxies validating fields on first access (defaults to the client setting)
+            
+        Yields:
+            Recording objects
+        """
+        for page in self._iter_pages(
+            "/recordings", self._listing_page_type(Recording, raw, lazy), filters, page_size, prefetch, "Failed to get recordings"
+        ):
+            for recording in page.items:
+                yield recording
+
+    def fetch_all_recordings(
+        self,
+        filters: Optional[RecordingFilters] = None,
+        concurrency: int = 4,
+        page_size: Optional[int] = None,
+        raw: Optional[bool] = None,
+        lazy: Optional[bool] = None,
+    ) -> List[Recording]:
+        """
+        Fetch all recordings matching the filters, requesting pages in parallel.
+        
+        The first page reports the total number of rows; the remaining pages
+        are then fetched concurrently and reassembled in order.
+        
+        Args:
+            filters: Optional filters to apply (limit and offset set the first page)
+            concurrency: Maximum number of page requests in flight
+            page_size: Number of recordings per request (defaults to filters.limit)
+            raw: Return plain dicts instead of models (defaults to the client setting)
+            lazy: Return proxies validating fields on first access (defaults to the client setting)
+            
+        Returns:
+            List of Recording objects
+        """
+        fetch_page, offset, page_size = self._page_fetcher(
+            "/recordings", self._listing_page_type(Recording, raw, lazy), filters, page_size, "Failed to get recordings"
+        )
+        pages = fetch_all_pages_sync(fetch_page, offset=offset, page_size=page_size, concurrency=concurrency)
+        return [recording for page in pages for recording in page.items]
+
+    def stream_recordings(
+        self,
+        filters: Optional[RecordingFilters] = None,
+        raw: Optional[bool] = None,
+        lazy: Optional[bool] = None,
+    ) -> Iterator[Recording]:
+        """
+        Stream one (typically large) page of recordings, one recording at a time.
+        
+        The response body is decoded incrementally, so peak memory is bounded
+        by a single recording instead of the page size. Use filters.limit to
+        request a large page.
+        
+        Args:
+            filters: Optional filters to apply
+            raw: Return plain dicts instead of models (defaults to the client setting)
+            lazy: Return proxies validating fields on first access (defaults to the client setting)
+            
+        Yields:
+            Recording objects
+        """
+        parse_item = self._listing_item_parser(Recording, raw, lazy)
+        for recording in self._stream_items(
+            "/recordings", self._filter_params(filters), parse_item, "Failed to get recordings"
+        ):
+            yield recording
+
+    def get_recording(self, recording_id: str) -> Recording:
+        """
+        Get a specific recording by ID.
+        
+        Args:
+            recording_id: Recording ID
+            
+        Returns:
+            Recording object
+        """
+        return self._execute(self._recording_call(recording_id))
+
+    def get_recording_download_url(self, recording_id: str) -> str:
+        """
+        Get download URL for a recording.
+        
+        Args:
+            recording_id: Recording ID
+            
+        Returns:
+            Download URL
+        """
+        return self._execute(self._recording_download_url_call(recording_id))
+
+    def delete_recording(self, recording_id: str) -> None:
+        """
+        Delete a recording.
+        
+        Args:
+            recording_id: Recording ID
+        """
+        self._execute(self._delete_recording_call(recording_id))
+
+    # API Token management methods
+    def get_api_tokens(self) -> List[ApiToken]:
+        """
+        Get list of API tokens.
+        
+        Returns:
+            List of ApiToken objects
+        """
+        return self._execute(self._api_tokens_call())
+
+    def create_api_token(self, token_data: CreateApiTokenRequest) -> Dict[str, Any]:
+        """
+        Create a new API token.
+        
+        Args:
+            token_data: Token creation data
+            
+        Returns:
+            Dictionary with token info and API key
+        """
+        return self._execute(self._create_api_token_call(token_data))
+
+    def delete_api_token(self, token_id: str) -> None:
+        """
+        Delete an API token.
+        
+        Args:
+            token_id: Token ID
+        """
+        self._execute(self._delete_api_token_call(token_id))
+
+    # Dashboard and analytics methods
+    def get_dashboard_stats(self) -> DashboardStats:
+        """
+        Get dashboard statistics.
+        
+        Returns:
+            DashboardStats object
+        """
+        return self._execute(self._dashboard_stats_call())
+
+    def get_system_health(self) -> SystemHealth:
+        """
+        Get system health information.
+        
+        Returns:
+            SystemHealth object
+        """
+        return self._execute(self._system_health_call())
+
+    def get_analytics_overview(self, time_range: str = "24h") -> AnalyticsOverview:
+        """
+        Get analytics overview.
+        
+        Args:
+            time_range: Time range for analytics (e.g., "24h", "7d", "30d")
+            
+        Returns:
+            AnalyticsOverview object
+        """
+        return self._execute(self._analytics_overview_call(time_range))
+
+    # Streaming methods
+    def get_stream_url(self, camera_id: str, quality: Optional[str] = None) -> str:
+        """
+        Get HLS stream URL for a camera.
+        
+        Args:
+            camera_id: Camera ID
+            quality: Stream quality (optional)
+            
+        Returns:
+            Stream URL
+        """
+        return self._execute(self._stream_url_call(camera_id, quality))
+
+    def get_webrtc_offer(self, camera_id: str) -> Dict[str, Any]:
+        """
+        Get WebRTC offer for a camera.
+        
+        Args:
+            camera_id: Camera ID
+            
+        Returns:
+            WebRTC offer
+        """
+        return self._execute(self._webrtc_offer_call(camera_id))
+
+    def send_webrtc_answer(self, camera_id: str, answer: Dict[str, Any]) -> None:
+        """
+        Send WebRTC answer for a camera.
+        
+        Args:
+            camera_id: Camera ID
+            answer: WebRTC answer
+        """
+        self._execute(self._webrtc_answer_call(camera_id, answer))
@@ -3,19 +3,36 @@ WebSocket client for real-time updates from the Camera Streaming Platform.
 """
 
 import asyncio
-import json
 import logging
-from typing import Any, Callable, Dict, List, Optional, Set
+import random
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
 from urllib.parse import urljoin
 
 import websockets
 from websockets.exceptions import ConnectionClosed, WebSocketException
+from websockets.extensions.permessage_deflate import ClientPerMessageDeflateFactory
+from websockets.version import version as websockets_version
 
+from pydantic import BaseModel, ValidationError as PydanticValidationError
+
+from .dispatch import EventCoalescer, EventDispatcher, EventKey, EventStream, OverflowPolicy, call_handler
 from .exceptions import WebSocketError
 from .models import AlertNotification, CameraStatusUpdate, DashboardUpdate, WebSocketMessage
+from .serialization import BinaryCodec, JSONBackend, get_binary_codec, get_json_backend
 
 logger = logging.getLogger(__name__)
 
+# websockets 14 replaced the legacy client, which took extra_headers
+_HEADERS_ARGUMENT = "additional_headers" if int(websockets_version.split(".")[0]) >= 14 else "extra_headers"
+
+# Event types delivered as models; all others are delivered as raw dicts
+EVENT_MODELS: Dict[str, Type[BaseModel]] = {
+    "cameraStatusUpdate": CameraStatusUpdate,
+    "dashboardUpdate": DashboardUpdate,
+    "alert": AlertNotification,
+}
+
 
 class WebSocketClient:
     """
@@ -34,7 +51,26 @@ class WebSocketClient:
         token: str,
         reconnect: bool = True,
         reconnect_interval: float = 5.0,
-        max_reconnect_attempts: int = 10,
+        max_reconnect_attempts: Optional[int] = 10,
+        max_reconnect_interval: float = 60.0,
+        reconnect_jitter: bool = True,
+        ping_interval: Optional[float] = 20.0,
+        ping_timeout: Optional[float] = 20.0,
+        stale_timeout: Optional[float] = None,
+        json_backend: Union[str, JSONBackend, None] = None,
+        compression: Optional[str] = "deflate",
+        compression_level: Optional[int] = None,
+        compression_window_bits: Optional[int] = None,
+        binary_formats: Iterable[Union[str, BinaryCodec]] = (),
+        dispatch_workers: int = 1,
+        dispatch_queue_size: int = 1000,
+        overflow_policy: Union[OverflowPolicy, str] = OverflowPolicy.BLOCK,
+        handler_executor: Optional[Executor] = None,
+        run_sync_handlers_in_thread: bool = True,
+        coalesce_events: Optional[Iterable[str]] = None,
+        coalesce_interval: float = 0.1,
+        coalesce_max_batch: int = 1000,
+        subscribe_batch_size: int = 1,
     ):
         """
         Initialize the WebSocket client.
@@ -43,22 +79,92 @@ class WebSocketClient:
             url: WebSocket URL
             token: JWT token for authentication
             reconnect: Whether to auto-reconnect on disconnect
-            reconnect_interval: Interval between reconnect attempts in seconds
-            max_reconnect_attempts: Maximum number of reconnect attempts
+            reconnect_interval: Base delay before a reconnect attempt in seconds; doubles per failed attempt
+            max_reconnect_attempts: Consecutive failed reconnect attempts before giving up (None for no limit)
+            max_reconnect_interval: Upper bound of the reconnect delay in seconds
+            reconnect_jitter: Whether to pick each delay at random between 0 and the backoff,
+                so that many clients do not reconnect in lockstep
+            ping_interval: Seconds between heartbeat pings (None to disable)
+            ping_timeout: Seconds to wait for a pong before the connection is considered dead
+            stale_timeout: Reconnect when no message arrives for this many seconds (None to disable)
+            json_backend: JSON codec for messages: "orjson", "msgspec", "stdlib",
+                a JSONBackend instance, or None for the fastest installed one
+            compression: "deflate" to negotiate permessage-deflate, or None to disable it
+            compression_level: zlib compression level (1-9) of outgoing frames
+            compression_window_bits: Maximum LZ77 window size (8-15) requested from the
+                server and used by the client; smaller windows use less memory per connection
+            binary_formats: Binary frame formats to offer, in order of preference
+                ("msgpack", "cbor"); used only if the server selects one, JSON text otherwise
+            dispatch_workers: Concurrent handler workers per event type
+            dispatch_queue_size: Maximum number of pending events per event type
+            overflow_policy: What to do when an event queue is full: "block",
+                "drop_oldest" or "coalesce" (keep only the latest event per camera)
+            handler_executor: Thread pool for sync handlers (the loop's default if None)
+            run_sync_handlers_in_thread: Whether sync handlers of server events run on handler_executor
+                so they never block the event loop (False runs them on the loop, for handlers that are not thread-safe)
+            coalesce_events: Event types to coalesce per camera, e.g. ("cameraStatusUpdate",
+                "streamQualityUpdate"); their handlers receive a list of the latest event per camera
+            coalesce_interval: Maximum seconds a coalesced event waits before its batch is delivered
+            coalesce_max_batch: Number of cameras in a batch that triggers immediate delivery
+            subscribe_batch_size: Topics per subscribe/unsubscribe frame; above 1, frames carry
+                a "topics" list, which the server must support
         """
+        if subscribe_batch_size <= 0:
+            raise ValueError("subscribe_batch_size must be positive")
+        if compression not in (None, "deflate"):
+            raise ValueError(f"Unsupported compression {compression!r}, expected 'deflate' or None")
+        
         self.url = url
         self.token = token
         self.reconnect = reconnect
         self.reconnect_interval = reconnect_interval
         self.max_reconnect_attempts = max_reconnect_attempts
+        self.max_reconnect_interval = max_reconnect_interval
+        self.reconnect_jitter = reconnect_jitter
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+        self.stale_timeout = stale_timeout
+        self.json_backend = get_json_backend(json_backend)
+        self.compression = compression
+        self.compression_level = compression_level
+        self.compression_window_bits = compression_window_bits
+        self.binary_codecs: List[BinaryCodec] = [get_binary_codec(codec) for codec in binary_formats]
+        self.subscribe_batch_size = subscribe_batch_size
         
         self._websocket: Optional[websockets.WebSocketServerProtocol] = None
         self._event_handlers: Dict[str, List[Callable]] = {}
+        self._raw_handlers: Dict[str, List[Callable]] = {}
+        self._streams: Dict[str, List[EventStream]] = {}
         self._subscriptions: Set[str] = set()
         self._reconnect_attempts = 0
         self._is_connected = False
         self._should_reconnect = True
-        self._listen_task: Optional[asyncio.Task] = None
+        self._supervisor_task: Optional[asyncio.Task] = None
+        self._resume_cursor: Optional[str] = None
+        self._codec: Optional[BinaryCodec] = None
+        self._transport_stats = {
+            "messages_received": 0,
+            "payload_bytes_received": 0,
+            "wire_bytes_received": 0,
+            "messages_sent": 0,
+            "payload_bytes_sent": 0,
+        }
+        self._dispatcher = EventDispatcher(
+            lambda event_type: self._event_handlers.get(event_type, []),
+            workers=dispatch_workers,
+            queue_size=dispatch_queue_size,
+            overflow=overflow_policy,
+            executor=handler_executor,
+            run_sync_in_thread=run_sync_handlers_in_thread,
+            parse=self._parse_event,
+            is_raw=lambda event_type, handler: handler in self._raw_handlers.get(event_type, ()),
+        )
+        self._coalescer = EventCoalescer(
+            coalesce_events or (),
+            self._dispatcher.dispatch,
+            interval=coalesce_interval,
+            max_batch=coalesce_max_batch,
+        )
 
     async def connect(self) -> None:
         """
@@ -67,127 +173,262 @@ class WebSocketClient:
         Raises:
             WebSocketError: On connection failure
         """
-        try:
-            headers = {"Authorization": f"Bearer {self.token}"}
-            self._websocket = await websockets.connect(self.url, extra_headers=headers)
-            self._is_connected = True
-            self._reconnect_attempts = 0
-            
-            # Start listening for messages
-            self._listen_task = asyncio.create_task(self._listen())
-            
-            # Emit connected event
-            await self._emit_event("connected", {})
-            
-            logger.info("WebSocket connected successfully")
-            
-        except Exception as e:
-            logger.error(f"Failed to connect to WebSocket: {e}")
-            raise WebSocketError(f"Connection failed: {str(e)}")
+        if self._is_connected:
+            return
+        
+        self._should_reconnect = True
+        await self._open()
+        self._reconnect_attempts = 0
+        
+        # A single supervisor task reads messages and reconnects for the client's lifetime
+        self._supervisor_task = asyncio.create_task(self._supervise())
+        
+        await self._emit_event("connected", {})
+        logger.info("WebSocket connected successfully")
 
     async def disconnect(self) -> None:
         """Disconnect from the WebSocket server."""
         self._should_reconnect = False
         self._is_connected = False
         
-        if self._listen_task:
-            self._listen_task.cancel()
+        if self._supervisor_task:
+            self._supervisor_task.cancel()
             try:
-                await self._listen_task
+                await self._supervisor_task
             except asyncio.CancelledError:
                 pass
+            self._supervisor_task = None
         
         if self._websocket:
             await self._websocket.close()
             self._websocket = None
         
+        for streams in list(self._streams.values()):
+            for stream in list(streams):
+                stream.close()
+        await self._coalescer.close()
+        await self._dispatcher.close()
         await self._emit_event("disconnected", {"code": 1000, "reason": "Client disconnect"})
         logger.info("WebSocket disconnected")
 
-    async def _listen(self) -> None:
-        """Listen for incoming WebSocket messages."""
+    async def _open(self) -> None:
+        """
+        Open the socket, with library-level ping/pong heartbeats.
+        
+        Raises:
+            WebSocketError: On connection failure
+        """
+        options: Dict[str, Any] = {_HEADERS_ARGUMENT: {"Authorization": f"Bearer {self.token}"}}
+        if self.compression is None:
+            options["compression"] = None
+        elif self.compression_level is not None or self.compression_window_bits is not None:
+            options["compression"] = None
+            options["extensions"] = [
+                ClientPerMessageDeflateFactory(
+                    server_max_window_bits=self.compression_window_bits,
+                    client_max_window_bits=self.compression_window_bits or True,
+                    compress_settings={"level": self.compression_level} if self.compression_level is not None else None,
+                )
+            ]
+        if self.binary_codecs:
+            options["subprotocols"] = [codec.subprotocol for codec in self.binary_codecs]
+        
+        try:
+            self._websocket = await websockets.connect(
+                self.url,
+                ping_interval=self.ping_interval,
+                ping_timeout=self.ping_timeout,
+                **options,
+            )
+        except Exception as e:
+            logger.error(f"Failed to connect to WebSocket: {e}")
+            raise WebSocketError(f"Connection failed: {str(e)}")
+        
+        subprotocol = self._websocket.subprotocol
+        self._codec = next((codec for codec in self.binary_codecs if codec.subprotocol == subprotocol), None)
+        self._count_wire_bytes(self._websocket)
+        self._is_connected = True
+
+    def _count_wire_bytes(self, websocket: Any) -> None:
+        """Count the bytes read from the socket, before decompression, for transport_stats()."""
+        data_received = websocket.data_received
+        stats = self._transport_stats
+        
+        def counting_data_received(data: bytes) -> None:
+            stats["wire_bytes_received"] += len(data)
+            data_received(data)
+        
+        websocket.data_received = counting_data_received
+
+    async def _supervise(self) -> None:
+        """Read messages until the connection drops, then reconnect, in a loop."""
+        while True:
+            close_code, close_reason = await self._listen()
+            self._is_connected = False
+            
+            if not (self._should_reconnect and self.reconnect):
+                await self._emit_event("disconnected", {"code": close_code, "reason": close_reason})
+                return
+            if not await self._reconnect():
+                return
+
+    async def _listen(self) -> Tuple[int, str]:
+        """
+        Read and handle messages until the connection closes or goes stale.
+        
+        Returns:
+            Close code and reason
+        """
         try:
-            async for message in self._websocket:
+            while True:
+                if self.stale_timeout is None:
+                    message = await self._websocket.recv()
+                else:
+                    message = await asyncio.wait_for(self._websocket.recv(), self.stale_timeout)
+                
+                stats = self._transport_stats
+                stats["messages_received"] += 1
+                stats["payload_bytes_received"] += len(message)
+                
                 try:
-                    data = json.loads(message)
-                    await self._handle_message(data)
-                except json.JSONDecodeError:
+                    if self._codec is not None and isinstance(message, bytes):
+                        data = self._codec.loads(message)
+                    else:
+                        data = self.json_backend.loads(message)
+                except ValueError:
                     logger.error(f"Failed to parse WebSocket message: {message}")
+                    continue
+                
+                if isinstance(data, dict) and data.get("timestamp") is not None:
+                    self._resume_cursor = data["timestamp"]
+                
+                try:
+                    await self._handle_message(data)
                 except Exception as e:
                     logger.error(f"Error handling WebSocket message: {e}")
                     await self._emit_event("error", {"message": str(e)})
                     
+        except asyncio.TimeoutError:
+            logger.warning(f"No WebSocket message for {self.stale_timeout}s, reconnecting")
+            await self._close_quietly()
+            return 1006, "Stale connection"
+            
         except ConnectionClosed as e:
             logger.warning(f"WebSocket connection closed: {e}")
-            self._is_connected = False
-            
-            if self._should_reconnect and self.reconnect:
-                await self._attempt_reconnect()
-            else:
-                await self._emit_event("disconnected", {"code": e.code, "reason": e.reason})
+            return e.code, e.reason
                 
         except WebSocketException as e:
             logger.error(f"WebSocket error: {e}")
-            self._is_connected = False
             await self._emit_event("error", {"message": str(e)})
-            
-            if self._should_reconnect and self.reconnect:
-                await self._attempt_reconnect()
-
-    async def _attempt_reconnect(self) -> None:
-        """Attempt to reconnect to the WebSocket server."""
-        if self._reconnect_attempts >= self.max_reconnect_attempts:
-            logger.error("Max reconnect attempts reached")
-            await self._emit_event("error", {"message": "Max reconnect attempts reached"})
-            return
-        
-        self._reconnect_attempts += 1
-        await self._emit_event("reconnecting", {"attempt": self._reconnect_attempts})
-        
-        logger.info(f"Attempting to reconnect... (attempt {self._reconnect_attempts})")
-        
-        await asyncio.sleep(self.reconnect_interval)
+            await self._close_quietly()
+            return 1006, str(e)
+
+    async def _reconnect(self) -> bool:
+        """
+        Reconnect with exponential backoff until it succeeds or the budget runs out.
         
-        try:
-            await self.connect()
+        Returns:
+            True once reconnected and resubscribed, False after giving up
+        """
+        while self.max_reconnect_attempts is None or self._reconnect_attempts < self.max_reconnect_attempts:
+            self._reconnect_attempts += 1
+            attempt = self._reconnect_attempts
+            delay = self._backoff_delay(attempt)
+            await self._emit_event("reconnecting", {"attempt": attempt, "delay": delay})
             
-            # Re-subscribe to previous subscriptions
-            for subscription in self._subscriptions.copy():
-                await self._send_message({"type": "subscribe", "data": {"topic": subscription}})
-                
-        except Exception as e:
-            logger.error(f"Reconnect attempt {self._reconnect_attempts} failed: {e}")
-            await self._attempt_reconnect()
+            logger.info(f"Attempting to reconnect in {delay:.2f}s... (attempt {attempt})")
+            await asyncio.sleep(delay)
+            
+            try:
+                await self._open()
+                # Re-subscribe to previous subscriptions in bulk, resuming after the last message seen
+                await self._send_topic_frames("subscribe", sorted(self._subscriptions), since=self._resume_cursor)
+            except WebSocketError as e:
+                logger.error(f"Reconnect attempt {attempt} failed: {e}")
+                await self._close_quietly()
+                self._is_connected = False
+                continue
+            
+            self._reconnect_attempts = 0
+            await self._emit_event("connected", {"reconnected": True, "attempts": attempt})
+            logger.info("WebSocket reconnected")
+            return True
+        
+        logger.error("Max reconnect attempts reached")
+        await self._emit_event("error", {"message": "Max reconnect attempts reached"})
+        await self._emit_event("reconnectFailed", {"attempts": self._reconnect_attempts})
+        return False
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Get the delay before a reconnect attempt (full-jitter exponential backoff)."""
+        backoff = min(self.max_reconnect_interval, self.reconnect_interval * 2 ** min(attempt - 1, 32))
+        if self.reconnect_jitter:
+            return random.uniform(0, backoff)
+        return backoff
+
+    async def _close_quietly(self) -> None:
+        """Close the current socket, ignoring errors."""
+        websocket, self._websocket = self._websocket, None
+        if websocket is not None:
+            try:
+                await websocket.close()
+            except Exception:
+                pass
 
     async def _handle_message(self, data: Dict[str, Any]) -> None:
-        """Handle incoming WebSocket messages."""
+        """
+        Handle incoming WebSocket messages.
+        
+        Events are queued for their handlers as raw data, so slow handlers
+        do not stop the socket from being read. Models are built by the
+        dispatch workers, and only for handlers that are not raw; messages
+        without handlers or matching streams are never parsed.
+        """
         message_type = data.get("type")
         message_data = data.get("data", {})
+        event = None
         
-        if message_type == "cameraStatusUpdate":
-            update = CameraStatusUpdate(**message_data)
-            await self._emit_event("cameraStatusUpdate", update)
-            
-        elif message_type == "dashboardUpdate":
-            update = DashboardUpdate(**message_data)
-            await self._emit_event("dashboardUpdate", update)
-            
-        elif message_type == "alert":
-            alert = AlertNotification(**message_data)
-            await self._emit_event("alert", alert)
-            
-        elif message_type == "streamQualityUpdate":
-            await self._emit_event("streamQualityUpdate", message_data)
-            
-        elif message_type == "recordingEvent":
-            await self._emit_event("recordingEvent", message_data)
-            
-        elif message_type == "error":
-            await self._emit_event("error", message_data)
-            
+        # Streams filter on the raw data, so unwanted events are never parsed
+        streams = self._streams.get(message_type)
+        if streams:
+            for stream in streams:
+                if stream.accepts(message_data):
+                    if stream.raw:
+                        await stream.put(message_data)
+                        continue
+                    if event is None:
+                        event = self._parse_event(message_type, message_data)
+                    await stream.put(event)
+        
+        if not self._event_handlers.get(message_type):
+            return
+        
+        # Superseded events are dropped before they are parsed
+        if message_type in self._coalescer.event_types:
+            await self._coalescer.add(message_type, message_data)
         else:
-            # Generic message handling
-            await self._emit_event(message_type, message_data)
+            await self._dispatcher.dispatch(message_type, message_data)
+
+    def _parse_event(self, event_type: str, data: Union[Dict[str, Any], List[Dict[str, Any]]]) -> Any:
+        """
+        Build the model(s) of an event or coalesced batch; untyped events stay raw dicts.
+        
+        Invalid items of a batch are logged and dropped so that the valid ones
+        are still delivered. A batch without any valid item yields None.
+        """
+        model = EVENT_MODELS.get(event_type)
+        if model is None:
+            return data
+        if not isinstance(data, list):
+            return model(**data)
+        
+        events = []
+        for item in data:
+            try:
+                events.append(model(**item))
+            except (PydanticValidationError, TypeError) as e:
+                logger.error(f"Dropping invalid {event_type} event {item}: {e}")
+        return events or None
 
     async def _send_message(self, message: Dict[str, Any]) -> None:
         """
@@ -203,35 +444,47 @@ class WebSocketClient:
             raise WebSocketError("WebSocket is not connected")
         
         try:
-            await self._websocket.send(json.dumps(message))
+            await self._send_frame(self._encode(message))
         except Exception as e:
             logger.error(f"Failed to send WebSocket message: {e}")
             raise WebSocketError(f"Failed to send message: {str(e)}")
 
+    def _encode(self, message: Dict[str, Any]) -> Union[str, bytes]:
+        """Encode a message as a binary frame if a binary format was negotiated, JSON text otherwise."""
+        if self._codec is not None:
+            return self._codec.dumps(message)
+        return self.json_backend.dumps_text(message)
+
+    async def _send_frame(self, frame: Union[str, bytes]) -> None:
+        await self._websocket.send(frame)
+        self._transport_stats["messages_sent"] += 1
+        self._transport_stats["payload_bytes_sent"] += len(frame)
+
     async def _emit_event(self, event_type: str, data: Any) -> None:
-        """Emit an event to registered handlers."""
+        """Emit a connection lifecycle event to registered handlers inline."""
         handlers = self._event_handlers.get(event_type, [])
         for handler in handlers:
             try:
-                if asyncio.iscoroutinefunction(handler):
-                    await handler(data)
-                else:
-                    handler(data)
+                await call_handler(handler, data, run_sync_in_thread=False)
             except Exception as e:
                 logger.error(f"Error in event handler for {event_type}: {e}")
 
     # Event handling methods
-    def on(self, event_type: str, handler: Callable) -> None:
+    def on(self, event_type: str, handler: Callable, raw: bool = False) -> None:
         """
         Register an event handler.
         
         Args:
             event_type: Type of event to listen for
             handler: Handler function (can be sync or async)
+            raw: Pass the message's raw "data" dict instead of a model, skipping
+                validation (e.g. ``{"cameraId": ..., "status": ...}``)
         """
         if event_type not in self._event_handlers:
             self._event_handlers[event_type] = []
         self._event_handlers[event_type].append(handler)
+        if raw:
+            self._raw_handlers.setdefault(event_type, []).append(handler)
 
     def off(self, event_type: str, handler: Optional[Callable] = None) -> None:
         """
@@ -244,10 +497,90 @@ class WebSocketClient:
         if event_type in self._event_handlers:
             if handler is None:
                 del self._event_handlers[event_type]
+                self._raw_handlers.pop(event_type, None)
             else:
                 self._event_handlers[event_type] = [
                     h for h in self._event_handlers[event_type] if h != handler
                 ]
+                if event_type in self._raw_handlers:
+                    self._raw_handlers[event_type] = [
+                        h for h in self._raw_handlers[event_type] if h != handler
+                    ]
+
+    def configure_event(
+        self,
+        event_type: str,
+        workers: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        overflow: Optional[Union[OverflowPolicy, str]] = None,
+        key: Optional[EventKey] = None,
+    ) -> None:
+        """
+        Override how events of one type are dispatched to their handlers.
+        
+        Must be called before the first event of that type arrives.
+        
+        Args:
+            event_type: Type of event, e.g. "cameraStatusUpdate"
+            workers: Number of handler calls in flight for this event type
+            queue_size: Maximum number of pending events
+            overflow: "block", "drop_oldest" or "coalesce"
+            key: Function returning the coalescing key of an event (camera ID by default)
+        """
+        self._dispatcher.configure(event_type, workers=workers, queue_size=queue_size, overflow=overflow, key=key)
+
+    def events(
+        self,
+        event_type: str,
+        camera_ids: Optional[Iterable[str]] = None,
+        maxsize: int = 1000,
+        overflow: Union[OverflowPolicy, str] = OverflowPolicy.BLOCK,
+        raw: bool = False,
+    ) -> EventStream:
+        """
+        Consume events of one type with ``async for``.
+        
+        The stream is registered immediately, so no events are missed
+        between this call and the start of the loop. Events of other
+        cameras are filtered out before they are parsed.
+        
+        Example:
+            >>> async for update in ws_client.events("cameraStatusUpdate", camera_ids=["cam-1"]):
+            ...     print(update.status)
+        
+        Args:
+            event_type: Event type, e.g. "cameraStatusUpdate"
+            camera_ids: Only deliver events of these cameras (all events if None)
+            maxsize: Maximum number of buffered events
+            overflow: What to do when the buffer is full: "block" (pause reading
+                the socket), "drop_oldest" or "coalesce" (latest event per camera)
+            raw: Yield the message's raw "data" dicts instead of models
+        
+        Returns:
+            EventStream yielding models for typed events and dicts otherwise
+        """
+        stream = EventStream(event_type, camera_ids, maxsize, overflow, raw=raw, on_close=self._remove_stream)
+        self._streams.setdefault(event_type, []).append(stream)
+        return stream
+
+    def _remove_stream(self, stream: EventStream) -> None:
+        streams = self._streams.get(stream.event_type, [])
+        if stream in streams:
+            streams.remove(stream)
+        if not streams:
+            self._streams.pop(stream.event_type, None)
+
+    async def drain(self) -> None:
+        """Deliver pending coalesced batches and wait until every queued event has been handled."""
+        await self._coalescer.flush()
+        await self._dispatcher.drain()
+
+    def dispatch_stats(self) -> Dict[str, Dict[str, int]]:
+        """Get queue depth, busy workers and dropped/coalesced counts per event type."""
+        stats = self._dispatcher.stats()
+        if self._coalescer.event_types:
+            stats["coalescing"] = self._coalescer.stats()
+        return stats
 
     # Subscription methods
     async def subscribe_to_camera_updates(self) -> None:
@@ -280,10 +613,30 @@ class WebSocketClient:
         """
         await self._unsubscribe(f"camera_{camera_id}")
 
+    async def subscribe_to_cameras(self, camera_ids: Iterable[str]) -> None:
+        """
+        Subscribe to updates for many cameras at once.
+        
+        Topics are packed into as few frames as ``subscribe_batch_size``
+        allows and sent back to back. Cameras already subscribed are skipped.
+        
+        Args:
+            camera_ids: Camera IDs to subscribe to
+        """
+        await self._subscribe_many(f"camera_{camera_id}" for camera_id in camera_ids)
+
+    async def unsubscribe_from_cameras(self, camera_ids: Iterable[str]) -> None:
+        """
+        Unsubscribe from updates for many cameras at once.
+        
+        Args:
+            camera_ids: Camera IDs to unsubscribe from
+        """
+        await self._unsubscribe_many(f"camera_{camera_id}" for camera_id in camera_ids)
+
     async def unsubscribe_from_all(self) -> None:
         """Unsubscribe from all topics."""
-        for subscription in self._subscriptions.copy():
-            await self._unsubscribe(subscription)
+        await self._unsubscribe_many(self._subscriptions.copy())
 
     async def _subscribe(self, topic: str) -> None:
         """
@@ -323,6 +676,79 @@ class WebSocketClient:
         self._subscriptions.discard(topic)
         logger.debug(f"Unsubscribed from topic: {topic}")
 
+    async def _subscribe_many(self, topics: Iterable[str]) -> None:
+        """
+        Subscribe to several topics with batched frames.
+        
+        Args:
+            topics: Topics to subscribe to
+        """
+        if not self._is_connected:
+            raise WebSocketError("WebSocket is not connected")
+        
+        new_topics = [topic for topic in dict.fromkeys(topics) if topic not in self._subscriptions]
+        await self._send_topic_frames("subscribe", new_topics)
+        self._subscriptions.update(new_topics)
+        logger.debug(f"Subscribed to {len(new_topics)} topics")
+
+    async def _unsubscribe_many(self, topics: Iterable[str]) -> None:
+        """
+        Unsubscribe from several topics with batched frames.
+        
+        Args:
+            topics: Topics to unsubscribe from
+        """
+        if not self._is_connected:
+            raise WebSocketError("WebSocket is not connected")
+        
+        old_topics = [topic for topic in dict.fromkeys(topics) if topic in self._subscriptions]
+        await self._send_topic_frames("unsubscribe", old_topics)
+        self._subscriptions.difference_update(old_topics)
+        logger.debug(f"Unsubscribed from {len(old_topics)} topics")
+
+    async def _send_topic_frames(
+        self,
+        message_type: str,
+        topics: List[str],
+        since: Optional[str] = None,
+    ) -> None:
+        """
+        Send subscribe or unsubscribe frames for many topics.
+        
+        With a batch size of 1 each frame carries a single "topic", as in
+        :meth:`_subscribe`; otherwise up to ``subscribe_batch_size`` topics
+        go in a "topics" list. All frames are encoded up front and written
+        without waiting for replies.
+        
+        Args:
+            message_type: "subscribe" or "unsubscribe"
+            topics: Topics to send
+            since: Resume cursor (timestamp of the last message received) to
+                include so the server can replay missed events
+        """
+        if not topics:
+            return
+        if not self._is_connected or not self._websocket:
+            raise WebSocketError("WebSocket is not connected")
+        
+        size = self.subscribe_batch_size
+        dumps = self._encode
+        extra = {"since": since} if since is not None else {}
+        if size == 1:
+            frames = [dumps({"type": message_type, "data": {"topic": topic, **extra}}) for topic in topics]
+        else:
+            frames = [
+                dumps({"type": message_type, "data": {"topics": topics[start:start + size], **extra}})
+                for start in range(0, len(topics), size)
+            ]
+        
+        try:
+            for frame in frames:
+                await self._send_frame(frame)
+        except Exception as e:
+            logger.error(f"Failed to send {message_type} frames: {e}")
+            raise WebSocketError(f"Failed to {message_type}: {str(e)}")
+
     # Utility methods
     def is_connected(self) -> bool:
         """Check if the WebSocket is connected."""
@@ -332,6 +758,39 @@ class WebSocketClient:
         """Get current subscriptions."""
         return self._subscriptions.copy()
 
+    def transport_stats(self) -> Dict[str, Any]:
+        """
+        Get frame format, compression and byte counters since the client was created.
+        
+        Payload bytes are frame sizes after decompression (characters for
+        text frames); wire bytes are what was read from the socket after the
+        handshake, including frame headers, so their ratio shows the savings
+        of permessage-deflate.
+        
+        Returns:
+            Dict with format, compression, message and byte counts, and bytes per event
+        """
+        stats: Dict[str, Any] = dict(self._transport_stats)
+        received = stats["messages_received"]
+        stats["format"] = self._codec.name if self._codec is not None else "json"
+        stats["compression"] = self._negotiated_compression()
+        stats["payload_bytes_per_event"] = stats["payload_bytes_received"] / received if received else 0.0
+        stats["wire_bytes_per_event"] = stats["wire_bytes_received"] / received if received else 0.0
+        return stats
+
+    def _negotiated_compression(self) -> Optional[str]:
+        if self._websocket is None:
+            return None
+        # The extensions live on the protocol object since websockets 14
+        extensions = getattr(getattr(self._websocket, "protocol", self._websocket), "extensions", [])
+        names = [extension.name for extension in extensions]
+        return names[0] if names else None
+
+    @property
+    def resume_cursor(self) -> Optional[str]:
+        """Timestamp of the last message received, sent as ``since`` when resubscribing."""
+        return self._resume_cursor
+
     async def __aenter__(self):
         """Async context manager entry."""
         await self.connect()
@@ -0,0 +1,147 @@
+"""
+Tests for the bulk runners and their adaptive concurrency limit.
+"""
+
+import asyncio
+import threading
+from typing import Dict, List
+
+import httpx
+import pytest
+
+from camera_streaming import CameraStreamingClient
+from camera_streaming.bulk import AdaptiveConcurrencyLimiter, in_bulk_operation, run_bulk, run_bulk_sync
+from camera_streaming.exceptions import NotFoundError, RateLimitError
+from camera_streaming.retry import RetryPolicy
+from camera_streaming.sync_client import SyncCameraStreamingClient
+
+
+class RateLimitedApi:
+    """Answer 429 to the first ``limited`` requests, then succeed."""
+
+    def __init__(self, limited: int, retry_after: str = "0"):
+        self.limited = limited
+        self.retry_after = retry_after
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.requests += 1
+            limited = self.requests <= self.limited
+        if limited:
+            return httpx.Response(429, json={"message": "Too many requests"}, headers={"Retry-After": self.retry_after})
+        return httpx.Response(200, json={"success": True, "message": "ok"})
+
+
+def test_limiter_halves_on_rate_limit_and_grows_back():
+    limiter = AdaptiveConcurrencyLimiter(8, backoff=0.0)
+
+    async def run() -> List[int]:
+        limits = []
+        await limiter.acquire()
+        limiter.release(RateLimitError("slow down", retry_after=0.0))
+        limits.append(limiter.limit)
+        await limiter.acquire()
+        limiter.release(RateLimitError("slow down"))
+        limits.append(limiter.limit)
+        for _ in range(2):
+            await limiter.acquire()
+            limiter.release()
+        limits.append(limiter.limit)
+        await limiter.acquire()
+        limiter.release(NotFoundError("missing"))
+        limits.append(limiter.limit)
+        return limits
+
+    assert asyncio.run(run()) == [4, 2, 3, 3]
+
+
+def test_limiter_never_goes_below_its_minimum():
+    limiter = AdaptiveConcurrencyLimiter(4, min_concurrency=2, backoff=0.0)
+
+    async def run() -> None:
+        for _ in range(3):
+            await limiter.acquire()
+            limiter.release(RateLimitError("slow down", retry_after=0.0))
+
+    asyncio.run(run())
+    assert limiter.limit == 2
+
+
+def test_run_bulk_retries_rate_limited_ids_and_collects_errors():
+    attempts: Dict[str, int] = {}
+
+    async def operation(item_id: str) -> str:
+        attempts[item_id] = attempts.get(item_id, 0) + 1
+        if item_id == "missing":
+            raise NotFoundError("missing")
+        if item_id == "busy" or (item_id == "flaky" and attempts[item_id] == 1):
+            raise RateLimitError("slow down", retry_after=0.0)
+        return item_id.upper()
+
+    result = asyncio.run(run_bulk(["a", "flaky", "missing", "busy", "a"], operation, concurrency=2, max_rate_limit_retries=2))
+
+    assert result.results == {"a": "A", "flaky": "FLAKY"}
+    assert set(result.errors) == {"missing", "busy"}
+    assert isinstance(result.errors["busy"], RateLimitError)
+    assert attempts == {"a": 1, "flaky": 2, "missing": 1, "busy": 3}
+
+
+def test_run_bulk_sync_retries_rate_limited_ids():
+    attempts: Dict[str, int] = {}
+    lock = threading.Lock()
+
+    def operation(item_id: str) -> str:
+        with lock:
+            attempts[item_id] = attempts.get(item_id, 0) + 1
+            first = attempts[item_id] == 1
+        if item_id == "flaky" and first:
+            raise RateLimitError("slow down", retry_after=0.0)
+        return item_id
+
+    result = run_bulk_sync(["a", "b", "flaky"], operation, concurrency=3)
+    assert result.ok and set(result.succeeded) == {"a", "b", "flaky"}
+    assert attempts["flaky"] == 2
+
+
+def test_bulk_operations_are_flagged_only_inside_the_runners():
+    async def operation(item_id: str) -> bool:
+        return in_bulk_operation()
+
+    assert not in_bulk_operation()
+    assert asyncio.run(run_bulk(["a"], operation)).results == {"a": True}
+    assert run_bulk_sync(["a"], lambda item_id: in_bulk_operation()).results == {"a": True}
+    assert not in_bulk_operation()
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_client_bulk_runs_see_rate_limits_without_client_retries(concurrency):
+    api = RateLimitedApi(limited=3)
+    policy = RetryPolicy(max_retries=5, backoff_base=0.0, jitter=False)
+
+    async def run():
+        client = CameraStreamingClient("http://api.test", retry_policy=policy, transport=httpx.MockTransport(api))
+        try:
+            return await client.bulk_activate([f"cam-{i}" for i in range(6)], concurrency=concurrency)
+        finally:
+            await client.close()
+
+    result = asyncio.run(run())
+    assert result.ok and len(result) == 6
+    # Each 429 reached the runner once; none were retried by the client's policy on top
+    assert api.requests == 6 + 3
+
+
+def test_client_retries_rate_limits_outside_bulk_runs():
+    api = RateLimitedApi(limited=2)
+    policy = RetryPolicy(max_retries=5, backoff_base=0.0, jitter=False)
+    with SyncCameraStreamingClient("http://api.test", retry_policy=policy, transport=httpx.MockTransport(api)) as client:
+        client.activate_camera("cam-1")
+        assert api.requests == 3
+
+        api.requests, api.limited = 0, 2
+        result = client.bulk_activate(["cam-1", "cam-2"], concurrency=1)
+
+    assert result.ok
+    assert api.requests == 2 + 2
@@ -0,0 +1,189 @@
+"""
+Tests for the response cache and its use by the clients.
+"""
+
+import asyncio
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from camera_streaming import CameraStreamingClient
+from camera_streaming.cache import ResponseCache
+from camera_streaming.models import UpdateCameraRequest
+from camera_streaming.sync_client import SyncCameraStreamingClient
+
+
+class FakeClock:
+    """Monotonic clock the tests advance by hand."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr("camera_streaming.cache.time", clock)
+    return clock
+
+
+def camera_data(name: str = "Camera 1") -> Dict[str, Any]:
+    return {
+        "id": "cam-1",
+        "name": name,
+        "company": "Acme",
+        "model": "X100",
+        "serialNumber": "SN-1",
+        "location": "HQ",
+        "place": "Entrance",
+        "rtmpUrl": "rtmp://example.com/live/1",
+        "isActive": True,
+        "isRecording": False,
+        "streamStatus": "online",
+        "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": "2024-01-01T00:00:00Z",
+    }
+
+
+class FakeCameraApi:
+    """Serve /cameras/cam-1 with an ETag, answering 304 to a matching If-None-Match."""
+
+    def __init__(self):
+        self.etag = '"v1"'
+        self.name = "Camera 1"
+        self.requests: List[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.method == "PUT":
+            self.name = "Renamed"
+            self.etag = '"v2"'
+        elif request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304)
+        return httpx.Response(
+            200, json={"success": True, "data": {"camera": camera_data(self.name)}}, headers={"ETag": self.etag}
+        )
+
+
+def test_entries_expire_after_their_ttl(clock):
+    cache = ResponseCache()
+    key = cache.make_key("/cameras/cam-1")
+    cache.set(key, "camera", ttl=5.0, etag='"v1"')
+
+    assert cache.get(key).is_fresh()
+    clock.now += 5.0
+    entry = cache.get(key)
+    assert entry.value == "camera" and entry.etag == '"v1"'
+    assert not entry.is_fresh()
+
+    cache.touch(key, 5.0)
+    assert cache.get(key).is_fresh()
+
+
+def test_ttls_merge_over_the_defaults():
+    cache = ResponseCache(ttls={"camera": 20.0, "recording": 0.0})
+    assert cache.ttl_for("camera") == 20.0
+    assert cache.ttl_for("recording") == 0.0
+    assert cache.ttl_for("stream_url") == ResponseCache.DEFAULT_TTLS["stream_url"]
+    assert cache.ttl_for("unknown") == 0.0
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = ResponseCache(max_size=2)
+    keys = [cache.make_key(f"/cameras/cam-{i}") for i in range(3)]
+    cache.set(keys[0], 0, ttl=5.0)
+    cache.set(keys[1], 1, ttl=5.0)
+    cache.get(keys[0])
+    cache.set(keys[2], 2, ttl=5.0)
+
+    assert cache.peek(keys[1]) is None
+    assert cache.peek(keys[0]).value == 0
+    assert cache.stats()["evictions"] == 1
+
+
+def test_invalidate_drops_a_path_and_optionally_its_subpaths():
+    cache = ResponseCache()
+    listing = cache.make_key("/cameras", {"limit": 50})
+    camera = cache.make_key("/cameras/cam-1")
+    other = cache.make_key("/cameras-archive")
+    for key in (listing, camera, other):
+        cache.set(key, "value", ttl=5.0)
+
+    assert cache.invalidate("/cameras", subpaths=False) == 1
+    assert cache.peek(camera) is not None
+    assert cache.invalidate("/cameras") == 1
+    assert cache.peek(other) is not None
+
+
+def test_client_serves_fresh_entries_and_revalidates_stale_ones(clock):
+    api = FakeCameraApi()
+    cache = ResponseCache(ttls={"camera": 5.0})
+
+    async def run() -> None:
+        client = CameraStreamingClient("http://api.test", cache=cache, transport=httpx.MockTransport(api))
+        try:
+            first = await client.get_camera("cam-1")
+            assert await client.get_camera("cam-1") is first
+            assert len(api.requests) == 1
+
+            clock.now += 6.0
+            assert await client.get_camera("cam-1") is first
+            assert api.requests[-1].headers["If-None-Match"] == '"v1"'
+            assert len(api.requests) == 2
+
+            # The 304 made the entry fresh again
+            await client.get_camera("cam-1")
+            assert len(api.requests) == 2
+        finally:
+            await client.close()
+
+    asyncio.run(run())
+    assert cache.stats() == {
+        "hits": 2, "misses": 1, "revalidations": 1, "evictions": 0, "invalidations": 0, "size": 1,
+    }
+
+
+def test_client_invalidates_the_camera_on_update():
+    api = FakeCameraApi()
+    cache = ResponseCache()
+
+    async def run() -> None:
+        client = CameraStreamingClient("http://api.test", cache=cache, transport=httpx.MockTransport(api))
+        try:
+            await client.get_camera("cam-1")
+            await client.update_camera("cam-1", UpdateCameraRequest(name="Renamed"))
+            assert (await client.get_camera("cam-1")).name == "Renamed"
+        finally:
+            await client.close()
+
+    asyncio.run(run())
+    assert [request.method for request in api.requests] == ["GET", "PUT", "GET"]
+    assert "If-None-Match" not in api.requests[-1].headers
+
+
+def test_sync_client_revalidates_stale_entries(clock):
+    api = FakeCameraApi()
+    cache = ResponseCache(ttls={"camera": 5.0})
+    with SyncCameraStreamingClient("http://api.test", cache=cache, transport=httpx.MockTransport(api)) as client:
+        first = client.get_camera("cam-1")
+        assert client.get_camera("cam-1") is first
+        clock.now += 6.0
+        assert client.get_camera("cam-1") is first
+
+    assert len(api.requests) == 2
+    assert cache.stats()["revalidations"] == 1
+
+
+def test_uncached_endpoints_bypass_the_cache():
+    api = FakeCameraApi()
+    cache = ResponseCache(ttls={"camera": 0.0})
+    with SyncCameraStreamingClient("http://api.test", cache=cache, transport=httpx.MockTransport(api)) as client:
+        client.get_camera("cam-1")
+        client.get_camera("cam-1")
+
+    assert len(api.requests) == 2
+    assert len(cache) == 0
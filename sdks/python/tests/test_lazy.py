@@ -0,0 +1,80 @@
+"""
+Tests for raw and lazily validated listings.
+"""
+
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from camera_streaming.lazy import LazyModel, RawPage, listing_page_type
+from camera_streaming.models import Camera
+from camera_streaming.serialization import StdlibJSONBackend
+from camera_streaming.sync_client import SyncCameraStreamingClient
+
+
+class CountingBackend(StdlibJSONBackend):
+    """Stdlib backend that counts the documents it decodes."""
+
+    def __init__(self):
+        self.decoded = 0
+
+    def loads(self, data):
+        self.decoded += 1
+        return super().loads(data)
+
+
+def camera_data(index: int) -> Dict[str, Any]:
+    return {
+        "id": f"cam-{index}",
+        "name": f"Camera {index}",
+        "company": "Acme",
+        "model": "X100",
+        "serialNumber": f"SN-{index}",
+        "location": "HQ",
+        "place": "Entrance",
+        "rtmpUrl": f"rtmp://example.com/live/{index}",
+        "isActive": True,
+        "isRecording": False,
+        "streamStatus": "online",
+        "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": "2024-01-01T00:00:00Z",
+    }
+
+
+def listing(cameras: List[Dict[str, Any]]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={
+            "success": True,
+            "data": {"items": cameras, "total": len(cameras), "offset": 0, "limit": 50, "hasMore": False},
+        })
+
+    return handler
+
+
+def test_page_types_are_bound_to_the_json_backend():
+    backend = CountingBackend()
+    raw = listing_page_type(Camera, raw=True, json_backend=backend)
+    lazy = listing_page_type(Camera, lazy=True, json_backend=backend)
+
+    assert issubclass(raw, RawPage) and raw.json_backend is backend
+    assert issubclass(lazy, listing_page_type(Camera, lazy=True)) and lazy.json_backend is backend
+    assert listing_page_type(Camera, raw=True, json_backend=backend) is raw
+    assert listing_page_type(Camera, raw=True) is RawPage
+
+
+@pytest.mark.parametrize("mode", ["raw", "lazy"])
+def test_raw_and_lazy_listings_decode_with_the_client_backend(mode):
+    backend = CountingBackend()
+    cameras = [camera_data(i) for i in range(3)]
+    with SyncCameraStreamingClient(
+        "http://api.test", json_backend=backend, transport=httpx.MockTransport(listing(cameras))
+    ) as client:
+        items = client.get_cameras(**{mode: True})
+
+    assert backend.decoded == 1
+    if mode == "raw":
+        assert items == cameras
+    else:
+        assert all(isinstance(item, LazyModel) for item in items)
+        assert [item.serial_number for item in items] == ["SN-0", "SN-1", "SN-2"]
@@ -0,0 +1,153 @@
+"""
+Tests for the prefetching page iterators and parallel page fetches.
+"""
+
+import asyncio
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+
+from camera_streaming.models import Page
+from camera_streaming.pagination import fetch_all_pages, fetch_all_pages_sync, iterate_pages, iterate_pages_sync
+
+ROWS = 237
+
+
+class FakeListing:
+    """Serve offset pages of a list of rows, like the API's listing endpoints."""
+
+    def __init__(self, rows: int = ROWS, cap: Optional[int] = None, with_total: bool = True, with_has_more: bool = True):
+        self.rows = list(range(rows))
+        self.cap = cap
+        self.with_total = with_total
+        self.with_has_more = with_has_more
+        self.requests: List[int] = []
+        self.on_request: Optional[Callable[["FakeListing"], None]] = None
+        self._lock = threading.Lock()
+
+    def fetch(self, offset: int, limit: int) -> Page:
+        with self._lock:
+            self.requests.append(offset)
+            if self.on_request is not None:
+                self.on_request(self)
+            count = min(limit, self.cap) if self.cap is not None else limit
+            items = self.rows[offset:offset + count]
+            data: Dict[str, Any] = {"items": items, "offset": offset, "limit": limit}
+            if self.with_total:
+                data["total"] = len(self.rows)
+            if self.with_has_more:
+                data["hasMore"] = offset + len(items) < len(self.rows)
+        return Page.model_validate({"success": True, "data": data})
+
+    async def fetch_async(self, offset: int, limit: int) -> Page:
+        await asyncio.sleep(0)
+        return self.fetch(offset, limit)
+
+
+def collect(listing: FakeListing, page_size: int = 50, prefetch: int = 3) -> List[Any]:
+    async def run() -> List[Any]:
+        return [item async for page in iterate_pages(listing.fetch_async, 0, page_size, prefetch) for item in page.items]
+
+    return asyncio.run(run())
+
+
+def collect_sync(listing: FakeListing, page_size: int = 50, prefetch: int = 3) -> List[Any]:
+    return [item for page in iterate_pages_sync(listing.fetch, 0, page_size, prefetch) for item in page.items]
+
+
+def fetch_all(listing: FakeListing, page_size: int = 50, concurrency: int = 4) -> List[Any]:
+    pages = asyncio.run(fetch_all_pages(listing.fetch_async, 0, page_size, concurrency))
+    return [item for page in pages for item in page.items]
+
+
+def fetch_all_sync(listing: FakeListing, page_size: int = 50, concurrency: int = 4) -> List[Any]:
+    return [item for page in fetch_all_pages_sync(listing.fetch, 0, page_size, concurrency) for item in page.items]
+
+
+def change_after_first_request(change: Callable[[List[int]], None]) -> Callable[[FakeListing], None]:
+    def on_request(listing: FakeListing) -> None:
+        if len(listing.requests) == 2:
+            change(listing.rows)
+    return on_request
+
+
+@pytest.mark.parametrize("iterate", [collect, collect_sync])
+@pytest.mark.parametrize("cap", [None, 20, 7])
+def test_iterate_pages_returns_every_row_once(iterate, cap):
+    assert iterate(FakeListing(cap=cap)) == list(range(ROWS))
+
+
+@pytest.mark.parametrize("iterate", [collect, collect_sync])
+@pytest.mark.parametrize("with_total, with_has_more", [(True, False), (False, True)])
+def test_iterate_pages_follows_a_capped_listing_without_total_or_has_more(iterate, with_total, with_has_more):
+    listing = FakeListing(cap=30, with_total=with_total, with_has_more=with_has_more)
+    assert iterate(listing) == list(range(ROWS))
+
+
+@pytest.mark.parametrize("iterate", [collect, collect_sync])
+def test_iterate_pages_steps_by_the_capped_page_length(iterate):
+    listing = FakeListing(cap=20)
+    iterate(listing, prefetch=1)
+    assert listing.requests == list(range(0, ROWS, 20))
+
+
+@pytest.mark.parametrize("iterate", [collect, collect_sync])
+def test_iterate_pages_stops_at_a_short_page_without_total_or_has_more(iterate):
+    listing = FakeListing(with_total=False, with_has_more=False)
+    assert iterate(listing) == list(range(ROWS))
+
+
+@pytest.mark.parametrize("fetch", [fetch_all, fetch_all_sync])
+@pytest.mark.parametrize("cap", [None, 20, 7])
+def test_fetch_all_pages_returns_every_row_once(fetch, cap):
+    assert fetch(FakeListing(cap=cap)) == list(range(ROWS))
+
+
+@pytest.mark.parametrize("fetch", [fetch_all, fetch_all_sync])
+def test_fetch_all_pages_spaces_windows_by_the_first_page_length(fetch):
+    listing = FakeListing(cap=20)
+    fetch(listing)
+    assert sorted(listing.requests) == list(range(0, ROWS, 20))
+
+
+@pytest.mark.parametrize("fetch", [fetch_all, fetch_all_sync])
+@pytest.mark.parametrize("cap", [None, 30])
+def test_fetch_all_pages_without_total(fetch, cap):
+    listing = FakeListing(cap=cap, with_total=False)
+    assert fetch(listing) == list(range(ROWS))
+
+
+@pytest.mark.parametrize("fetch", [fetch_all, fetch_all_sync])
+def test_fetch_all_pages_recovers_from_rows_deleted_between_fetches(fetch):
+    listing = FakeListing()
+
+    def delete_rows(rows: List[int]) -> None:
+        del rows[60:65]
+
+    listing.on_request = change_after_first_request(delete_rows)
+    assert fetch(listing, concurrency=1) == listing.rows
+
+
+@pytest.mark.parametrize("fetch", [fetch_all, fetch_all_sync])
+def test_fetch_all_pages_picks_up_rows_added_between_fetches(fetch):
+    listing = FakeListing()
+
+    def add_rows(rows: List[int]) -> None:
+        rows.extend(range(ROWS, ROWS + 80))
+
+    listing.on_request = change_after_first_request(add_rows)
+    assert fetch(listing) == list(range(ROWS + 80))
+
+
+@pytest.mark.parametrize("fetch", [fetch_all, fetch_all_sync])
+def test_fetch_all_pages_continues_after_a_short_middle_page(fetch):
+    listing = FakeListing()
+
+    def lower_cap(listing: FakeListing) -> None:
+        if len(listing.requests) == 2:
+            listing.cap = 20
+
+    # Later windows hold 20 rows instead of the first page's 50
+    listing.on_request = lower_cap
+    assert fetch(listing) == list(range(ROWS))
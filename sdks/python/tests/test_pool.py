@@ -0,0 +1,96 @@
+"""
+Tests for the WebSocket pool's topic placement.
+"""
+
+import asyncio
+from typing import Iterable, List
+
+import pytest
+
+from camera_streaming import WebSocketPool
+from camera_streaming.exceptions import WebSocketError
+from camera_streaming.pool import HashRing
+
+
+class FakeShard:
+    """Stand-in for a pool connection's subscription methods."""
+
+    def __init__(self, connected: bool = True):
+        self.connected = connected
+        self.topics: List[str] = []
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def subscribe_many(self, topics: Iterable[str]) -> None:
+        if not self.connected:
+            raise WebSocketError("WebSocket is not connected")
+        self.topics.extend(topics)
+
+
+def make_pool(size: int = 3) -> WebSocketPool:
+    pool = WebSocketPool("ws://pool.test", "token", size=size, revive_interval=None)
+    pool.shards = [FakeShard() for _ in range(size)]
+    for client, shard in zip(pool.clients, pool.shards):
+        client.is_connected = shard.is_connected
+        client._subscribe_many = shard.subscribe_many
+    return pool
+
+
+def test_ring_moves_only_the_excluded_shards_keys():
+    ring = HashRing(4)
+    keys = [f"camera_{i}" for i in range(2000)]
+    owners = {key: ring.lookup(key) for key in keys}
+
+    for key in keys:
+        owner = ring.lookup(key, exclude=[2])
+        assert owner != 2
+        if owners[key] != 2:
+            assert owner == owners[key]
+    with pytest.raises(ValueError):
+        ring.lookup("camera_1", exclude=range(4))
+
+
+def test_topics_of_a_reconnecting_shard_wait_for_it():
+    pool = make_pool()
+    topics = [f"camera_{i}" for i in range(60)]
+    waiting = {topic for topic in topics if pool.shard_for(topic) == 1}
+    pool.shards[1].connected = False
+
+    async def run() -> None:
+        await pool.subscribe_to_cameras(str(i) for i in range(60))
+        assert pool._unassigned == waiting
+        assert pool.get_subscriptions() == set(topics)
+
+        pool.shards[1].connected = True
+        await pool._shard_reconnected_handler(1)({"reconnected": True})
+
+    asyncio.run(run())
+    assert not pool._unassigned
+    assert set(pool.shards[1].topics) == waiting
+    assert {topic for topic, shard in pool._assignments.items() if shard == 1} == waiting
+
+
+def test_queued_topics_move_when_the_shard_dies():
+    pool = make_pool()
+    pool.shards[1].connected = False
+
+    async def run() -> None:
+        await pool.subscribe_to_cameras(str(i) for i in range(60))
+        await pool._rebalance(1)
+        topics = sorted(pool._unassigned)
+        pool._unassigned.clear()
+        await pool._place(topics)
+
+    asyncio.run(run())
+    assert not pool._unassigned
+    assert len(pool._assignments) == 60
+    assert 1 not in pool._assignments.values()
+
+
+def test_lookup_raises_websocket_error_when_every_shard_is_dead():
+    pool = make_pool(size=2)
+    pool._dead.update({0, 1})
+
+    with pytest.raises(WebSocketError):
+        pool.shard_for("camera_1")
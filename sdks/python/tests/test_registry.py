@@ -0,0 +1,208 @@
+"""
+Tests for the camera registry indexes and delta syncs.
+"""
+
+import asyncio
+from typing import Any, Dict, List
+
+import httpx
+
+from camera_streaming import CameraRegistry, CameraStreamingClient, StreamStatus
+from camera_streaming.models import Camera
+
+
+def camera_data(index: int, updated_at: str = "2024-01-01T00:00:00Z", status: str = "online") -> Dict[str, Any]:
+    return {
+        "id": f"cam-{index}",
+        "name": f"Camera {index}",
+        "company": f"company-{index % 2}",
+        "model": "X100",
+        "serialNumber": f"SN-{index}",
+        "location": f"location-{index % 3}",
+        "place": "Entrance",
+        "rtmpUrl": f"rtmp://example.com/live/{index}",
+        "isActive": True,
+        "isRecording": index % 2 == 0,
+        "streamStatus": status,
+        "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": updated_at,
+    }
+
+
+def status_update(camera_id: str, status: str, timestamp: str) -> Dict[str, Any]:
+    return {"cameraId": camera_id, "status": status, "timestamp": timestamp}
+
+
+class FakeListing:
+    """Serve /cameras pages from a list that tests can change between syncs."""
+
+    def __init__(self, cameras: List[Dict[str, Any]]):
+        self.cameras = cameras
+        self.total_offset = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params.get("offset", 0))
+        limit = int(request.url.params.get("limit", 50))
+        items = self.cameras[offset:offset + limit]
+        total = len(self.cameras) + self.total_offset
+        return httpx.Response(200, json={
+            "success": True,
+            "data": {"items": items, "total": total, "offset": offset, "limit": limit, "hasMore": offset + len(items) < total},
+        })
+
+
+def make_registry(listing: FakeListing) -> CameraRegistry:
+    client = CameraStreamingClient("http://api.test")
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(listing), base_url="http://api.test")
+    return CameraRegistry(client, sync_interval=None, page_size=2)
+
+
+def index_ids(registry: CameraRegistry, field: str) -> Dict[Any, set]:
+    return {value: set(ids) for value, ids in registry._indexes[field].items()}
+
+
+def test_put_indexes_every_field():
+    registry = make_registry(FakeListing([]))
+    registry._put(Camera.model_validate(camera_data(1)), "v1")
+    registry._put(Camera.model_validate(camera_data(2)), "v1")
+
+    assert index_ids(registry, "location") == {"location-1": {"cam-1"}, "location-2": {"cam-2"}}
+    assert index_ids(registry, "company") == {"company-1": {"cam-1"}, "company-0": {"cam-2"}}
+    assert index_ids(registry, "stream_status") == {StreamStatus.ONLINE: {"cam-1", "cam-2"}}
+    assert index_ids(registry, "is_recording") == {False: {"cam-1"}, True: {"cam-2"}}
+
+
+def test_put_replacement_moves_index_entries():
+    registry = make_registry(FakeListing([]))
+    registry._put(Camera.model_validate(camera_data(1)), "v1")
+    moved = dict(camera_data(1), location="location-9", streamStatus="offline")
+    registry._put(Camera.model_validate(moved), "v2")
+
+    assert index_ids(registry, "location") == {"location-9": {"cam-1"}}
+    assert index_ids(registry, "stream_status") == {StreamStatus.OFFLINE: {"cam-1"}}
+    assert registry._versions["cam-1"] == "v2"
+    assert len(registry) == 1
+
+
+def test_unindex_drops_empty_entries():
+    registry = make_registry(FakeListing([]))
+    registry._put(Camera.model_validate(camera_data(1)), "v1")
+    registry._put(Camera.model_validate(camera_data(4)), "v1")
+    registry._remove("cam-1")
+
+    assert index_ids(registry, "location") == {"location-1": {"cam-4"}}
+    assert index_ids(registry, "company") == {"company-0": {"cam-4"}}
+    assert index_ids(registry, "is_recording") == {True: {"cam-4"}}
+    registry._remove("cam-4")
+    assert all(not index for index in registry._indexes.values())
+
+
+def test_set_stream_status_moves_only_the_status_entry():
+    registry = make_registry(FakeListing([]))
+    registry._put(Camera.model_validate(camera_data(1)), "v1")
+    registry._put(Camera.model_validate(camera_data(2)), "v1")
+    registry._set_stream_status("cam-1", StreamStatus.OFFLINE)
+
+    assert registry.get("cam-1").stream_status == StreamStatus.OFFLINE
+    assert index_ids(registry, "stream_status") == {StreamStatus.ONLINE: {"cam-2"}, StreamStatus.OFFLINE: {"cam-1"}}
+    registry._set_stream_status("cam-2", StreamStatus.OFFLINE)
+    assert index_ids(registry, "stream_status") == {StreamStatus.OFFLINE: {"cam-1", "cam-2"}}
+    registry._set_stream_status("cam-unknown", StreamStatus.ERROR)
+    assert StreamStatus.ERROR not in registry._indexes["stream_status"]
+
+
+def test_sync_reports_added_updated_and_removed():
+    listing = FakeListing([camera_data(i) for i in range(5)])
+    registry = make_registry(listing)
+
+    async def run() -> None:
+        assert await registry.load() == {"added": 5, "updated": 0, "removed": 0}
+        assert await registry.sync() == {"added": 0, "updated": 0, "removed": 0}
+
+        listing.cameras = [camera_data(i) for i in range(4)] + [camera_data(7)]
+        listing.cameras[1] = camera_data(1, updated_at="2024-02-01T00:00:00Z", status="error")
+        assert await registry.sync() == {"added": 1, "updated": 1, "removed": 1}
+
+    asyncio.run(run())
+    assert "cam-4" not in registry
+    assert registry.get("cam-1").stream_status == StreamStatus.ERROR
+    assert registry.ids_where(stream_status="error") == {"cam-1"}
+    assert registry.count(location="location-1") == 2
+
+
+def test_sync_keeps_cameras_when_the_walk_does_not_match_total():
+    listing = FakeListing([camera_data(i) for i in range(5)])
+    registry = make_registry(listing)
+
+    async def run() -> Dict[str, int]:
+        await registry.load()
+        listing.cameras = listing.cameras[:3]
+        listing.total_offset = 1
+        return await registry.sync()
+
+    assert asyncio.run(run())["removed"] == 0
+    assert len(registry) == 5
+
+
+def test_sync_keeps_cameras_when_rows_shift_during_the_walk():
+    listing = FakeListing([camera_data(i) for i in range(5)])
+    registry = make_registry(listing)
+    respond = listing.__call__
+    requests = []
+
+    def delete_after_first_page(request: httpx.Request) -> httpx.Response:
+        response = respond(request)
+        requests.append(request)
+        if len(requests) == 1:
+            del listing.cameras[0]
+        return response
+
+    async def run() -> Dict[str, int]:
+        await registry.load()
+        requests.clear()
+        registry.client._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(delete_after_first_page), base_url="http://api.test"
+        )
+        return await registry.sync()
+
+    # cam-2 shifted onto the first page after it was read, so it was never walked
+    assert asyncio.run(run())["removed"] == 0
+    assert "cam-2" in registry
+
+
+def test_sync_keeps_status_pushed_after_the_listed_update():
+    listing = FakeListing([camera_data(1), camera_data(2)])
+    registry = make_registry(listing)
+
+    async def run() -> None:
+        await registry.load()
+        await registry._on_camera_status_update([
+            status_update("cam-1", "offline", "2024-03-01T00:00:00Z"),
+            status_update("cam-2", "offline", "2024-03-01T00:00:00Z"),
+        ])
+        # cam-1 was updated before the push, cam-2 after it
+        listing.cameras = [
+            camera_data(1, updated_at="2024-02-01T00:00:00Z", status="online"),
+            camera_data(2, updated_at="2024-04-01T00:00:00Z", status="error"),
+        ]
+        await registry.sync()
+
+    asyncio.run(run())
+    assert registry.get("cam-1").stream_status == StreamStatus.OFFLINE
+    assert registry.get("cam-2").stream_status == StreamStatus.ERROR
+    assert index_ids(registry, "stream_status") == {StreamStatus.OFFLINE: {"cam-1"}, StreamStatus.ERROR: {"cam-2"}}
+
+
+def test_older_push_does_not_overwrite_newer_one():
+    registry = make_registry(FakeListing([camera_data(1)]))
+
+    async def run() -> None:
+        await registry.load()
+        await registry._on_camera_status_update(status_update("cam-1", "error", "2024-03-02T00:00:00Z"))
+        await registry._on_camera_status_update([
+            status_update("cam-1", "offline", "2024-03-01T00:00:00Z"),
+            {"cameraId": "cam-1", "status": "unknown-status"},
+        ])
+
+    asyncio.run(run())
+    assert registry.get("cam-1").stream_status == StreamStatus.ERROR
@@ -0,0 +1,141 @@
+"""
+Tests for the retry policy and the clients' retry loop.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Callable, List
+
+import httpx
+import pytest
+
+from camera_streaming import CameraStreamingClient
+from camera_streaming.exceptions import CameraStreamingError, NetworkError, RateLimitError
+from camera_streaming.retry import RetryPolicy, parse_retry_after
+from camera_streaming.sync_client import SyncCameraStreamingClient
+
+
+class RecordingPolicy(RetryPolicy):
+    """Retry policy that records its delays instead of sleeping."""
+
+    def __init__(self, **options):
+        options.setdefault("jitter", False)
+        super().__init__(**options)
+        self.delays: List[float] = []
+
+    async def sleep(self, delay: float) -> None:
+        self.delays.append(delay)
+
+
+def responses(*statuses: int, headers: dict = None) -> Callable[[httpx.Request], httpx.Response]:
+    """Answer with the given statuses in turn, then 200."""
+    remaining = list(statuses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = remaining.pop(0) if remaining else 200
+        if status >= 400:
+            return httpx.Response(status, json={"message": f"HTTP {status}"}, headers=headers or {})
+        return httpx.Response(200, json={"success": True, "message": "ok"})
+
+    return handler
+
+
+def send(handler: Callable, method: str, policy: RetryPolicy) -> httpx.Response:
+    async def run() -> httpx.Response:
+        client = CameraStreamingClient("http://api.test", retry_policy=policy, transport=httpx.MockTransport(handler))
+        try:
+            return await client._make_request(method, "/cameras/cam-1")
+        finally:
+            await client.close()
+
+    return asyncio.run(run())
+
+
+def test_server_errors_are_retried_for_idempotent_methods():
+    policy = RecordingPolicy(max_retries=3, backoff_base=0.5)
+    assert send(responses(503, 502), "GET", policy).status_code == 200
+    assert policy.delays == [0.5, 1.0]
+
+
+def test_server_errors_are_not_retried_for_post():
+    policy = RecordingPolicy(max_retries=3)
+    with pytest.raises(CameraStreamingError) as excinfo:
+        send(responses(503), "POST", policy)
+    assert excinfo.value.status_code == 503
+    assert policy.delays == []
+
+
+def test_rate_limits_are_retried_for_any_method_after_retry_after():
+    policy = RecordingPolicy(max_retries=3)
+    assert send(responses(429, 429, headers={"Retry-After": "2"}), "POST", policy).status_code == 200
+    assert policy.delays == [2.0, 2.0]
+
+
+def test_retry_after_is_ignored_when_disabled():
+    policy = RecordingPolicy(max_retries=1, backoff_base=0.25, respect_retry_after=False)
+    send(responses(429, headers={"Retry-After": "30"}), "GET", policy)
+    assert policy.delays == [0.25]
+
+
+def test_retries_stop_after_max_retries():
+    policy = RecordingPolicy(max_retries=2, backoff_base=0.1)
+    with pytest.raises(RateLimitError) as excinfo:
+        send(responses(429, 429, 429, headers={"Retry-After": "1"}), "GET", policy)
+    assert excinfo.value.retry_after == 1.0
+    assert len(policy.delays) == 2
+
+
+def test_deadline_stops_retries_that_would_overrun_it():
+    policy = RecordingPolicy(max_retries=5, deadline=3.0)
+    with pytest.raises(RateLimitError):
+        send(responses(429, headers={"Retry-After": "10"}), "GET", policy)
+    assert policy.delays == []
+
+
+def test_transport_errors_are_retried_then_raised_as_network_errors():
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        raise httpx.ConnectError("connection refused", request=request)
+
+    policy = RecordingPolicy(max_retries=2, backoff_base=0.1)
+    with pytest.raises(NetworkError):
+        send(handler, "POST", policy)
+    assert len(attempts) == 3
+
+
+def test_sync_client_retries_server_errors():
+    policy = RetryPolicy(max_retries=2, backoff_base=0.0, jitter=False)
+    with SyncCameraStreamingClient(
+        "http://api.test", retry_policy=policy, transport=httpx.MockTransport(responses(500, 503))
+    ) as client:
+        assert client._make_request("GET", "/cameras/cam-1").status_code == 200
+
+
+def test_compute_delay_is_exponential_and_capped():
+    policy = RetryPolicy(backoff_base=1.0, max_delay=5.0, jitter=False)
+    assert [policy.compute_delay(attempt) for attempt in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+    assert policy.compute_delay(0, retry_after=7.5) == 7.5
+
+    jittered = RetryPolicy(backoff_base=1.0, max_delay=5.0)
+    assert all(0.0 <= jittered.compute_delay(3) <= 5.0 for _ in range(20))
+
+
+@pytest.mark.parametrize("value, expected", [
+    (None, None),
+    ("", None),
+    ("3", 3.0),
+    (" 1.5 ", 1.5),
+    ("-4", 0.0),
+    ("soon", None),
+])
+def test_parse_retry_after_seconds(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=120)
+    assert 100 <= parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 120
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
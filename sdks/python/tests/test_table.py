@@ -0,0 +1,58 @@
+"""
+Tests for the columnar recording table's aggregations.
+"""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, List
+
+import pytest
+
+from camera_streaming.models import StorageTier
+from camera_streaming.table import RecordingTable
+
+BIG = 2 ** 53 + 1
+
+
+def recording(index: int, camera_id: str, file_size: int, tier: StorageTier) -> Any:
+    return SimpleNamespace(
+        id=f"rec-{index}",
+        camera=SimpleNamespace(id=camera_id),
+        file_size=file_size,
+        duration=60 + index,
+        start_time=datetime(2024, 1, 1, 0, index, 30, tzinfo=timezone.utc),
+        storage_tier=tier,
+    )
+
+
+def make_table() -> RecordingTable:
+    recordings: List[Any] = [
+        recording(0, "cam-1", BIG, StorageTier.HOT),
+        recording(1, "cam-1", BIG, StorageTier.HOT),
+        recording(2, "cam-2", 3, StorageTier.COLD),
+        recording(3, "cam-1", 1, StorageTier.COLD),
+    ]
+    return RecordingTable.from_recordings(recordings)
+
+
+@pytest.fixture(params=["numpy", "python"])
+def table(request, monkeypatch) -> RecordingTable:
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr("camera_streaming.table.np", None)
+    return make_table()
+
+
+def test_integer_group_sums_are_exact(table):
+    assert table.sum("file_size") == 2 * BIG + 4
+    assert table.sum("file_size", by="camera_id") == {"cam-1": 2 * BIG + 1, "cam-2": 3}
+    assert table.sum("file_size", by="storage_tier") == {StorageTier.HOT: 2 * BIG, StorageTier.COLD: 4}
+    assert all(type(total) is int for total in table.sum("duration", by="camera_id").values())
+
+
+def test_float_group_sums(table):
+    totals = table.sum("start_time", by="camera_id")
+    assert set(totals) == {"cam-1", "cam-2"}
+    assert all(type(total) is float for total in totals.values())
+    assert totals["cam-2"] == datetime(2024, 1, 1, 0, 2, 30, tzinfo=timezone.utc).timestamp()